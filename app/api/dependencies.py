@@ -1,15 +1,29 @@
-from app.infrastructure.database.db import db
+from app.config import settings
+from app.infrastructure.cache.instances import case_detail_cache, count_cache, facets_cache
+from app.infrastructure.database.db import case_write_coalescer, db
 from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
 from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
 from app.infrastructure.database.unit_of_work import PostgreSQLUnitOfWork
+from app.application.use_cases.bulk_create_cases import BulkCreateCasesUseCase
 from app.application.use_cases.create_case import CreateCaseUseCase
+from app.application.use_cases.export_cases import ExportCasesUseCase
+from app.application.use_cases.export_columnar import ExportColumnarUseCase
 from app.application.use_cases.get_case_by_id import GetCaseByIdUseCase
+from app.application.use_cases.get_case_facets import GetCaseFacetsUseCase
+from app.application.use_cases.get_case_queries import GetCaseQueriesUseCase
+from app.application.use_cases.get_case_query import GetCaseQueryUseCase
+from app.application.use_cases.get_case_query_text import GetCaseQueryTextUseCase
 from app.application.use_cases.get_cases import GetCasesUseCase
+from app.application.use_cases.get_cases_by_ids import GetCasesByIdsUseCase
+from app.application.use_cases.ingest_cases import IngestCasesUseCase
 
 
 def get_case_repository() -> CaseRepositoryImpl:
     """Dependency para obtener el repositorio de casos"""
-    return CaseRepositoryImpl(db)
+    return CaseRepositoryImpl(db, count_cache=count_cache, facets_cache=facets_cache)
 
 
 def get_query_repository() -> QueryRepositoryImpl:
@@ -17,6 +31,11 @@ def get_query_repository() -> QueryRepositoryImpl:
     return QueryRepositoryImpl(db)
 
 
+def get_data_version_repository() -> DataVersionRepositoryImpl:
+    """Dependency para obtener la marca de agua de datos"""
+    return DataVersionRepositoryImpl(db)
+
+
 def get_unit_of_work() -> PostgreSQLUnitOfWork:
     """Dependency para obtener Unit of Work"""
     return PostgreSQLUnitOfWork(db)
@@ -27,7 +46,34 @@ def get_create_case_use_case() -> CreateCaseUseCase:
     case_repo = get_case_repository()
     query_repo = get_query_repository()
     uow = get_unit_of_work()
-    return CreateCaseUseCase(case_repo, query_repo, uow)
+    return CreateCaseUseCase(
+        case_repo,
+        query_repo,
+        uow,
+        detail_cache=case_detail_cache,
+        single_statement_max_queries=settings.CREATE_CASE_SINGLE_STATEMENT_MAX_QUERIES,
+        write_coalescer=case_write_coalescer if settings.CREATE_CASE_GROUP_COMMIT else None,
+    )
+
+
+def get_bulk_create_cases_use_case() -> BulkCreateCasesUseCase:
+    """Dependency para obtener el use case de importación masiva de casos"""
+    case_repo = get_case_repository()
+    query_repo = get_query_repository()
+    uow = get_unit_of_work()
+    return BulkCreateCasesUseCase(
+        case_repo, query_repo, uow, chunk_size=settings.BULK_IMPORT_CHUNK_SIZE
+    )
+
+
+def get_ingest_cases_use_case() -> IngestCasesUseCase:
+    """Dependency para obtener el use case de ingesta NDJSON de casos"""
+    return IngestCasesUseCase(
+        get_bulk_create_cases_use_case,
+        batch_size=settings.BULK_IMPORT_CHUNK_SIZE,
+        max_in_flight=settings.INGEST_MAX_IN_FLIGHT_BATCHES,
+        max_errors=settings.INGEST_MAX_REPORTED_ERRORS,
+    )
 
 
 def get_get_cases_use_case() -> GetCasesUseCase:
@@ -37,8 +83,52 @@ def get_get_cases_use_case() -> GetCasesUseCase:
     return GetCasesUseCase(case_repo, query_repo)
 
 
+def get_get_case_facets_use_case() -> GetCaseFacetsUseCase:
+    """Dependency para obtener el use case de facetas del listado"""
+    case_repo = get_case_repository()
+    return GetCaseFacetsUseCase(case_repo)
+
+
+def get_export_cases_use_case() -> ExportCasesUseCase:
+    """Dependency para obtener el use case de exportar casos"""
+    case_repo = get_case_repository()
+    query_repo = get_query_repository()
+    return ExportCasesUseCase(case_repo, query_repo)
+
+
+def get_export_columnar_use_case() -> ExportColumnarUseCase:
+    """Dependency para obtener el use case de exportación columnar"""
+    case_repo = get_case_repository()
+    return ExportColumnarUseCase(case_repo)
+
+
 def get_get_case_by_id_use_case() -> GetCaseByIdUseCase:
     """Dependency para obtener el use case de obtener caso por ID"""
     case_repo = get_case_repository()
+    return GetCaseByIdUseCase(case_repo, detail_cache=case_detail_cache)
+
+
+def get_get_cases_by_ids_use_case() -> GetCasesByIdsUseCase:
+    """Dependency para obtener el use case de multi-get de casos"""
+    case_repo = get_case_repository()
+    query_repo = get_query_repository()
+    return GetCasesByIdsUseCase(case_repo, query_repo)
+
+
+def get_get_case_query_use_case() -> GetCaseQueryUseCase:
+    """Dependency para obtener el use case de obtener una query de un caso"""
+    query_repo = get_query_repository()
+    return GetCaseQueryUseCase(query_repo)
+
+
+def get_get_case_queries_use_case() -> GetCaseQueriesUseCase:
+    """Dependency para obtener el use case de paginar las queries de un caso"""
+    case_repo = get_case_repository()
+    query_repo = get_query_repository()
+    return GetCaseQueriesUseCase(case_repo, query_repo)
+
+
+def get_get_case_query_text_use_case() -> GetCaseQueryTextUseCase:
+    """Dependency para obtener el use case del texto completo de una query"""
     query_repo = get_query_repository()
-    return GetCaseByIdUseCase(case_repo, query_repo)
+    return GetCaseQueryTextUseCase(query_repo)
@@ -0,0 +1,106 @@
+"""Lectura de cuerpos grandes (JSON o NDJSON), opcionalmente comprimidos con gzip"""
+import json
+import zlib
+from typing import Any, AsyncIterator, Optional, Tuple
+from fastapi import HTTPException, Request, status
+
+# wbits para zlib: formato gzip (cabecera y CRC)
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# Máximo descomprimido por paso: un gzip pequeño nunca se infla de una vez
+_DECOMPRESS_CHUNK_BYTES = 64 * 1024
+
+
+async def _iter_body(request: Request) -> AsyncIterator[bytes]:
+    """
+    Cuerpo de `request` por partes a medida que llega, ya descomprimido si
+    trae Content-Encoding: gzip (415 con otras codificaciones).
+    """
+    encoding = request.headers.get("content-encoding", "identity").strip().lower()
+    if encoding not in ("identity", "gzip"):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Content-Encoding no soportado: {encoding}",
+        )
+
+    decompressor = zlib.decompressobj(_GZIP_WBITS) if encoding == "gzip" else None
+    try:
+        async for chunk in request.stream():
+            if not decompressor:
+                yield chunk
+                continue
+            while chunk:
+                data = decompressor.decompress(chunk, _DECOMPRESS_CHUNK_BYTES)
+                chunk = decompressor.unconsumed_tail
+                if data:
+                    yield data
+        if decompressor:
+            data = decompressor.flush()
+            if data:
+                yield data
+    except zlib.error as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cuerpo gzip inválido: {e}"
+        )
+
+
+async def read_json_body(request: Request, max_bytes: int) -> Any:
+    """
+    Lee y decodifica el cuerpo JSON de `request`.
+
+    Acepta Content-Encoding: gzip. `max_bytes` acota el cuerpo ya
+    descomprimido (413 si lo supera), así un gzip pequeño no puede inflarse
+    sin límite en memoria.
+    """
+    parts = []
+    size = 0
+    async for data in _iter_body(request):
+        size += len(data)
+        if size > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"El cuerpo supera el máximo de {max_bytes} bytes",
+            )
+        parts.append(data)
+
+    try:
+        return json.loads(b"".join(parts))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"JSON inválido: {e}")
+
+
+async def iter_ndjson_lines(
+    request: Request, max_line_bytes: int
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Líneas del cuerpo NDJSON de `request` a medida que llegan, numeradas desde 1.
+
+    Acepta Content-Encoding: gzip. Solo se retiene la línea en curso: una
+    línea de más de `max_line_bytes` se descarta hasta el siguiente salto y
+    se entrega como None. Las líneas vacías también se entregan.
+    """
+    buffer = bytearray()
+    line_number = 0
+    too_long = False
+
+    async for data in _iter_body(request):
+        start = 0
+        while True:
+            end = data.find(b"\n", start)
+            if not too_long:
+                buffer += data[start:] if end < 0 else data[start:end]
+                too_long = len(buffer) > max_line_bytes
+                if too_long:
+                    buffer.clear()
+            if end < 0:
+                break
+
+            line_number += 1
+            yield line_number, None if too_long else bytes(buffer)
+            buffer.clear()
+            too_long = False
+            start = end + 1
+
+    # Última línea sin salto final
+    if buffer or too_long:
+        yield line_number + 1, None if too_long else bytes(buffer)
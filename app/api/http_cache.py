@@ -0,0 +1,40 @@
+"""Helpers de caché HTTP: ETag fuertes y respuestas 304"""
+import hashlib
+from fastapi import Request, Response, status
+
+# Respuestas que pueden cambiar: el cliente guarda copia pero siempre revalida
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+# Payloads que nunca cambian (las queries de un caso son solo INSERT)
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def make_etag(*parts) -> str:
+    """ETag fuerte a partir de las partes que identifican la representación"""
+    raw = "|".join(str(part) for part in parts).encode("utf-8")
+    return f'"{hashlib.sha256(raw).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Indica si el If-None-Match del request incluye el ETag (comparación débil, RFC 9110)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in header.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """Respuesta 304 sin cuerpo con los headers de validación"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str) -> None:
+    """Agrega ETag y Cache-Control a una respuesta 200"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
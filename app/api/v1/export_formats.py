@@ -0,0 +1,99 @@
+"""Serialización por bloques de la exportación de casos (NDJSON y CSV)"""
+import csv
+import io
+from typing import AsyncIterator, List
+from app.api.v1.schemas.cases import CaseResponse, CaseSummaryResponse
+from app.domain.entities.case import SupportCase
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+CASE_CSV_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "case_type",
+    "priority",
+    "status",
+    "created_by",
+    "created_at",
+    "updated_at",
+    "queries_count",
+]
+
+QUERY_CSV_COLUMNS = [
+    "query_id",
+    "database_name",
+    "schema_name",
+    "query_text",
+    "execution_time_ms",
+    "rows_affected",
+    "executed_at",
+    "executed_by",
+]
+
+
+async def ndjson_chunks(
+    chunks: AsyncIterator[List[SupportCase]], include_queries: bool
+) -> AsyncIterator[bytes]:
+    """Un objeto JSON por línea; con queries usa la forma del detalle (CaseResponse)"""
+    model = CaseResponse if include_queries else CaseSummaryResponse
+    async for cases in chunks:
+        lines = [model.from_entity(case).model_dump_json() for case in cases]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def csv_chunks(
+    chunks: AsyncIterator[List[SupportCase]], include_queries: bool
+) -> AsyncIterator[bytes]:
+    """
+    CSV con encabezado. Con queries hay una fila por query (las columnas del
+    caso se repiten) y una fila con columnas de query vacías si el caso no tiene.
+    """
+    columns = CASE_CSV_COLUMNS + (QUERY_CSV_COLUMNS if include_queries else [])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    async for cases in chunks:
+        for case in cases:
+            case_row = [
+                case.id,
+                case.title,
+                case.description or "",
+                case.case_type.value,
+                case.priority.value,
+                case.status.value,
+                case.created_by,
+                case.created_at.isoformat(),
+                case.updated_at.isoformat(),
+                case.queries_count,
+            ]
+            if not include_queries:
+                writer.writerow(case_row)
+                continue
+            if not case.queries:
+                writer.writerow(case_row + [""] * len(QUERY_CSV_COLUMNS))
+            for query in case.queries:
+                writer.writerow(
+                    case_row
+                    + [
+                        query.id,
+                        query.database_name,
+                        query.schema_name,
+                        query.query_text,
+                        "" if query.execution_time_ms is None else query.execution_time_ms,
+                        "" if query.rows_affected is None else query.rows_affected,
+                        query.executed_at.isoformat(),
+                        query.executed_by,
+                    ]
+                )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    # Encabezado de una exportación vacía
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
@@ -1,22 +1,77 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import ValidationError
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
 from app.api.v1.schemas.cases import (
+    BatchGetCasesRequest,
+    BulkCreateCasesResponse,
+    BulkCreateItemResponse,
+    BatchGetCasesResponse,
     CreateCaseRequest,
     CaseResponse,
-    CaseSummaryResponse,
+    CaseListItemResponse,
+    CaseFacetsResponse,
+    CaseQueriesPageResponse,
+    IngestCasesResponse,
     PaginatedResponse,
 )
+from app.api.v1.schemas.queries import QueryResponse
+from app.api.v1.export_formats import EXPORT_MEDIA_TYPES, csv_chunks, ndjson_chunks
 from app.api.dependencies import (
+    get_bulk_create_cases_use_case,
     get_create_case_use_case,
+    get_export_cases_use_case,
+    get_export_columnar_use_case,
+    get_data_version_repository,
     get_get_cases_use_case,
     get_get_case_by_id_use_case,
+    get_get_case_facets_use_case,
+    get_get_case_queries_use_case,
+    get_get_case_query_use_case,
+    get_get_case_query_text_use_case,
+    get_get_cases_by_ids_use_case,
+    get_ingest_cases_use_case,
 )
+from app.api.http_body import iter_ndjson_lines, read_json_body
+from app.api.http_cache import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    etag_matches,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+)
+from app.application.use_cases.bulk_create_cases import BulkCreateCasesUseCase
 from app.application.use_cases.create_case import CreateCaseUseCase
 from app.application.use_cases.get_cases import GetCasesUseCase
 from app.application.use_cases.get_case_by_id import GetCaseByIdUseCase
+from app.application.use_cases.get_cases_by_ids import GetCasesByIdsUseCase
+from app.application.use_cases.get_case_queries import (
+    MAX_CASE_QUERIES_PAGE_SIZE,
+    GetCaseQueriesUseCase,
+    next_queries_cursor,
+)
+from app.application.use_cases.get_case_query import GetCaseQueryUseCase
+from app.application.use_cases.get_case_query_text import GetCaseQueryTextUseCase
+from app.application.use_cases.export_cases import ExportCasesUseCase
+from app.application.use_cases.export_columnar import ExportColumnarUseCase
+from app.application.use_cases.get_case_facets import GetCaseFacetsUseCase
+from app.application.use_cases.ingest_cases import IngestCasesUseCase, IngestLine
+from app.domain.repositories.data_version_repository import DataVersionRepository
+from app.domain.value_objects.case_filters import CaseFilters
 from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.query_repository import QUERY_TEXT_PREVIEW_CHARS
+from app.infrastructure.export.columnar import (
+    COLUMNAR_EXTENSIONS,
+    COLUMNAR_MEDIA_TYPES,
+    ColumnarExportUnavailable,
+    columnar_chunks,
+    table_columns,
+    validate_columnar_export,
+)
+from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,67 +79,141 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/cases", tags=["cases"])
 
 
+def get_case_filters(
+    status_filter: Optional[str] = Query(None, alias="status", description="Filtrar por estado"),
+    priority: Optional[str] = Query(None, description="Filtrar por prioridad"),
+    case_type: Optional[str] = Query(None, description="Filtrar por tipo de caso"),
+    created_by: Optional[str] = Query(None, description="Filtrar por email de usuario creador"),
+    search: Optional[str] = Query(
+        None, description="Búsqueda full-text en título y descripción (sintaxis web)"
+    ),
+    match: Optional[str] = Query(
+        None,
+        pattern="^(substring|fuzzy)$",
+        description="Coincidencia para search y created_by: fragmento o difusa (trigramas)",
+    ),
+    date_gte: Optional[datetime] = Query(None, description="Casos desde esta fecha"),
+    date_lte: Optional[datetime] = Query(None, description="Casos hasta esta fecha"),
+) -> CaseFilters:
+    """Filtros comunes del listado de casos y sus agregados"""
+    return CaseFilters(
+        status=status_filter,
+        priority=priority,
+        case_type=case_type,
+        created_by=created_by,
+        search=search,
+        match=match,
+        date_gte=date_gte,
+        date_lte=date_lte,
+    )
+
+
+def get_preview_chars(
+    query_text: str = Query(
+        "full",
+        pattern="^(full|preview)$",
+        description=(
+            "full: texto completo de cada query; preview: solo el comienzo y su tamaño "
+            "(el texto completo se pide en /queries/{query_id}/text)"
+        ),
+    ),
+) -> Optional[int]:
+    """Caracteres de vista previa de query_text (None: texto completo)"""
+    return QUERY_TEXT_PREVIEW_CHARS if query_text == "preview" else None
+
+
 @router.get(
     "/",
-    response_model=PaginatedResponse[CaseSummaryResponse],
+    response_model=PaginatedResponse[CaseListItemResponse],
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
     summary="Listar casos",
     description="Lista casos con filtros y paginación",
 )
 async def get_cases(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="Número de página"),
     page_size: int = Query(10, ge=1, le=50, description="Elementos por página"),
-    status_filter: Optional[str] = Query(None, alias="status", description="Filtrar por estado"),
-    priority: Optional[str] = Query(None, description="Filtrar por prioridad"),
-    case_type: Optional[str] = Query(None, description="Filtrar por tipo de caso"),
-    created_by: Optional[str] = Query(None, description="Filtrar por email de usuario creador"),
-    search: Optional[str] = Query(None, description="Búsqueda en título y descripción"),
-    date_gte: Optional[datetime] = Query(None, description="Casos desde esta fecha"),
-    date_lte: Optional[datetime] = Query(None, description="Casos hasta esta fecha"),
-    sort_by: str = Query("created_at", description="Campo para ordenar"),
+    filters: CaseFilters = Depends(get_case_filters),
+    sort_by: str = Query(
+        "created_at", description="Campo para ordenar (queries_count; relevance requiere search)"
+    ),
     sort_order: str = Query(
         "desc", pattern="^(asc|desc)$", description="Orden ascendente o descendente"
     ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor opaco (next_cursor) para paginación keyset; ignora page"
+    ),
+    count_mode: str = Query(
+        "exact",
+        pattern="^(exact|estimated|none)$",
+        description="Cálculo del total: exacto, estimado o sin total (solo has_more)",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a devolver separados por coma (id siempre se incluye)",
+        examples=["id,title,status,created_at"],
+    ),
+    include: Optional[str] = Query(
+        None, pattern="^queries$", description="Relaciones a incluir: queries"
+    ),
     use_case: GetCasesUseCase = Depends(get_get_cases_use_case),
+    data_versions: DataVersionRepository = Depends(get_data_version_repository),
 ):
     """Endpoint para listar casos con filtros y paginación"""
     try:
+        # La marca de agua se lee antes que los datos: si cambia en el medio,
+        # el ETag queda viejo y el próximo request trae la página de nuevo
+        data_version = await data_versions.current()
+        etag = make_etag("cases", data_version, sorted(request.query_params.multi_items()))
+        if etag_matches(request, etag):
+            return not_modified(etag, REVALIDATE_CACHE_CONTROL)
+
         logger.info(
             f"Listing cases: page={page}, page_size={page_size}",
-            extra={
-                "page": page,
-                "filters": {
-                    "status": status_filter,
-                    "priority": priority,
-                    "case_type": case_type,
-                    "created_by": created_by,
-                    "search": search,
-                },
-            },
-        )
-
-        cases_with_count, total = await use_case.execute(
-            status=status_filter,
-            priority=priority,
-            case_type=case_type,
-            created_by=created_by,
-            search=search,
-            date_gte=date_gte,
-            date_lte=date_lte,
+            extra={"page": page, "filters": filters.as_dict()},
+        )
+
+        field_names = None
+        if fields:
+            field_names = [name.strip() for name in fields.split(",") if name.strip()]
+        include_names = [include] if include else []
+
+        result = await use_case.execute(
+            **filters.as_dict(),
             sort_by=sort_by,
             sort_order=sort_order,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode,
+            fields=field_names,
+            include=include_names,
         )
 
-        # Convertir a response models
+        # Convertir a response models (solo los campos pedidos)
         items = [
-            CaseSummaryResponse.from_entity(case, queries_count)
-            for case, queries_count in cases_with_count
+            CaseListItemResponse.from_entity(
+                case, fields=field_names, include_queries="queries" in include_names
+            )
+            for case in result.items
         ]
 
-        return PaginatedResponse.create(items=items, total=total, page=page, page_size=page_size)
+        set_cache_headers(response, etag, REVALIDATE_CACHE_CONTROL)
+        return PaginatedResponse.create(
+            items=items,
+            total=result.total,
+            page=page,
+            page_size=page_size,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
+            total_estimated=result.total_estimated,
+        )
 
+    except DomainValidationError as e:
+        logger.warning(f"Invalid listing parameters: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Unexpected error listing cases: {e}", exc_info=True)
         raise HTTPException(
@@ -92,21 +221,168 @@ async def get_cases(
         )
 
 
+@router.get(
+    "/facets",
+    response_model=CaseFacetsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Facetas del listado",
+    description="Conteo de casos por estado, prioridad y tipo con los mismos filtros del listado",
+)
+async def get_case_facets(
+    filters: CaseFilters = Depends(get_case_filters),
+    use_case: GetCaseFacetsUseCase = Depends(get_get_case_facets_use_case),
+):
+    """Endpoint para obtener los conteos por faceta en una sola consulta"""
+    try:
+        logger.info("Getting case facets", extra={"filters": filters.as_dict()})
+
+        facets = await use_case.execute(filters)
+
+        return CaseFacetsResponse.from_facets(facets)
+
+    except DomainValidationError as e:
+        logger.warning(f"Invalid facets parameters: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error getting case facets: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor"
+        )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Exportar casos",
+    description=(
+        "Exporta todos los casos filtrados como NDJSON o CSV en streaming "
+        "(cursor del servidor, memoria constante)"
+    ),
+    response_class=StreamingResponse,
+)
+async def export_cases(
+    filters: CaseFilters = Depends(get_case_filters),
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="Formato de salida"
+    ),
+    include_queries: bool = Query(False, description="Incluir las queries de cada caso"),
+    use_case: ExportCasesUseCase = Depends(get_export_cases_use_case),
+):
+    """Endpoint para exportar casos en streaming"""
+    try:
+        logger.info(
+            f"Exporting cases as {export_format}",
+            extra={"filters": filters.as_dict(), "include_queries": include_queries},
+        )
+
+        chunks = use_case.execute(
+            filters, include_queries=include_queries, chunk_size=settings.EXPORT_CHUNK_SIZE
+        )
+
+    except DomainValidationError as e:
+        logger.warning(f"Invalid export parameters: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Cada bloque se lee de la DB recién cuando el anterior fue enviado al cliente
+    serialize = ndjson_chunks if export_format == "ndjson" else csv_chunks
+    return StreamingResponse(
+        serialize(chunks, include_queries),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="cases.{export_format}"'},
+    )
+
+
+@router.get(
+    "/export/columnar",
+    status_code=status.HTTP_200_OK,
+    summary="Exportar casos o queries en formato columnar",
+    description=(
+        "Exporta las filas de support_cases o case_queries de los casos filtrados "
+        "como Arrow IPC (stream) o Parquet, en record batches de tamaño acotado"
+    ),
+    response_class=StreamingResponse,
+)
+async def export_cases_columnar(
+    filters: CaseFilters = Depends(get_case_filters),
+    export_format: str = Query(
+        "parquet", alias="format", pattern="^(arrow|parquet)$", description="Formato de salida"
+    ),
+    table: str = Query(
+        "support_cases",
+        pattern="^(support_cases|case_queries)$",
+        description="Tabla a exportar (las queries se limitan a los casos filtrados)",
+    ),
+    use_case: ExportColumnarUseCase = Depends(get_export_columnar_use_case),
+):
+    """Endpoint para exportar en formato columnar (análisis con pandas/DuckDB)"""
+    try:
+        validate_columnar_export(export_format)
+        batches = use_case.execute(
+            filters, table, table_columns(table), batch_size=settings.COLUMNAR_BATCH_SIZE
+        )
+    except ColumnarExportUnavailable as e:
+        logger.warning(f"Columnar export unavailable: {e}")
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e))
+    except (ValueError, DomainValidationError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(
+        f"Exporting {table} as {export_format}",
+        extra={"filters": filters.as_dict(), "table": table},
+    )
+
+    filename = f"{table}.{COLUMNAR_EXTENSIONS[export_format]}"
+    return StreamingResponse(
+        columnar_chunks(batches, table, export_format),
+        media_type=COLUMNAR_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get(
     "/{case_id}",
     response_model=CaseResponse,
     status_code=status.HTTP_200_OK,
     summary="Obtener caso por ID",
-    description="Obtiene el detalle completo de un caso incluyendo todas sus consultas SQL",
+    description=(
+        "Obtiene el detalle completo de un caso incluyendo sus consultas SQL; con "
+        "queries_limit solo las primeras y `queries_next_cursor` para paginar el resto"
+    ),
 )
 async def get_case_by_id(
-    case_id: UUID, use_case: GetCaseByIdUseCase = Depends(get_get_case_by_id_use_case)
+    case_id: UUID,
+    request: Request,
+    response: Response,
+    queries_limit: Optional[int] = Query(
+        None,
+        ge=0,
+        le=MAX_CASE_QUERIES_PAGE_SIZE,
+        description="Máximo de consultas SQL incluidas (por defecto todas)",
+    ),
+    preview_chars: Optional[int] = Depends(get_preview_chars),
+    use_case: GetCaseByIdUseCase = Depends(get_get_case_by_id_use_case),
 ):
     """Endpoint para obtener el detalle de un caso específico"""
     try:
         logger.info(f"Getting case by ID: {case_id}")
 
-        case = await use_case.execute(case_id)
+        # Revisión liviana (PK lookup) para responder 304 sin cargar queries
+        revision = await use_case.get_revision(case_id)
+        if revision:
+            updated_at, queries_count = revision
+            etag_parts = ["case", case_id, updated_at.isoformat(), queries_count]
+            # Otra representación del mismo caso: otro ETag
+            if queries_limit is not None:
+                etag_parts.append(f"queries_limit={queries_limit}")
+            if preview_chars is not None:
+                etag_parts.append(f"preview={preview_chars}")
+            etag = make_etag(*etag_parts)
+            if etag_matches(request, etag):
+                return not_modified(etag, REVALIDATE_CACHE_CONTROL)
+
+        case = None
+        if revision:
+            case = await use_case.execute(case_id, revision, queries_limit, preview_chars)
 
         if not case:
             logger.info(f"Case not found: {case_id}")
@@ -115,7 +391,9 @@ async def get_case_by_id(
             )
 
         logger.info(f"Case retrieved successfully: {case_id}")
-        return CaseResponse.from_entity(case)
+        set_cache_headers(response, etag, REVALIDATE_CACHE_CONTROL)
+        next_cursor = next_queries_cursor(case) if queries_limit is not None else None
+        return CaseResponse.from_entity(case, queries_next_cursor=next_cursor)
 
     except HTTPException:
         raise
@@ -126,6 +404,178 @@ async def get_case_by_id(
         )
 
 
+@router.get(
+    "/{case_id}/queries",
+    response_model=CaseQueriesPageResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Listar queries de un caso",
+    description=(
+        "Pagina las consultas SQL de un caso por (executed_at, id) con cursor keyset; "
+        "filtros opcionales por base, esquema y usuario"
+    ),
+)
+async def get_case_queries(
+    case_id: UUID,
+    cursor: Optional[str] = Query(
+        None, description="next_cursor de la página anterior (mismo caso y filtros)"
+    ),
+    limit: int = Query(50, ge=1, le=MAX_CASE_QUERIES_PAGE_SIZE, description="Queries por página"),
+    database_name: Optional[str] = Query(None, description="Filtrar por base de datos"),
+    schema_name: Optional[str] = Query(None, description="Filtrar por esquema"),
+    executed_by: Optional[str] = Query(None, description="Filtrar por usuario que ejecutó"),
+    preview_chars: Optional[int] = Depends(get_preview_chars),
+    use_case: GetCaseQueriesUseCase = Depends(get_get_case_queries_use_case),
+):
+    """Endpoint para paginar las queries de un caso"""
+    try:
+        result = await use_case.execute(
+            case_id,
+            limit=limit,
+            cursor=cursor,
+            database_name=database_name,
+            schema_name=schema_name,
+            executed_by=executed_by,
+            preview_chars=preview_chars,
+        )
+    except DomainValidationError as e:
+        logger.warning(f"Invalid case queries page request: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error listing queries of case {case_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor"
+        )
+
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Caso con ID {case_id} no encontrado"
+        )
+
+    return CaseQueriesPageResponse(
+        items=[QueryResponse.from_entity(q) for q in result.items],
+        has_more=result.has_more,
+        next_cursor=result.next_cursor,
+    )
+
+
+@router.get(
+    "/{case_id}/queries/{query_id}",
+    response_model=QueryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener query de un caso",
+    description="Obtiene una consulta SQL de un caso; las consultas son inmutables y cacheables",
+)
+async def get_case_query(
+    case_id: UUID,
+    query_id: UUID,
+    request: Request,
+    response: Response,
+    use_case: GetCaseQueryUseCase = Depends(get_get_case_query_use_case),
+):
+    """Endpoint para obtener una query de un caso"""
+    try:
+        # Una query no cambia nunca: su id es suficiente como ETag y el 304 no toca la DB
+        etag = make_etag("query", case_id, query_id)
+        if etag_matches(request, etag):
+            return not_modified(etag, IMMUTABLE_CACHE_CONTROL)
+
+        query = await use_case.execute(case_id, query_id)
+
+        if not query:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Query con ID {query_id} no encontrada en el caso {case_id}",
+            )
+
+        set_cache_headers(response, etag, IMMUTABLE_CACHE_CONTROL)
+        return QueryResponse.from_entity(query)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error getting query {query_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor"
+        )
+
+
+@router.get(
+    "/{case_id}/queries/{query_id}/text",
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+    summary="Obtener el texto completo de una query",
+    description=(
+        "Devuelve el texto SQL completo de una consulta como text/plain; los textos "
+        "grandes se envían en streaming. Inmutable y cacheable"
+    ),
+)
+async def get_case_query_text(
+    case_id: UUID,
+    query_id: UUID,
+    request: Request,
+    use_case: GetCaseQueryTextUseCase = Depends(get_get_case_query_text_use_case),
+):
+    """Endpoint para obtener el texto completo de una query"""
+    etag = make_etag("query-text", case_id, query_id)
+    if etag_matches(request, etag):
+        return not_modified(etag, IMMUTABLE_CACHE_CONTROL)
+
+    try:
+        query_text = await use_case.execute(case_id, query_id)
+    except Exception as e:
+        logger.error(f"Unexpected error getting text of query {query_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor"
+        )
+
+    if query_text is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Query con ID {query_id} no encontrada en el caso {case_id}",
+        )
+
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if query_text.text is not None:
+        return PlainTextResponse(query_text.text, headers=headers)
+
+    # Texto grande: por partes, sin tenerlo completo en memoria
+    logger.info(f"Streaming text of query {query_id} ({query_text.size_bytes} bytes)")
+    chunks = (chunk.encode("utf-8") async for chunk in use_case.stream(case_id, query_id))
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8", headers=headers)
+
+
+@router.post(
+    "/batch-get",
+    response_model=BatchGetCasesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener varios casos por ID",
+    description=(
+        "Obtiene varios casos con sus consultas SQL en dos consultas a la base; "
+        "los IDs inexistentes se informan en `missing`"
+    ),
+)
+async def batch_get_cases(
+    request: BatchGetCasesRequest,
+    use_case: GetCasesByIdsUseCase = Depends(get_get_cases_by_ids_use_case),
+):
+    """Endpoint de multi-get de casos"""
+    try:
+        result = await use_case.execute(request.ids)
+    except DomainValidationError as e:
+        logger.warning(f"Invalid batch get: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error in batch get: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor"
+        )
+
+    return BatchGetCasesResponse(
+        items=[CaseResponse.from_entity(case) for case in result.items],
+        missing=result.missing,
+    )
+
+
 @router.post(
     "/",
     response_model=CaseResponse,
@@ -163,3 +613,125 @@ async def create_case(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor"
         )
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateCasesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Importar casos en bloque",
+    description=(
+        "Crea hasta BULK_IMPORT_MAX_ITEMS casos con sus consultas SQL a partir de "
+        '`{"items": [...]}` (cada elemento con la forma de POST /cases; admite '
+        "Content-Encoding: gzip). Devuelve el resultado de cada elemento: los "
+        "inválidos no impiden crear el resto"
+    ),
+)
+async def bulk_create_cases(
+    request: Request,
+    use_case: BulkCreateCasesUseCase = Depends(get_bulk_create_cases_use_case),
+):
+    """Endpoint de importación masiva de casos"""
+    payload = await read_json_body(request, settings.BULK_IMPORT_MAX_BYTES)
+    raw_items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(raw_items, list) or not raw_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='El cuerpo debe ser {"items": [...]} con al menos un caso',
+        )
+    if len(raw_items) > settings.BULK_IMPORT_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=(
+                f"No se pueden importar más de {settings.BULK_IMPORT_MAX_ITEMS} "
+                "casos por solicitud"
+            ),
+        )
+
+    # Mismo esquema que POST /cases, elemento por elemento
+    results = [
+        BulkCreateItemResponse(index=index, status="error") for index in range(len(raw_items))
+    ]
+    valid_indexes = []
+    valid_items = []
+    for index, raw in enumerate(raw_items):
+        try:
+            item = CreateCaseRequest.model_validate(raw)
+        except ValidationError as e:
+            results[index].error = _validation_error_message(e)
+            continue
+        valid_indexes.append(index)
+        valid_items.append(item.model_dump())
+
+    try:
+        result = await use_case.execute(valid_items)
+    except Exception as e:
+        logger.error(f"Unexpected error in bulk import: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor"
+        )
+
+    for item_result in result.items:
+        response_item = results[valid_indexes[item_result.index]]
+        response_item.id = item_result.id
+        response_item.error = item_result.error
+        response_item.status = "created" if item_result.created else "error"
+
+    created = sum(1 for item in results if item.status == "created")
+    logger.info(f"Bulk import: {created} of {len(raw_items)} cases created")
+    return BulkCreateCasesResponse(created=created, failed=len(results) - created, items=results)
+
+
+@router.post(
+    "/ingest",
+    response_model=IngestCasesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Ingerir casos desde NDJSON",
+    description=(
+        "Crea casos desde un cuerpo NDJSON (un caso por línea con la forma de "
+        "POST /cases; admite Content-Encoding: gzip) leído a medida que llega y "
+        "guardado por lotes de BULK_IMPORT_CHUNK_SIZE, sin límite de tamaño total. "
+        "Devuelve los totales y los primeros errores por número de línea"
+    ),
+)
+async def ingest_cases(
+    request: Request,
+    use_case: IngestCasesUseCase = Depends(get_ingest_cases_use_case),
+):
+    """Endpoint de ingesta NDJSON de casos"""
+    max_line_bytes = settings.INGEST_MAX_LINE_BYTES
+
+    async def lines():
+        async for line_number, raw in iter_ndjson_lines(request, max_line_bytes):
+            if raw is None:
+                yield IngestLine(
+                    line=line_number, error=f"La línea supera el máximo de {max_line_bytes} bytes"
+                )
+                continue
+            if not raw.strip():
+                continue
+            try:
+                item = CreateCaseRequest.model_validate_json(raw)
+            except ValidationError as e:
+                yield IngestLine(line=line_number, error=_validation_error_message(e))
+                continue
+            yield IngestLine(line=line_number, item=item.model_dump())
+
+    try:
+        result = await use_case.execute(lines())
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in NDJSON ingest: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor"
+        )
+    return IngestCasesResponse.from_result(result)
+
+
+def _validation_error_message(error: ValidationError) -> str:
+    """Errores de validación de un elemento en una línea: "campo: mensaje; ..." """
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}"
+        for detail in error.errors()
+    )
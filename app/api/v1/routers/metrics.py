@@ -0,0 +1,73 @@
+from fastapi import APIRouter, status
+from app.config import settings
+from app.api.v1.schemas.metrics import (
+    CacheMetricsResponse,
+    CacheStatsResponse,
+    GroupCommitMetricsResponse,
+    StatementMetricsResponse,
+    StatementStatsResponse,
+)
+from app.infrastructure.cache.instances import case_detail_cache, count_cache, facets_cache
+from app.infrastructure.database.db import case_write_coalescer
+from app.infrastructure.database.statement_stats import statement_stats
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    "/cache",
+    response_model=CacheMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Métricas de caches",
+    description=(
+        "Aciertos, fallos, desalojos y tamaño (entradas y bytes estimados) de los "
+        "caches en memoria de este proceso"
+    ),
+)
+async def get_cache_metrics():
+    """Endpoint para consultar los contadores de los caches"""
+    return CacheMetricsResponse(
+        count_cache=CacheStatsResponse.from_stats(count_cache.stats()),
+        facets_cache=CacheStatsResponse.from_stats(facets_cache.stats()),
+        case_detail_cache=CacheStatsResponse.from_stats(case_detail_cache.stats()),
+    )
+
+
+@router.get(
+    "/statements",
+    response_model=StatementMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Métricas de sentencias preparadas",
+    description=(
+        "Preparaciones y ejecuciones por forma canónica de consulta del listado "
+        "en este proceso, con sus tiempos acumulados"
+    ),
+)
+async def get_statement_metrics():
+    """Endpoint para consultar el costo de parse/plan y ejecución por forma"""
+    snapshot = statement_stats.snapshot()
+    ordered = sorted(
+        snapshot.items(),
+        key=lambda item: item[1].prepare_seconds + item[1].execute_seconds,
+        reverse=True,
+    )
+    return StatementMetricsResponse(
+        statements=[StatementStatsResponse.from_stats(shape, stats) for shape, stats in ordered]
+    )
+
+
+@router.get(
+    "/group-commit",
+    response_model=GroupCommitMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Métricas del group commit de altas",
+    description=(
+        "Lotes y casos escritos juntos por el group commit de POST /cases en este "
+        "proceso (CREATE_CASE_GROUP_COMMIT)"
+    ),
+)
+async def get_group_commit_metrics():
+    """Endpoint para ver cuánto se agrupan las altas concurrentes"""
+    return GroupCommitMetricsResponse.from_stats(
+        settings.CREATE_CASE_GROUP_COMMIT, case_write_coalescer.stats()
+    )
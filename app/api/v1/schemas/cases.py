@@ -1,8 +1,12 @@
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Generic, TypeVar
+from typing import Dict, List, Generic, Optional, Sequence, TypeVar
+from app.application.use_cases.get_cases_by_ids import MAX_BATCH_GET_IDS
+from app.application.use_cases.ingest_cases import IngestCasesResult
 from app.domain.entities.case import SupportCase
+from app.domain.repositories.case_repository import CASE_LIST_FIELDS, CaseFacets
 from app.api.v1.schemas.queries import QueryResponse, QueryRequest
 
 
@@ -15,6 +19,51 @@ class CreateCaseRequest(BaseModel):
     created_by: str = Field(..., pattern=r"^[^@]+@[^@]+\.[^@]+$")  # Email validation
 
 
+class BulkCreateItemResponse(BaseModel):
+    """Resultado de un elemento de la importación masiva (por posición en `items`)"""
+
+    index: int
+    status: str  # "created" o "error"
+    id: UUID | None = None
+    error: str | None = None
+
+
+class BulkCreateCasesResponse(BaseModel):
+    created: int
+    failed: int
+    items: List[BulkCreateItemResponse]
+
+
+class IngestErrorResponse(BaseModel):
+    """Línea rechazada de la ingesta NDJSON (numeradas desde 1)"""
+
+    line: int
+    error: str
+
+
+class IngestCasesResponse(BaseModel):
+    received: int
+    created: int
+    failed: int
+    batches: int
+    # Solo los primeros INGEST_MAX_REPORTED_ERRORS; errors_truncated indica si hubo más
+    errors: List[IngestErrorResponse]
+    errors_truncated: bool
+
+    @classmethod
+    def from_result(cls, result: IngestCasesResult) -> "IngestCasesResponse":
+        return cls(
+            received=result.received,
+            created=result.created,
+            failed=result.failed,
+            batches=result.batches,
+            errors=[
+                IngestErrorResponse(line=error.line, error=error.error) for error in result.errors
+            ],
+            errors_truncated=result.errors_truncated,
+        )
+
+
 class CaseResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -28,9 +77,14 @@ class CaseResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     queries: List[QueryResponse] = Field(default_factory=list)
+    queries_count: int = 0
+    # Con queries_limit: cursor de GET /cases/{id}/queries para el resto de las queries
+    queries_next_cursor: str | None = None
 
     @classmethod
-    def from_entity(cls, case: SupportCase) -> "CaseResponse":
+    def from_entity(
+        cls, case: SupportCase, queries_next_cursor: str | None = None
+    ) -> "CaseResponse":
         return cls(
             id=case.id,
             title=case.title,
@@ -42,9 +96,30 @@ class CaseResponse(BaseModel):
             created_at=case.created_at,
             updated_at=case.updated_at,
             queries=[QueryResponse.from_entity(q) for q in case.queries],
+            queries_count=case.queries_count,
+            queries_next_cursor=queries_next_cursor,
         )
 
 
+class CaseQueriesPageResponse(BaseModel):
+    """Página de queries de un caso (paginación keyset por executed_at, id)"""
+
+    items: List[QueryResponse]
+    has_more: bool = False
+    next_cursor: str | None = None
+
+
+class BatchGetCasesRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
+class BatchGetCasesResponse(BaseModel):
+    """Casos encontrados (en el orden pedido) e IDs que no existen"""
+
+    items: List[CaseResponse]
+    missing: List[UUID]
+
+
 class CaseSummaryResponse(BaseModel):
     """Respuesta resumida para el listado de casos (sin queries completas)"""
 
@@ -62,7 +137,7 @@ class CaseSummaryResponse(BaseModel):
     queries_count: int = 0
 
     @classmethod
-    def from_entity(cls, case: SupportCase, queries_count: int = 0) -> "CaseSummaryResponse":
+    def from_entity(cls, case: SupportCase) -> "CaseSummaryResponse":
         return cls(
             id=case.id,
             title=case.title,
@@ -73,7 +148,67 @@ class CaseSummaryResponse(BaseModel):
             created_by=case.created_by,
             created_at=case.created_at,
             updated_at=case.updated_at,
-            queries_count=queries_count,
+            queries_count=case.queries_count,
+        )
+
+
+class CaseListItemResponse(BaseModel):
+    """
+    Elemento del listado de casos.
+
+    Con proyección (`fields`) solo se asignan los campos pedidos; la ruta usa
+    response_model_exclude_unset para no serializar el resto. `queries` solo
+    aparece con include=queries.
+    """
+
+    id: UUID
+    title: str | None = None
+    description: str | None = None
+    case_type: str | None = None
+    priority: str | None = None
+    status: str | None = None
+    created_by: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    queries_count: int | None = None
+    queries: List[QueryResponse] | None = None
+
+    @classmethod
+    def from_entity(
+        cls,
+        case: SupportCase,
+        fields: Optional[Sequence[str]] = None,
+        include_queries: bool = False,
+    ) -> "CaseListItemResponse":
+        columns = CASE_LIST_FIELDS
+        if fields is not None:
+            columns = [name for name in CASE_LIST_FIELDS if name == "id" or name in fields]
+
+        # Directo desde la entidad: una sola validación por elemento
+        data = {}
+        for name in columns:
+            value = getattr(case, name)
+            data[name] = value.value if isinstance(value, Enum) else value
+        if include_queries:
+            data["queries"] = [QueryResponse.from_entity(q) for q in case.queries]
+        return cls(**data)
+
+
+class CaseFacetsResponse(BaseModel):
+    """Conteo de casos por valor de cada faceta"""
+
+    total: int
+    status: Dict[str, int]
+    priority: Dict[str, int]
+    case_type: Dict[str, int]
+
+    @classmethod
+    def from_facets(cls, facets: CaseFacets) -> "CaseFacetsResponse":
+        return cls(
+            total=facets.total,
+            status=facets.status,
+            priority=facets.priority,
+            case_type=facets.case_type,
         )
 
 
@@ -84,14 +219,35 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Respuesta paginada genérica"""
 
     items: List[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    pages: int
+    pages: int | None
+    has_more: bool = False
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
     @classmethod
     def create(
-        cls, items: List[T], total: int, page: int, page_size: int
+        cls,
+        items: List[T],
+        total: int | None,
+        page: int,
+        page_size: int,
+        has_more: bool = False,
+        next_cursor: str | None = None,
+        total_estimated: bool = False,
     ) -> "PaginatedResponse[T]":
-        pages = (total + page_size - 1) // page_size if page_size > 0 else 0
-        return cls(items=items, total=total, page=page, page_size=page_size, pages=pages)
+        pages = None
+        if total is not None:
+            pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+        return cls(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=pages,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            total_estimated=total_estimated,
+        )
@@ -0,0 +1,86 @@
+from typing import List
+from pydantic import BaseModel
+from app.infrastructure.cache.lru_cache import CacheStats
+from app.infrastructure.database.statement_stats import ShapeStats
+from app.infrastructure.database.write_coalescer import GroupCommitStats
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    bytes: int
+    hit_ratio: float
+
+    @classmethod
+    def from_stats(cls, stats: CacheStats) -> "CacheStatsResponse":
+        return cls(
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            invalidations=stats.invalidations,
+            size=stats.size,
+            bytes=stats.bytes,
+            hit_ratio=round(stats.hit_ratio, 4),
+        )
+
+
+class CacheMetricsResponse(BaseModel):
+    """Contadores de los caches en memoria del proceso"""
+
+    count_cache: CacheStatsResponse
+    facets_cache: CacheStatsResponse
+    case_detail_cache: CacheStatsResponse
+
+
+class StatementStatsResponse(BaseModel):
+    """Preparaciones (parse/plan) y ejecuciones de una forma de consulta"""
+
+    shape: str
+    prepares: int
+    prepare_ms: float
+    executions: int
+    execute_ms: float
+    avg_execute_ms: float
+
+    @classmethod
+    def from_stats(cls, shape: str, stats: ShapeStats) -> "StatementStatsResponse":
+        avg = stats.execute_seconds / stats.executions if stats.executions else 0.0
+        return cls(
+            shape=shape,
+            prepares=stats.prepares,
+            prepare_ms=round(stats.prepare_seconds * 1000, 3),
+            executions=stats.executions,
+            execute_ms=round(stats.execute_seconds * 1000, 3),
+            avg_execute_ms=round(avg * 1000, 3),
+        )
+
+
+class StatementMetricsResponse(BaseModel):
+    """Contadores por forma canónica de consulta, de mayor a menor tiempo total"""
+
+    statements: List[StatementStatsResponse]
+
+
+class GroupCommitMetricsResponse(BaseModel):
+    """Lotes de altas de casos escritos juntos (group commit) en este proceso"""
+
+    enabled: bool
+    batches: int
+    cases: int
+    failed_batches: int
+    largest_batch: int
+    avg_batch_size: float
+
+    @classmethod
+    def from_stats(cls, enabled: bool, stats: GroupCommitStats) -> "GroupCommitMetricsResponse":
+        return cls(
+            enabled=enabled,
+            batches=stats.batches,
+            cases=stats.cases,
+            failed_batches=stats.failed_batches,
+            largest_batch=stats.largest_batch,
+            avg_batch_size=round(stats.avg_batch_size, 2),
+        )
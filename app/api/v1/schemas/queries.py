@@ -16,6 +16,9 @@ class QueryResponse(BaseModel):
     rows_affected: int | None
     executed_at: datetime
     executed_by: str
+    # Vista previa (query_text=preview): tamaño del texto completo y si query_text está cortado
+    query_text_bytes: int | None = None
+    query_text_truncated: bool = False
 
     @classmethod
     def from_entity(cls, query: CaseQuery) -> "QueryResponse":
@@ -29,6 +32,8 @@ class QueryResponse(BaseModel):
             rows_affected=query.rows_affected,
             executed_at=query.executed_at,
             executed_by=query.executed_by,
+            query_text_bytes=query.query_text_bytes,
+            query_text_truncated=query.query_text_truncated,
         )
 
 
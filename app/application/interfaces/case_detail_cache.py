@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+from app.domain.entities.case import SupportCase
+
+
+class CaseDetailCache(ABC):
+    """Interface del cache de detalle de casos (caso con sus queries)"""
+
+    @abstractmethod
+    def get(self, case_id: UUID) -> Optional[SupportCase]:
+        """Retorna el caso cacheado o None"""
+        pass
+
+    @abstractmethod
+    def generation(self) -> int:
+        """Generación de invalidaciones; leerla antes de consultar la DB"""
+        pass
+
+    @abstractmethod
+    def set(self, case: SupportCase, generation: int) -> None:
+        """Guarda el caso si no hubo invalidaciones desde `generation`"""
+        pass
+
+    @abstractmethod
+    def invalidate(self, case_id: UUID) -> None:
+        """Descarta el caso tras una escritura que lo modificó"""
+        pass
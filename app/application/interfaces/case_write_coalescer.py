@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from app.domain.entities.case import SupportCase
+
+
+class CaseWriteCoalescer(ABC):
+    """Interface del agrupador de altas de casos concurrentes (group commit)"""
+
+    @abstractmethod
+    async def submit(self, case: SupportCase) -> None:
+        """
+        Guarda el caso nuevo (con sus queries) junto con los de otras
+        solicitudes concurrentes. Retorna cuando está confirmado y solo
+        propaga el error de este caso.
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Escribe lo pendiente y espera las escrituras en curso"""
+        pass
@@ -0,0 +1,153 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from uuid import UUID
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import CaseRepository
+from app.domain.repositories.query_repository import QueryRepository
+from app.domain.value_objects.case_priority import CasePriority
+from app.domain.value_objects.case_type import CaseType
+from app.application.interfaces.unit_of_work import UnitOfWork
+from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Mensaje de un caso válido que la DB rechazó (el detalle queda en el log)
+SAVE_ERROR_MESSAGE = "No se pudo guardar el caso"
+
+
+@dataclass
+class BulkCreateItemResult:
+    """Resultado de un elemento de la importación: el ID creado o el error"""
+
+    index: int
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+    @property
+    def created(self) -> bool:
+        return self.id is not None
+
+
+@dataclass
+class BulkCreateCasesResult:
+    """Resultados en el orden de los elementos recibidos"""
+
+    items: List[BulkCreateItemResult] = field(default_factory=list)
+
+    @property
+    def created(self) -> int:
+        return sum(1 for item in self.items if item.created)
+
+    @property
+    def failed(self) -> int:
+        return len(self.items) - self.created
+
+
+class BulkCreateCasesUseCase:
+    def __init__(
+        self,
+        case_repository: CaseRepository,
+        query_repository: QueryRepository,
+        uow: UnitOfWork,
+        chunk_size: int = 1000,
+    ):
+        self._case_repository = case_repository
+        self._query_repository = query_repository
+        self._uow = uow
+        self._chunk_size = chunk_size
+
+    async def execute(self, items: List[dict]) -> BulkCreateCasesResult:
+        """
+        Crea muchos casos con sus queries.
+
+        Cada elemento tiene la forma de CreateCaseUseCase.execute y se valida
+        con las factories de las entidades; los inválidos no frenan al resto.
+        Los válidos se guardan por bloques de `chunk_size` casos, cada bloque
+        en una transacción con dos escrituras por conjunto (casos y queries).
+        Si un bloque falla se reintenta caso por caso, para que solo los casos
+        con problemas queden sin crear.
+        """
+        result = BulkCreateCasesResult(
+            items=[BulkCreateItemResult(index=index) for index in range(len(items))]
+        )
+
+        valid: List[tuple] = []
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, self._build_case(item)))
+            except (DomainValidationError, ValueError, KeyError) as e:
+                result.items[index].error = _error_message(e)
+
+        for start in range(0, len(valid), self._chunk_size):
+            chunk = valid[start : start + self._chunk_size]
+            try:
+                await self._save([case for _, case in chunk])
+            except Exception as e:
+                logger.warning(f"Bulk chunk of {len(chunk)} cases failed, retrying one by one: {e}")
+                await self._save_one_by_one(chunk, result)
+                continue
+            for index, case in chunk:
+                result.items[index].id = case.id
+
+        logger.info(
+            f"Bulk import: {result.created} cases created, {result.failed} failed",
+            extra={
+                "received": len(items),
+                "cases_created": result.created,
+                "cases_failed": result.failed,
+            },
+        )
+        return result
+
+    def _build_case(self, item: dict) -> SupportCase:
+        """Crea la entidad del caso y sus queries con las factories del dominio"""
+        case = SupportCase.create(
+            title=item["title"],
+            description=item.get("description"),
+            case_type=CaseType(item["case_type"]),
+            priority=CasePriority(item["priority"]),
+            created_by=item["created_by"],
+        )
+        for query_data in item.get("queries", []):
+            case.add_query(
+                CaseQuery.create(
+                    case_id=case.id,
+                    database_name=query_data["database_name"],
+                    schema_name=query_data["schema_name"],
+                    query_text=query_data["query_text"],
+                    executed_by=item["created_by"],
+                )
+            )
+        return case
+
+    async def _save(self, cases: List[SupportCase]) -> None:
+        """Guarda un bloque de casos y sus queries en una transacción"""
+        async with self._uow:
+            connection = self._uow.get_connection()
+            case_repo = CaseRepositoryImpl(self._case_repository._db, connection)
+            query_repo = QueryRepositoryImpl(self._query_repository._db, connection)
+
+            # Los casos ya llevan su queries_count: las queries no lo actualizan
+            await case_repo.save_many(cases)
+            queries = [query for case in cases for query in case.queries]
+            if queries:
+                await query_repo.save_many(queries, update_counts=False)
+
+    async def _save_one_by_one(self, chunk: List[tuple], result: BulkCreateCasesResult) -> None:
+        for index, case in chunk:
+            try:
+                await self._save([case])
+            except Exception as e:
+                logger.warning(f"Bulk import item {index} failed: {e}")
+                result.items[index].error = SAVE_ERROR_MESSAGE
+                continue
+            result.items[index].id = case.id
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, KeyError):
+        return f"Falta el campo {error.args[0]}"
+    return str(error)
@@ -1,9 +1,11 @@
-from typing import List
+from typing import List, Optional
 from app.domain.entities.case import SupportCase, CaseQuery
 from app.domain.repositories.case_repository import CaseRepository
 from app.domain.repositories.query_repository import QueryRepository
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
+from app.application.interfaces.case_detail_cache import CaseDetailCache
+from app.application.interfaces.case_write_coalescer import CaseWriteCoalescer
 from app.application.interfaces.unit_of_work import UnitOfWork
 from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
 from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
@@ -14,11 +16,22 @@ logger = logging.getLogger(__name__)
 
 class CreateCaseUseCase:
     def __init__(
-        self, case_repository: CaseRepository, query_repository: QueryRepository, uow: UnitOfWork
+        self,
+        case_repository: CaseRepository,
+        query_repository: QueryRepository,
+        uow: UnitOfWork,
+        detail_cache: Optional[CaseDetailCache] = None,
+        single_statement_max_queries: int = 0,
+        write_coalescer: Optional[CaseWriteCoalescer] = None,
     ):
         self._case_repository = case_repository
         self._query_repository = query_repository
         self._uow = uow
+        self._detail_cache = detail_cache
+        # Casos con hasta esta cantidad de queries se crean en una sola sentencia (0: nunca)
+        self._single_statement_max_queries = single_statement_max_queries
+        # Group commit de esas altas con las de otras solicitudes concurrentes
+        self._write_coalescer = write_coalescer
 
     async def execute(
         self,
@@ -29,7 +42,51 @@ class CreateCaseUseCase:
         queries: List[dict],
         created_by: str,
     ) -> SupportCase:
-        """Crea un nuevo caso con sus queries asociadas"""
+        """
+        Crea un nuevo caso con sus queries asociadas.
+
+        Hasta `single_statement_max_queries` queries el caso y sus queries se
+        escriben en una sola sentencia (un round-trip, atómica por sí misma);
+        con más, en la transacción del Unit of Work, donde save_many puede
+        usar COPY. Con `write_coalescer`, las altas de una sola sentencia se
+        escriben junto con las de otras solicitudes concurrentes.
+        """
+        # Crear entidades de dominio (validan antes de tocar la DB)
+        case = SupportCase.create(
+            title=title,
+            description=description,
+            case_type=CaseType(case_type),
+            priority=CasePriority(priority),
+            created_by=created_by,
+        )
+        for query_data in queries:
+            case.add_query(
+                CaseQuery.create(
+                    case_id=case.id,
+                    database_name=query_data["database_name"],
+                    schema_name=query_data["schema_name"],
+                    query_text=query_data["query_text"],
+                    executed_by=created_by,
+                )
+            )
+
+        max_queries = self._single_statement_max_queries
+        if not max_queries or len(case.queries) > max_queries:
+            await self._create_in_unit_of_work(case)
+        elif self._write_coalescer:
+            await self._write_coalescer.submit(case)
+            logger.info(f"Case created in a group commit: {case.id} ({len(case.queries)} queries)")
+        else:
+            await self._case_repository.create_with_queries(case)
+            logger.info(f"Case created in one statement: {case.id} ({len(case.queries)} queries)")
+
+        # Confirmado: descartar cualquier detalle cacheado del caso
+        if self._detail_cache:
+            self._detail_cache.invalidate(case.id)
+        return case
+
+    async def _create_in_unit_of_work(self, case: SupportCase) -> None:
+        """Guarda el caso y luego sus queries en batch, en una transacción"""
         async with self._uow:
             # Obtener conexión de la transacción
             connection = self._uow.get_connection()
@@ -38,35 +95,12 @@ class CreateCaseUseCase:
             case_repo = CaseRepositoryImpl(self._case_repository._db, connection)
             query_repo = QueryRepositoryImpl(self._query_repository._db, connection)
 
-            # Crear entidad de dominio
-            case = SupportCase.create(
-                title=title,
-                description=description,
-                case_type=CaseType(case_type),
-                priority=CasePriority(priority),
-                created_by=created_by,
-            )
-
-            # Persistir caso
+            # Persistir caso (queries_count lo actualiza save_many)
+            case_queries = case.queries
             await case_repo.save(case)
             logger.info(f"Case created: {case.id}")
 
-            # Crear todas las queries primero
-            case_queries = []
-            for query_data in queries:
-                query = CaseQuery.create(
-                    case_id=case.id,
-                    database_name=query_data["database_name"],
-                    schema_name=query_data["schema_name"],
-                    query_text=query_data["query_text"],
-                    executed_by=created_by,
-                )
-                case_queries.append(query)
-                case.add_query(query)
-
             # Guardar todas las queries en batch (bulk create)
             if case_queries:
                 await query_repo.save_many(case_queries)
                 logger.debug(f"Saved {len(case_queries)} queries in batch for case {case.id}")
-
-            return case
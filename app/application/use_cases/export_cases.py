@@ -0,0 +1,56 @@
+from typing import AsyncIterator, Dict, List
+from uuid import UUID
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import CASE_MATCH_MODES, CaseRepository
+from app.domain.repositories.query_repository import QueryRepository
+from app.domain.value_objects.case_filters import CaseFilters
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ExportCasesUseCase:
+    def __init__(self, case_repository: CaseRepository, query_repository: QueryRepository):
+        self._case_repository = case_repository
+        self._query_repository = query_repository
+
+    def execute(
+        self, filters: CaseFilters, include_queries: bool = False, chunk_size: int = 1000
+    ) -> AsyncIterator[List[SupportCase]]:
+        """
+        Recorre todos los casos filtrados en bloques para exportarlos.
+
+        Valida los parámetros antes de devolver el iterador, para que los
+        errores se reporten antes de empezar a transmitir la respuesta. Con
+        `include_queries` cada bloque trae las queries de sus casos (una
+        consulta por bloque).
+        """
+        if filters.match is not None and filters.match not in CASE_MATCH_MODES:
+            raise DomainValidationError(f"Modo de coincidencia no soportado: {filters.match}")
+
+        if chunk_size < 1:
+            raise DomainValidationError("El tamaño de bloque debe ser mayor a cero")
+
+        return self._iter_chunks(filters, include_queries, chunk_size)
+
+    async def _iter_chunks(
+        self, filters: CaseFilters, include_queries: bool, chunk_size: int
+    ) -> AsyncIterator[List[SupportCase]]:
+        exported = 0
+        async for cases in self._case_repository.iter_all(filters, chunk_size=chunk_size):
+            if include_queries:
+                queries = await self._query_repository.get_by_case_ids([c.id for c in cases])
+                by_case: Dict[UUID, List[CaseQuery]] = {}
+                for query in queries:
+                    by_case.setdefault(query.case_id, []).append(query)
+                for case in cases:
+                    case.queries = by_case.get(case.id, [])
+
+            exported += len(cases)
+            yield cases
+
+        logger.info(
+            f"Exported {exported} cases",
+            extra={"exported": exported, "include_queries": include_queries},
+        )
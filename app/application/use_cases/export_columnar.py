@@ -0,0 +1,52 @@
+from typing import Any, AsyncIterator, List, Mapping
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import (
+    CASE_EXPORT_TABLES,
+    CASE_MATCH_MODES,
+    CaseRepository,
+)
+from app.domain.value_objects.case_filters import CaseFilters
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ExportColumnarUseCase:
+    def __init__(self, case_repository: CaseRepository):
+        self._case_repository = case_repository
+
+    def execute(
+        self, filters: CaseFilters, table: str, columns: List[str], batch_size: int = 10000
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """
+        Recorre en bloques las filas de `table` de los casos filtrados.
+
+        Las filas se entregan crudas (sin entidades) para convertirlas a
+        columnas. Valida los parámetros antes de devolver el iterador, para que
+        los errores se reporten antes de empezar a transmitir la respuesta.
+        """
+        if table not in CASE_EXPORT_TABLES:
+            raise DomainValidationError(f"Tabla no exportable: {table}")
+
+        if filters.match is not None and filters.match not in CASE_MATCH_MODES:
+            raise DomainValidationError(f"Modo de coincidencia no soportado: {filters.match}")
+
+        if batch_size < 1:
+            raise DomainValidationError("El tamaño de batch debe ser mayor a cero")
+
+        return self._iter_batches(filters, table, columns, batch_size)
+
+    async def _iter_batches(
+        self, filters: CaseFilters, table: str, columns: List[str], batch_size: int
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        exported = 0
+        async for rows in self._case_repository.iter_rows(
+            filters, table, columns, chunk_size=batch_size
+        ):
+            exported += len(rows)
+            yield rows
+
+        logger.info(
+            f"Exported {exported} rows of {table}",
+            extra={"table": table, "exported": exported},
+        )
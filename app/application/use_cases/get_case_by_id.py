@@ -1,30 +1,79 @@
 from uuid import UUID
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
+from app.application.interfaces.case_detail_cache import CaseDetailCache
 from app.domain.entities.case import SupportCase
+from app.domain.exceptions import DomainValidationError
 from app.domain.repositories.case_repository import CaseRepository
-from app.domain.repositories.query_repository import QueryRepository
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class GetCaseByIdUseCase:
-    def __init__(self, case_repository: CaseRepository, query_repository: QueryRepository):
+    def __init__(
+        self, case_repository: CaseRepository, detail_cache: Optional[CaseDetailCache] = None
+    ):
         self._case_repository = case_repository
-        self._query_repository = query_repository
+        self._detail_cache = detail_cache
 
-    async def execute(self, case_id: UUID) -> Optional[SupportCase]:
-        """Obtiene un caso por su ID con todas sus queries"""
-        # Obtener caso
-        case = await self._case_repository.get_by_id(case_id)
+    async def execute(
+        self,
+        case_id: UUID,
+        revision: Optional[Tuple[datetime, int]] = None,
+        queries_limit: Optional[int] = None,
+        preview_chars: Optional[int] = None,
+    ) -> Optional[SupportCase]:
+        """
+        Obtiene un caso por su ID con sus queries (una sola consulta).
+
+        Con `queries_limit` solo se incluyen las primeras queries por
+        (executed_at, id); el resto se pagina con GET /cases/{id}/queries.
+        Con `preview_chars` cada query trae solo el comienzo de su texto y su
+        tamaño total (el texto completo se pide aparte).
+        Con cache de detalle la lectura es read-through. Si se pasa `revision`
+        (de get_revision) y no coincide con la del caso cacheado, la entrada
+        se descarta y se vuelve a leer de la DB. Solo se cachean casos con
+        todas sus queries y sus textos completos.
+        """
+        if queries_limit is not None and queries_limit < 0:
+            raise DomainValidationError("queries_limit no puede ser negativo")
+
+        if self._detail_cache:
+            cached = self._detail_cache.get(case_id)
+            if cached and (revision is None or _revision(cached) == revision):
+                logger.info(f"Case retrieved from cache: {case_id}")
+                if queries_limit is not None:
+                    cached.queries = cached.queries[:queries_limit]
+                if preview_chars is not None:
+                    cached.queries = [q.preview(preview_chars) for q in cached.queries]
+                return cached
+            if cached:
+                self._detail_cache.invalidate(case_id)
+            generation = self._detail_cache.generation()
+
+        case = await self._case_repository.get_with_queries(case_id, queries_limit, preview_chars)
 
         if not case:
             logger.info(f"Case not found: {case_id}")
             return None
 
-        # Obtener queries asociadas
-        queries = await self._query_repository.get_by_case_id(case_id)
-        case.queries = queries
+        # Menos queries que el límite: están todas y el caso se puede cachear
+        complete = queries_limit is None or len(case.queries) < queries_limit
+        if self._detail_cache and complete and preview_chars is None:
+            self._detail_cache.set(case, generation)
 
-        logger.info(f"Case retrieved: {case_id} with {len(queries)} queries")
+        logger.info(f"Case retrieved: {case_id} with {len(case.queries)} queries")
         return case
+
+    async def get_revision(self, case_id: UUID) -> Optional[Tuple[datetime, int]]:
+        """
+        Obtiene (updated_at, queries_count) del caso sin cargar sus queries.
+
+        Alcanza para saber si el caso cambió (ETag) antes de ejecutar `execute`.
+        """
+        return await self._case_repository.get_revision(case_id)
+
+
+def _revision(case: SupportCase) -> Tuple[datetime, int]:
+    return case.updated_at, case.queries_count
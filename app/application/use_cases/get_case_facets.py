@@ -0,0 +1,24 @@
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import CASE_MATCH_MODES, CaseFacets, CaseRepository
+from app.domain.value_objects.case_filters import CaseFilters
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GetCaseFacetsUseCase:
+    def __init__(self, case_repository: CaseRepository):
+        self._case_repository = case_repository
+
+    async def execute(self, filters: CaseFilters) -> CaseFacets:
+        """Obtiene los conteos por status, priority y case_type de los casos filtrados"""
+        if filters.match is not None and filters.match not in CASE_MATCH_MODES:
+            raise DomainValidationError(f"Modo de coincidencia no soportado: {filters.match}")
+
+        facets = await self._case_repository.get_facets(filters)
+
+        logger.info(
+            f"Retrieved case facets (total {facets.total})",
+            extra={"total": facets.total, "filters": filters.as_dict()},
+        )
+        return facets
@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field, replace
+from typing import List, Optional
+from uuid import UUID
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import CaseRepository
+from app.domain.repositories.query_repository import QueryRepository
+from app.domain.value_objects.case_cursor import filters_fingerprint
+from app.domain.value_objects.query_cursor import QueryCursor
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tamaño máximo de página de queries de un caso
+MAX_CASE_QUERIES_PAGE_SIZE = 500
+
+
+@dataclass
+class GetCaseQueriesResult:
+    """Página de queries de un caso y cursor de la siguiente"""
+
+    items: List[CaseQuery] = field(default_factory=list)
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+def case_queries_fingerprint(
+    case_id: UUID,
+    database_name: Optional[str] = None,
+    schema_name: Optional[str] = None,
+    executed_by: Optional[str] = None,
+) -> str:
+    """Huella del caso y los filtros a los que queda atado un cursor de queries"""
+    return filters_fingerprint(
+        case_id=str(case_id),
+        database_name=database_name,
+        schema_name=schema_name,
+        executed_by=executed_by,
+    )
+
+
+def next_queries_cursor(case: SupportCase) -> Optional[str]:
+    """
+    Cursor de GET /cases/{id}/queries que continúa el detalle de un caso
+    cargado con queries_limit (None si ya trae todas sus queries).
+    """
+    if not case.queries or len(case.queries) >= case.queries_count:
+        return None
+    return QueryCursor.after(case.queries[-1], case_queries_fingerprint(case.id)).encode()
+
+
+class GetCaseQueriesUseCase:
+    def __init__(self, case_repository: CaseRepository, query_repository: QueryRepository):
+        self._case_repository = case_repository
+        self._query_repository = query_repository
+
+    async def execute(
+        self,
+        case_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        database_name: Optional[str] = None,
+        schema_name: Optional[str] = None,
+        executed_by: Optional[str] = None,
+        preview_chars: Optional[int] = None,
+    ) -> Optional[GetCaseQueriesResult]:
+        """
+        Obtiene una página de queries de un caso ordenadas por (executed_at, id).
+
+        Paginación keyset: `cursor` es el `next_cursor` de la página anterior y
+        solo vale para el mismo caso y filtros. Con `preview_chars` cada query
+        trae solo el comienzo de su texto. Retorna None si el caso no existe.
+        """
+        if limit < 1 or limit > MAX_CASE_QUERIES_PAGE_SIZE:
+            raise DomainValidationError(
+                f"El tamaño de página debe estar entre 1 y {MAX_CASE_QUERIES_PAGE_SIZE}"
+            )
+
+        fingerprint = case_queries_fingerprint(case_id, database_name, schema_name, executed_by)
+
+        after = None
+        if cursor:
+            after = QueryCursor.decode(cursor)
+            if after.filters != fingerprint:
+                raise DomainValidationError(
+                    "El cursor de paginación no corresponde al caso o a los filtros solicitados"
+                )
+
+        page = await self._query_repository.get_page(
+            case_id,
+            limit,
+            after=after,
+            database_name=database_name,
+            schema_name=schema_name,
+            executed_by=executed_by,
+            preview_chars=preview_chars,
+        )
+
+        # Una página vacía puede ser de un caso inexistente: solo entonces se
+        # consulta el caso (lookup por PK)
+        if not page.items and await self._case_repository.get_revision(case_id) is None:
+            logger.info(f"Case not found: {case_id}")
+            return None
+
+        next_cursor = None
+        if page.next_cursor:
+            next_cursor = replace(page.next_cursor, filters=fingerprint).encode()
+
+        logger.info(
+            f"Case queries page: {len(page.items)} queries of case {case_id}",
+            extra={"keyset": after is not None, "has_more": page.has_more},
+        )
+        return GetCaseQueriesResult(
+            items=page.items, has_more=page.has_more, next_cursor=next_cursor
+        )
@@ -0,0 +1,22 @@
+from uuid import UUID
+from typing import Optional
+from app.domain.entities.case import CaseQuery
+from app.domain.repositories.query_repository import QueryRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GetCaseQueryUseCase:
+    def __init__(self, query_repository: QueryRepository):
+        self._query_repository = query_repository
+
+    async def execute(self, case_id: UUID, query_id: UUID) -> Optional[CaseQuery]:
+        """Obtiene una query de un caso (las queries son inmutables)"""
+        query = await self._query_repository.get_by_id(case_id, query_id)
+
+        if not query:
+            logger.info(f"Query not found: {query_id} (case {case_id})")
+            return None
+
+        return query
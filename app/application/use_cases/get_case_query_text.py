@@ -0,0 +1,38 @@
+from typing import AsyncIterator, Optional
+from uuid import UUID
+from app.domain.repositories.query_repository import QueryRepository, QueryText
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Textos hasta este tamaño se devuelven en una sola lectura; los mayores se recorren por partes
+QUERY_TEXT_INLINE_MAX_BYTES = 256 * 1024
+
+# Caracteres por parte al recorrer un texto grande
+QUERY_TEXT_CHUNK_CHARS = 64 * 1024
+
+
+class GetCaseQueryTextUseCase:
+    def __init__(self, query_repository: QueryRepository):
+        self._query_repository = query_repository
+
+    async def execute(self, case_id: UUID, query_id: UUID) -> Optional[QueryText]:
+        """
+        Obtiene el texto completo de una query de un caso.
+
+        Si supera QUERY_TEXT_INLINE_MAX_BYTES, `text` viene vacío y el texto se
+        recorre con `stream`. Retorna None si la query no existe.
+        """
+        query_text = await self._query_repository.get_text(
+            case_id, query_id, QUERY_TEXT_INLINE_MAX_BYTES
+        )
+
+        if query_text is None:
+            logger.info(f"Query not found: {query_id} (case {case_id})")
+            return None
+
+        return query_text
+
+    def stream(self, case_id: UUID, query_id: UUID) -> AsyncIterator[str]:
+        """Recorre el texto de una query en partes de QUERY_TEXT_CHUNK_CHARS caracteres"""
+        return self._query_repository.iter_text(case_id, query_id, QUERY_TEXT_CHUNK_CHARS)
@@ -1,13 +1,38 @@
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
 from datetime import datetime
-from app.domain.entities.case import SupportCase
-from app.domain.repositories.case_repository import CaseRepository
+from uuid import UUID
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import (
+    CASE_COUNT_MODES,
+    CASE_LIST_FIELDS,
+    CASE_LIST_INCLUDES,
+    CASE_MATCH_MODES,
+    CaseRepository,
+)
 from app.domain.repositories.query_repository import QueryRepository
+from app.domain.value_objects.case_cursor import (
+    CaseCursor,
+    filters_fingerprint,
+    normalize_sort_by,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class GetCasesResult:
+    """Página de casos (con su queries_count) y datos de paginación"""
+
+    items: List[SupportCase] = field(default_factory=list)
+    total: Optional[int] = 0
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+    total_estimated: bool = False
+
+
 class GetCasesUseCase:
     def __init__(self, case_repository: CaseRepository, query_repository: QueryRepository):
         self._case_repository = case_repository
@@ -26,15 +51,72 @@ class GetCasesUseCase:
         sort_order: str = "desc",
         page: int = 1,
         page_size: int = 10,
-    ) -> Tuple[List[Tuple[SupportCase, int]], int]:
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+        match: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
+    ) -> GetCasesResult:
         """
         Obtiene casos con filtros y paginación.
 
+        Si se recibe `cursor` (el `next_cursor` de una respuesta anterior) se usa
+        paginación keyset y `page` se ignora. `count_mode` define cómo se calcula
+        el total: "exact", "estimated" o "none" (total None, solo has_more).
+        `match` ("substring" o "fuzzy") cambia `search` y `created_by` a búsqueda
+        trigram por fragmentos o por similitud.
+        `fields` limita las columnas leídas (proyección) e `include=["queries"]`
+        carga las queries de toda la página en una sola consulta.
+
         Returns:
-            Tuple con lista de (caso, queries_count) y total de casos
+            GetCasesResult con los casos (queries_count incluido), total y next_cursor
         """
+        sort_by = normalize_sort_by(sort_by, search)
+        sort_order = sort_order.lower()
+
+        if count_mode not in CASE_COUNT_MODES:
+            raise DomainValidationError(f"Modo de conteo no soportado: {count_mode}")
+
+        if match is not None and match not in CASE_MATCH_MODES:
+            raise DomainValidationError(f"Modo de coincidencia no soportado: {match}")
+
+        if fields is not None:
+            if not fields:
+                raise DomainValidationError("Debe indicar al menos un campo")
+            unknown = [name for name in fields if name not in CASE_LIST_FIELDS]
+            if unknown:
+                raise DomainValidationError(f"Campos no soportados: {', '.join(unknown)}")
+
+        include = include or []
+        unknown = [name for name in include if name not in CASE_LIST_INCLUDES]
+        if unknown:
+            raise DomainValidationError(f"Relaciones no soportadas: {', '.join(unknown)}")
+
+        fingerprint = filters_fingerprint(
+            status=status,
+            priority=priority,
+            case_type=case_type,
+            created_by=created_by,
+            search=search,
+            date_gte=date_gte,
+            date_lte=date_lte,
+            match=match,
+        )
+
+        decoded_cursor = None
+        if cursor:
+            decoded_cursor = CaseCursor.decode(cursor)
+            if decoded_cursor.sort_by != sort_by or decoded_cursor.sort_order != sort_order:
+                raise DomainValidationError(
+                    "El cursor de paginación no corresponde al orden solicitado"
+                )
+            if decoded_cursor.filters != fingerprint:
+                raise DomainValidationError(
+                    "El cursor de paginación no corresponde a los filtros solicitados"
+                )
+
         # Obtener casos con filtros
-        cases, total = await self._case_repository.get_all(
+        case_page = await self._case_repository.get_all(
             status=status,
             priority=priority,
             case_type=case_type,
@@ -46,30 +128,52 @@ class GetCasesUseCase:
             sort_order=sort_order,
             page=page,
             page_size=page_size,
+            cursor=decoded_cursor,
+            count_mode=count_mode,
+            match=match,
+            fields=fields,
         )
+        # queries_count viene desnormalizado en support_cases: sin consultas extra
+        cases = case_page.items
 
-        # Para cada caso, obtener el conteo de queries
-        # Esto es más eficiente que obtener todas las queries
-        cases_with_count = []
-        for case in cases:
-            queries = await self._query_repository.get_by_case_id(case.id)
-            queries_count = len(queries)
-            cases_with_count.append((case, queries_count))
+        if "queries" in include and cases:
+            # Una consulta ANY() para toda la página, agrupada por caso en memoria
+            queries = await self._query_repository.get_by_case_ids([case.id for case in cases])
+            by_case: Dict[UUID, List[CaseQuery]] = {}
+            for query in queries:
+                by_case.setdefault(query.case_id, []).append(query)
+            for case in cases:
+                case.queries = by_case.get(case.id, [])
+
+        next_cursor = None
+        if case_page.next_cursor:
+            next_cursor = replace(case_page.next_cursor, filters=fingerprint).encode()
 
         logger.info(
-            f"Retrieved {len(cases)} cases (page {page}, total {total})",
+            f"Retrieved {len(cases)} cases (page {page}, total {case_page.total})",
             extra={
                 "page": page,
                 "page_size": page_size,
-                "total": total,
+                "total": case_page.total,
+                "keyset": decoded_cursor is not None,
+                "count_mode": count_mode,
+                "fields": fields,
+                "include": include,
                 "filters": {
                     "status": status,
                     "priority": priority,
                     "case_type": case_type,
                     "created_by": created_by,
                     "search": search,
+                    "match": match,
                 },
             },
         )
 
-        return cases_with_count, total
+        return GetCasesResult(
+            items=cases,
+            total=case_page.total,
+            has_more=case_page.has_more,
+            next_cursor=next_cursor,
+            total_estimated=case_page.total_estimated,
+        )
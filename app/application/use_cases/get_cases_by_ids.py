@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+from uuid import UUID
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import CaseRepository
+from app.domain.repositories.query_repository import QueryRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Máximo de IDs por solicitud de multi-get
+MAX_BATCH_GET_IDS = 100
+
+
+@dataclass
+class GetCasesByIdsResult:
+    """Casos encontrados (en el orden pedido, con sus queries) e IDs inexistentes"""
+
+    items: List[SupportCase] = field(default_factory=list)
+    missing: List[UUID] = field(default_factory=list)
+
+
+class GetCasesByIdsUseCase:
+    def __init__(self, case_repository: CaseRepository, query_repository: QueryRepository):
+        self._case_repository = case_repository
+        self._query_repository = query_repository
+
+    async def execute(self, case_ids: List[UUID]) -> GetCasesByIdsResult:
+        """
+        Obtiene varios casos con todas sus queries en dos consultas.
+
+        Los IDs repetidos se consideran una vez. Los que no existen se
+        reportan en `missing` en lugar de hacer fallar toda la solicitud.
+        """
+        unique_ids = list(dict.fromkeys(case_ids))
+        if not unique_ids:
+            raise DomainValidationError("Debe indicar al menos un ID de caso")
+        if len(unique_ids) > MAX_BATCH_GET_IDS:
+            raise DomainValidationError(
+                f"No se pueden obtener más de {MAX_BATCH_GET_IDS} casos por solicitud"
+            )
+
+        found = {case.id: case for case in await self._case_repository.get_many(unique_ids)}
+
+        # Queries solo de los casos encontrados, agrupadas por caso en memoria
+        queries_by_case: Dict[UUID, List[CaseQuery]] = {}
+        if found:
+            queries = await self._query_repository.get_by_case_ids(list(found))
+            for query in queries:
+                queries_by_case.setdefault(query.case_id, []).append(query)
+
+        result = GetCasesByIdsResult()
+        for case_id in unique_ids:
+            case = found.get(case_id)
+            if case is None:
+                result.missing.append(case_id)
+                continue
+            case.queries = queries_by_case.get(case_id, [])
+            result.items.append(case)
+
+        logger.info(
+            f"Batch get: {len(result.items)} cases found, {len(result.missing)} missing",
+            extra={"requested": len(unique_ids), "missing": len(result.missing)},
+        )
+        return result
@@ -0,0 +1,131 @@
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, List, Optional, Set
+import asyncio
+from app.application.use_cases.bulk_create_cases import BulkCreateCasesUseCase
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IngestLine:
+    """Un caso de la entrada: sus datos (forma de POST /cases) o el motivo del rechazo"""
+
+    line: int
+    item: Optional[dict] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class IngestError:
+    line: int
+    error: str
+
+
+@dataclass
+class IngestCasesResult:
+    """Totales de la ingesta y los primeros errores (acotados)"""
+
+    received: int = 0
+    created: int = 0
+    failed: int = 0
+    batches: int = 0
+    errors: List[IngestError] = field(default_factory=list)
+
+    @property
+    def errors_truncated(self) -> bool:
+        return self.failed > len(self.errors)
+
+
+class IngestCasesUseCase:
+    def __init__(
+        self,
+        bulk_create_factory: Callable[[], BulkCreateCasesUseCase],
+        batch_size: int = 1000,
+        max_in_flight: int = 2,
+        max_errors: int = 100,
+    ):
+        # Una importación por lote: cada una con su propio Unit of Work
+        self._bulk_create_factory = bulk_create_factory
+        self._batch_size = batch_size
+        self._max_in_flight = max(1, max_in_flight)
+        self._max_errors = max_errors
+
+    async def execute(self, lines: AsyncIterator[IngestLine]) -> IngestCasesResult:
+        """
+        Crea los casos de `lines` por lotes de `batch_size` a medida que llegan.
+
+        Hasta `max_in_flight` lotes se guardan a la vez mientras se sigue
+        leyendo; con ese máximo ocupado se deja de leer la entrada hasta que
+        termine alguno. La memoria queda acotada por esos lotes y no por el
+        tamaño de la entrada. Los lotes ya guardados quedan aunque la entrada
+        falle más adelante.
+        """
+        result = IngestCasesResult()
+        in_flight: Set[asyncio.Task] = set()
+        batch: List[IngestLine] = []
+
+        try:
+            async for line in lines:
+                result.received += 1
+                if line.error is not None:
+                    self._record_error(result, line.line, line.error)
+                    continue
+                batch.append(line)
+                if len(batch) >= self._batch_size:
+                    await self._submit(batch, in_flight, result)
+                    batch = []
+
+            if batch:
+                await self._submit(batch, in_flight, result)
+            while in_flight:
+                await self._wait_one(in_flight)
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            raise
+
+        result.errors.sort(key=lambda error: error.line)
+        logger.info(
+            f"Ingest: {result.created} of {result.received} cases created "
+            f"in {result.batches} batches",
+            extra={
+                "received": result.received,
+                "cases_created": result.created,
+                "cases_failed": result.failed,
+            },
+        )
+        return result
+
+    async def _submit(
+        self, batch: List[IngestLine], in_flight: Set[asyncio.Task], result: IngestCasesResult
+    ) -> None:
+        while len(in_flight) >= self._max_in_flight:
+            await self._wait_one(in_flight)
+        in_flight.add(asyncio.create_task(self._save(batch, result)))
+
+    @staticmethod
+    async def _wait_one(in_flight: Set[asyncio.Task]) -> None:
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            in_flight.discard(task)
+            task.result()  # Propaga errores inesperados
+
+    async def _save(self, batch: List[IngestLine], result: IngestCasesResult) -> None:
+        bulk_result = await self._bulk_create_factory().execute([line.item for line in batch])
+        result.batches += 1
+        for item in bulk_result.items:
+            if item.created:
+                result.created += 1
+            else:
+                self._record_error(result, batch[item.index].line, item.error)
+        logger.debug(
+            f"Ingest batch up to line {batch[-1].line}: "
+            f"{bulk_result.created} created, {bulk_result.failed} failed"
+        )
+
+    def _record_error(self, result: IngestCasesResult, line: int, error: str) -> None:
+        result.failed += 1
+        if len(result.errors) < self._max_errors:
+            result.errors.append(IngestError(line=line, error=error))
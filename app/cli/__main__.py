@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime
+from app.application.use_cases.export_columnar import ExportColumnarUseCase
+from app.config import settings
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import CASE_MATCH_MODES
+from app.domain.value_objects.case_filters import CaseFilters
+from app.infrastructure.database.db import db
+from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
+from app.infrastructure.export.columnar import (
+    COLUMNAR_FORMATS,
+    COLUMNAR_TABLES,
+    ColumnarExportUnavailable,
+    table_columns,
+    write_columnar,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def repair_queries_count(args: argparse.Namespace) -> int:
+    """Recalcula support_cases.queries_count desde case_queries"""
+    repaired = await CaseRepositoryImpl(db).repair_queries_count()
+    print(f"queries_count corregido en {repaired} casos")
+    return 0
+
+
+async def query_texts_report(args: argparse.Namespace) -> int:
+    """Informa cuánto ahorra guardar cada texto SQL una sola vez"""
+    storage = await QueryRepositoryImpl(db).text_storage()
+    ratio = storage.queries / storage.distinct_texts if storage.distinct_texts else 0.0
+    print(f"queries:                {storage.queries}")
+    print(f"textos distintos:       {storage.distinct_texts} ({ratio:.1f} queries por texto)")
+    print(f"bytes de texto lógicos: {storage.logical_bytes}")
+    print(f"bytes de texto reales:  {storage.stored_bytes} (+{storage.hash_bytes} de hashes)")
+    print(f"bytes ahorrados:        {storage.saved_bytes}")
+    print(f"case_queries en disco:  {storage.case_queries_disk_bytes}")
+    print(f"query_texts en disco:   {storage.query_texts_disk_bytes}")
+    return 0
+
+
+async def export_columnar(args: argparse.Namespace) -> int:
+    """Exporta support_cases o case_queries como Arrow IPC o Parquet"""
+    filters = CaseFilters(
+        status=args.status,
+        priority=args.priority,
+        case_type=args.case_type,
+        created_by=args.created_by,
+        search=args.search,
+        match=args.match,
+        date_gte=args.date_gte,
+        date_lte=args.date_lte,
+    )
+    use_case = ExportColumnarUseCase(CaseRepositoryImpl(db))
+    batch_size = args.batch_size or settings.COLUMNAR_BATCH_SIZE
+
+    try:
+        batches = use_case.execute(filters, args.table, table_columns(args.table), batch_size)
+        if args.output == "-":
+            await write_columnar(batches, args.table, args.format, sys.stdout.buffer.write)
+        else:
+            with open(args.output, "wb") as output:
+                await write_columnar(batches, args.table, args.format, output.write)
+    except (ColumnarExportUnavailable, ValueError, DomainValidationError) as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    return 0
+
+
+def _add_export_columnar_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--table", choices=COLUMNAR_TABLES, default="support_cases")
+    parser.add_argument("--format", choices=COLUMNAR_FORMATS, default="parquet")
+    parser.add_argument("--output", required=True, help="Archivo de salida ('-' para stdout)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Filas por record batch")
+    parser.add_argument("--status")
+    parser.add_argument("--priority")
+    parser.add_argument("--case-type")
+    parser.add_argument("--created-by")
+    parser.add_argument("--search")
+    parser.add_argument("--match", choices=CASE_MATCH_MODES)
+    parser.add_argument("--date-gte", type=datetime.fromisoformat)
+    parser.add_argument("--date-lte", type=datetime.fromisoformat)
+
+
+# nombre -> (handler, ayuda, función que agrega los argumentos del subcomando)
+COMMANDS = {
+    "repair-queries-count": (
+        repair_queries_count,
+        "Recalcula el conteo desnormalizado de queries de cada caso",
+        None,
+    ),
+    "query-texts-report": (
+        query_texts_report,
+        "Informa el espacio ahorrado por la deduplicación de textos SQL",
+        None,
+    ),
+    "export-columnar": (
+        export_columnar,
+        "Exporta casos o queries como Arrow IPC o Parquet para análisis",
+        _add_export_columnar_arguments,
+    ),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (_, help_text, add_arguments) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if add_arguments:
+            add_arguments(subparser)
+    return parser
+
+
+async def run(args: argparse.Namespace) -> int:
+    handler, _, _ = COMMANDS[args.command]
+    await db.connect()
+    try:
+        return await handler(args)
+    finally:
+        await db.disconnect()
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+    args = build_parser().parse_args(argv)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,9 @@ class Settings(BaseSettings):
     DB_USER: str = "tracker_user"
     DB_PASSWORD: str = "tracker_pass"
     DB_NAME: str = "tracker_db"
+    # Conexiones del pool por proceso
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
 
     @property
     def DATABASE_URL(self) -> str:
@@ -23,6 +26,58 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     LOG_LEVEL: str = "INFO"
 
+    # Sentencias preparadas por conexión (cache LRU de asyncpg; incluye las formas del listado)
+    DB_STATEMENT_CACHE_SIZE: int = 512
+    # Preparar las formas frecuentes al abrir cada conexión del pool
+    PREPARE_HOT_LISTING_SHAPES: bool = True
+
+    # Cache del total del listado (TTL 0 lo desactiva)
+    COUNT_CACHE_TTL_SECONDS: float = 30.0
+    COUNT_CACHE_MAX_ENTRIES: int = 256
+
+    # Cache de facetas del listado (TTL corto; 0 lo desactiva)
+    FACETS_CACHE_TTL_SECONDS: float = 10.0
+    FACETS_CACHE_MAX_ENTRIES: int = 128
+
+    # Cache del detalle de casos (con sus queries); TTL 0 lo desactiva
+    CASE_DETAIL_CACHE_TTL_SECONDS: float = 300.0
+    CASE_DETAIL_CACHE_MAX_ENTRIES: int = 2048
+    CASE_DETAIL_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # save_many de queries: desde cuántas filas se inserta con COPY en lugar de
+    # executemany (0 lo desactiva); ver scripts/benchmarks/bulk_insert.py
+    SAVE_MANY_COPY_THRESHOLD: int = 50
+
+    # POST /cases: casos con hasta esta cantidad de queries se crean en una sola
+    # sentencia (un round-trip); con más, en transacción con COPY. 0 lo desactiva
+    CREATE_CASE_SINGLE_STATEMENT_MAX_QUERIES: int = 50
+
+    # Group commit de POST /cases: las altas concurrentes (de casos que entran
+    # en una sentencia) se agrupan durante la ventana o hasta completar el lote
+    # y se escriben juntas con una sola conexión del pool
+    CREATE_CASE_GROUP_COMMIT: bool = False
+    CREATE_CASE_GROUP_COMMIT_WINDOW_MS: float = 2.0
+    CREATE_CASE_GROUP_COMMIT_MAX_BATCH: int = 100
+
+    # Importación masiva (POST /cases/bulk): casos por solicitud, casos por
+    # transacción y tamaño máximo del cuerpo (ya descomprimido si viene en gzip)
+    BULK_IMPORT_MAX_ITEMS: int = 10000
+    BULK_IMPORT_CHUNK_SIZE: int = 1000
+    BULK_IMPORT_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Ingesta NDJSON (POST /cases/ingest): lotes de BULK_IMPORT_CHUNK_SIZE casos,
+    # lotes guardándose a la vez (cada uno ocupa una conexión del pool), bytes
+    # máximos por línea y errores detallados en la respuesta
+    INGEST_MAX_IN_FLIGHT_BATCHES: int = 2
+    INGEST_MAX_LINE_BYTES: int = 1024 * 1024
+    INGEST_MAX_REPORTED_ERRORS: int = 100
+
+    # Exportación: casos por bloque leído del cursor del servidor
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    # Exportación columnar (Arrow/Parquet): filas por record batch
+    COLUMNAR_BATCH_SIZE: int = 10000
+
     # CORS
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000"]
 
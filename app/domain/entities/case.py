@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID, uuid4
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Optional
 from app.domain.value_objects.case_status import CaseStatus
 from app.domain.value_objects.case_type import CaseType
@@ -8,6 +8,14 @@ from app.domain.value_objects.case_priority import CasePriority
 from app.domain.exceptions import DomainValidationError
 
 
+def normalize_query_text(query_text: str) -> str:
+    """
+    Forma canónica del texto SQL: sin espacios en los extremos y con fines de
+    línea \n. Los textos iguales tras normalizar se guardan una sola vez.
+    """
+    return query_text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
 @dataclass
 class CaseQuery:
     """Entidad que representa una consulta SQL ejecutada"""
@@ -21,6 +29,24 @@ class CaseQuery:
     rows_affected: Optional[int] = None
     executed_at: datetime = field(default_factory=datetime.utcnow)
     executed_by: str = ""
+    # Solo en vista previa: bytes (UTF-8) del texto completo; query_text es un prefijo
+    query_text_bytes: Optional[int] = None
+
+    @property
+    def query_text_truncated(self) -> bool:
+        """Indica si query_text es un prefijo del texto completo"""
+        return (
+            self.query_text_bytes is not None
+            and len(self.query_text.encode("utf-8")) < self.query_text_bytes
+        )
+
+    def preview(self, chars: int) -> "CaseQuery":
+        """Copia con los primeros `chars` caracteres del texto y su tamaño total"""
+        return replace(
+            self,
+            query_text=self.query_text[:chars],
+            query_text_bytes=len(self.query_text.encode("utf-8")),
+        )
 
     @classmethod
     def create(
@@ -50,7 +76,7 @@ class CaseQuery:
             case_id=case_id,
             database_name=database_name.strip(),
             schema_name=schema_name.strip(),
-            query_text=query_text.strip(),
+            query_text=normalize_query_text(query_text),
             executed_by=executed_by,
             execution_time_ms=execution_time_ms,
             rows_affected=rows_affected,
@@ -71,6 +97,8 @@ class SupportCase:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     queries: List[CaseQuery] = field(default_factory=list)
+    # Total de queries del caso; en lecturas viene de la columna desnormalizada
+    queries_count: int = 0
 
     @classmethod
     def create(
@@ -105,6 +133,7 @@ class SupportCase:
         if query.case_id != self.id:
             raise DomainValidationError("La query no pertenece a este caso")
         self.queries.append(query)
+        self.queries_count += 1
         self.updated_at = datetime.utcnow()
 
     def mark_as_in_progress(self) -> None:
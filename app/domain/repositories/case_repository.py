@@ -1,7 +1,58 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
 from app.domain.entities.case import SupportCase
+from app.domain.value_objects.case_cursor import CaseCursor
+from app.domain.value_objects.case_filters import CaseFilters
+
+# Modos de cálculo del total en el listado de casos
+CASE_COUNT_MODES = ("exact", "estimated", "none")
+
+# Modos de coincidencia trigram para los filtros search y created_by
+CASE_MATCH_MODES = ("substring", "fuzzy")
+
+# Campos proyectables del listado (columnas de support_cases); id siempre se incluye
+CASE_LIST_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "case_type",
+    "priority",
+    "status",
+    "created_by",
+    "created_at",
+    "updated_at",
+    "queries_count",
+)
+
+# Tablas exportables fila a fila (exportación columnar)
+CASE_EXPORT_TABLES = ("support_cases", "case_queries")
+
+# Relaciones que el listado puede cargar para toda la página
+CASE_LIST_INCLUDES = ("queries",)
+
+
+@dataclass
+class CasePage:
+    """Resultado paginado del listado de casos"""
+
+    items: List[SupportCase] = field(default_factory=list)
+    total: Optional[int] = 0
+    has_more: bool = False
+    total_estimated: bool = False
+    next_cursor: Optional[CaseCursor] = None
+
+
+@dataclass
+class CaseFacets:
+    """Conteo de casos por valor de cada faceta (status, priority, case_type)"""
+
+    total: int = 0
+    status: Dict[str, int] = field(default_factory=dict)
+    priority: Dict[str, int] = field(default_factory=dict)
+    case_type: Dict[str, int] = field(default_factory=dict)
 
 
 class CaseRepository(ABC):
@@ -12,7 +63,116 @@ class CaseRepository(ABC):
         """Guarda un caso (solo INSERT, no UPDATE)"""
         pass
 
+    @abstractmethod
+    async def create_with_queries(self, case: SupportCase) -> None:
+        """
+        Guarda un caso nuevo y todas sus queries en una sola sentencia
+        (atómica por sí misma, sin Unit of Work).
+        """
+        pass
+
+    @abstractmethod
+    async def create_many_with_queries(self, cases: List[SupportCase]) -> None:
+        """
+        Guarda varios casos nuevos y todas sus queries en una sola sentencia
+        (atómica: se guardan todos o ninguno).
+        """
+        pass
+
+    @abstractmethod
+    async def save_many(self, cases: List[SupportCase]) -> None:
+        """
+        Guarda varios casos en una sola escritura (solo INSERT) con su
+        queries_count; las queries se guardan aparte.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, case_id: UUID) -> Optional[SupportCase]:
         """Obtiene un caso por ID"""
         pass
+
+    @abstractmethod
+    async def get_with_queries(
+        self,
+        case_id: UUID,
+        queries_limit: Optional[int] = None,
+        preview_chars: Optional[int] = None,
+    ) -> Optional[SupportCase]:
+        """
+        Obtiene un caso con sus queries (ordenadas por ejecución) en una sola
+        consulta; con `queries_limit` solo las primeras y con `preview_chars`
+        solo un prefijo de cada texto (ver CaseQuery.preview).
+        """
+        pass
+
+    @abstractmethod
+    async def get_many(self, case_ids: List[UUID]) -> List[SupportCase]:
+        """Obtiene varios casos por ID en una consulta; los IDs inexistentes se omiten"""
+        pass
+
+    @abstractmethod
+    async def get_revision(self, case_id: UUID) -> Optional[Tuple[datetime, int]]:
+        """Obtiene (updated_at, queries_count) de un caso sin cargarlo completo"""
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        case_type: Optional[str] = None,
+        created_by: Optional[str] = None,
+        search: Optional[str] = None,
+        date_gte: Optional[datetime] = None,
+        date_lte: Optional[datetime] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        page: int = 1,
+        page_size: int = 10,
+        cursor: Optional[CaseCursor] = None,
+        count_mode: str = "exact",
+        match: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> CasePage:
+        """
+        Obtiene casos con filtros y paginación (offset o keyset si hay cursor).
+
+        count_mode: "exact", "estimated" o "none" (total None, solo has_more)
+        match: None (full-text / igualdad), "substring" o "fuzzy" para search y created_by
+        fields: columnas a leer (subconjunto de CASE_LIST_FIELDS); None lee todas.
+            Los atributos no leídos quedan con el valor por defecto de la entidad.
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self, filters: CaseFilters, chunk_size: int = 1000
+    ) -> AsyncIterator[List[SupportCase]]:
+        """
+        Recorre todos los casos filtrados en bloques de `chunk_size`.
+
+        Pensado para exportaciones: la memoria usada depende del tamaño del
+        bloque y no del total de casos.
+        """
+        pass
+
+    @abstractmethod
+    def iter_rows(
+        self, filters: CaseFilters, table: str, columns: List[str], chunk_size: int = 1000
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """
+        Recorre en bloques las filas crudas de `table` (una de CASE_EXPORT_TABLES)
+        que corresponden a los casos filtrados, con las columnas `columns`.
+        """
+        pass
+
+    @abstractmethod
+    async def get_facets(self, filters: CaseFilters) -> CaseFacets:
+        """Cuenta los casos filtrados por status, priority y case_type en una consulta"""
+        pass
+
+    @abstractmethod
+    async def repair_queries_count(self) -> int:
+        """Recalcula el conteo desnormalizado de queries; retorna los casos corregidos"""
+        pass
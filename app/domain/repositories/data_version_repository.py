@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class DataVersionRepository(ABC):
+    """Interface de la marca de agua de datos (Port)"""
+
+    @abstractmethod
+    async def current(self) -> int:
+        """Retorna la versión de datos vigente"""
+        pass
+
+    @abstractmethod
+    async def bump(self) -> int:
+        """Avanza la versión tras una escritura confirmada"""
+        pass
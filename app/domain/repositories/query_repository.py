@@ -1,7 +1,46 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from uuid import UUID
-from typing import List
+from typing import AsyncIterator, List, Optional
 from app.domain.entities.case import CaseQuery
+from app.domain.value_objects.query_cursor import QueryCursor
+
+# Caracteres de query_text en la vista previa (query_text=preview)
+QUERY_TEXT_PREVIEW_CHARS = 200
+
+
+@dataclass
+class QueryText:
+    """Tamaño del texto completo de una query y el texto, si no supera el máximo pedido"""
+
+    size_bytes: int
+    text: Optional[str] = None
+
+
+@dataclass
+class QueryTextStorage:
+    """Almacenamiento de los textos SQL, guardados una vez por contenido"""
+
+    queries: int
+    distinct_texts: int
+    logical_bytes: int  # Bytes de texto si cada query guardara su copia
+    stored_bytes: int  # Bytes de texto guardados (una vez por texto distinto)
+    hash_bytes: int  # Bytes de las referencias (hash) en las queries
+    case_queries_disk_bytes: int
+    query_texts_disk_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.logical_bytes - self.stored_bytes - self.hash_bytes
+
+
+@dataclass
+class QueryPage:
+    """Página de queries de un caso (paginación keyset)"""
+
+    items: List[CaseQuery] = field(default_factory=list)
+    has_more: bool = False
+    next_cursor: Optional[QueryCursor] = None
 
 
 class QueryRepository(ABC):
@@ -13,11 +52,56 @@ class QueryRepository(ABC):
         pass
 
     @abstractmethod
-    async def save_many(self, queries: List[CaseQuery]) -> None:
-        """Guarda múltiples queries en batch (más eficiente)"""
+    async def save_many(self, queries: List[CaseQuery], update_counts: bool = True) -> None:
+        """
+        Guarda múltiples queries en batch (más eficiente); con
+        update_counts=False no toca el queries_count de los casos (ya guardados con él).
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, case_id: UUID, query_id: UUID) -> Optional[CaseQuery]:
+        """Obtiene una query de un caso"""
         pass
 
     @abstractmethod
     async def get_by_case_id(self, case_id: UUID) -> List[CaseQuery]:
         """Obtiene todas las queries de un caso"""
         pass
+
+    @abstractmethod
+    async def get_by_case_ids(self, case_ids: List[UUID]) -> List[CaseQuery]:
+        """Obtiene las queries de varios casos en una sola consulta"""
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self,
+        case_id: UUID,
+        limit: int,
+        after: Optional[QueryCursor] = None,
+        database_name: Optional[str] = None,
+        schema_name: Optional[str] = None,
+        executed_by: Optional[str] = None,
+        preview_chars: Optional[int] = None,
+    ) -> QueryPage:
+        """
+        Obtiene una página de queries del caso ordenadas por (executed_at, id);
+        con `preview_chars` solo un prefijo de cada texto (ver CaseQuery.preview).
+        """
+        pass
+
+    @abstractmethod
+    async def get_text(self, case_id: UUID, query_id: UUID, max_bytes: int) -> Optional[QueryText]:
+        """Obtiene el tamaño del texto de una query y el texto si no supera `max_bytes`"""
+        pass
+
+    @abstractmethod
+    def iter_text(self, case_id: UUID, query_id: UUID, chunk_chars: int) -> AsyncIterator[str]:
+        """Recorre el texto de una query en partes de `chunk_chars` caracteres"""
+        pass
+
+    @abstractmethod
+    async def text_storage(self) -> QueryTextStorage:
+        """Bytes de texto guardados frente a una copia por query (deduplicación)"""
+        pass
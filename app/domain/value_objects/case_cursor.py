@@ -0,0 +1,132 @@
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+from app.domain.exceptions import DomainValidationError
+
+# Campos permitidos para ordenar el listado de casos
+CASE_SORT_FIELDS = (
+    "status",
+    "priority",
+    "case_type",
+    "created_by",
+    "created_at",
+    "title",
+    "queries_count",
+    "relevance",
+)
+
+DEFAULT_CASE_SORT_FIELD = "created_at"
+
+# Campos de orden que requieren un término de búsqueda
+_SEARCH_SORT_FIELDS = {"relevance"}
+
+# Campos cuyo valor viaja como ISO 8601 dentro del cursor
+_DATETIME_FIELDS = {"created_at"}
+
+# Tipo JSON esperado del valor del cursor según el campo de orden
+_VALUE_TYPES = {
+    "status": (str,),
+    "priority": (str,),
+    "case_type": (str,),
+    "created_by": (str,),
+    "created_at": (str,),
+    "title": (str,),
+    "queries_count": (int,),
+    "relevance": (int, float),
+}
+
+
+def filters_fingerprint(**filters: Any) -> str:
+    """
+    Huella corta de los filtros de un listado.
+
+    Se guarda en el cursor para que no pueda reutilizarse con otros filtros
+    (la posición keyset solo tiene sentido sobre el mismo conjunto de filas).
+    Los filtros vacíos no cuentan.
+    """
+    canonical = {
+        name: value.isoformat() if isinstance(value, datetime) else value
+        for name, value in sorted(filters.items())
+        if value
+    }
+    raw = json.dumps(canonical, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def normalize_sort_by(sort_by: str, search: Optional[str] = None) -> str:
+    """
+    Retorna el campo de orden efectivo.
+
+    Los campos desconocidos, y "relevance" sin término de búsqueda, caen a created_at.
+    """
+    if sort_by not in CASE_SORT_FIELDS:
+        return DEFAULT_CASE_SORT_FIELD
+    if sort_by in _SEARCH_SORT_FIELDS and not search:
+        return DEFAULT_CASE_SORT_FIELD
+    return sort_by
+
+
+@dataclass(frozen=True)
+class CaseCursor:
+    """
+    Posición en el listado de casos para paginación keyset.
+
+    Guarda el valor del campo de orden (columna o expresión, p. ej. el ranking
+    de relevancia) y el id del último caso entregado; el id actúa como
+    desempate para que el orden sea estable. `filters` es la huella de los
+    filtros del listado que lo generó (ver filters_fingerprint).
+    """
+
+    sort_by: str
+    sort_order: str
+    value: Any
+    id: UUID
+    filters: Optional[str] = None
+
+    def encode(self) -> str:
+        """Serializa el cursor como token opaco (base64 url-safe)"""
+        value = self.value.isoformat() if isinstance(self.value, datetime) else self.value
+        payload = {"s": self.sort_by, "o": self.sort_order, "v": value, "id": str(self.id)}
+        if self.filters is not None:
+            payload["f"] = self.filters
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "CaseCursor":
+        """Reconstruye un cursor a partir del token opaco"""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            sort_by = payload["s"]
+            sort_order = payload["o"]
+            value = payload["v"]
+            case_id = UUID(payload["id"])
+            filters = payload.get("f")
+        except (binascii.Error, ValueError, TypeError, KeyError, UnicodeError):
+            raise DomainValidationError("El cursor de paginación no es válido")
+
+        if sort_by not in CASE_SORT_FIELDS or sort_order not in ("asc", "desc"):
+            raise DomainValidationError("El cursor de paginación no es válido")
+
+        # bool es subclase de int: se descarta explícitamente
+        if isinstance(value, bool) or not isinstance(value, _VALUE_TYPES[sort_by]):
+            raise DomainValidationError("El cursor de paginación no es válido")
+
+        if filters is not None and not isinstance(filters, str):
+            raise DomainValidationError("El cursor de paginación no es válido")
+
+        if sort_by in _DATETIME_FIELDS:
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                raise DomainValidationError("El cursor de paginación no es válido")
+
+        return cls(
+            sort_by=sort_by, sort_order=sort_order, value=value, id=case_id, filters=filters
+        )
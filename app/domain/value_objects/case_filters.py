@@ -0,0 +1,21 @@
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class CaseFilters:
+    """Filtros del listado de casos, compartidos por el listado y sus agregados"""
+
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    case_type: Optional[str] = None
+    created_by: Optional[str] = None
+    search: Optional[str] = None
+    match: Optional[str] = None
+    date_gte: Optional[datetime] = None
+    date_lte: Optional[datetime] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Filtros como kwargs (p. ej. para CaseRepository.get_all)"""
+        return asdict(self)
@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from app.domain.entities.case import CaseQuery
+from app.domain.exceptions import DomainValidationError
+
+
+@dataclass(frozen=True)
+class QueryCursor:
+    """
+    Posición en las queries de un caso para paginación keyset.
+
+    Las queries se recorren por (executed_at, id) ascendente; el id desempata
+    queries ejecutadas en el mismo instante. `filters` es la huella del caso y
+    los filtros que generaron el cursor (ver filters_fingerprint).
+    """
+
+    executed_at: datetime
+    id: UUID
+    filters: Optional[str] = None
+
+    @classmethod
+    def after(cls, query: CaseQuery, filters: Optional[str] = None) -> "QueryCursor":
+        """Cursor que continúa después de `query`"""
+        return cls(executed_at=query.executed_at, id=query.id, filters=filters)
+
+    def encode(self) -> str:
+        """Serializa el cursor como token opaco (base64 url-safe)"""
+        payload = {"t": self.executed_at.isoformat(), "id": str(self.id)}
+        if self.filters is not None:
+            payload["f"] = self.filters
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "QueryCursor":
+        """Reconstruye un cursor a partir del token opaco"""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            executed_at = datetime.fromisoformat(payload["t"])
+            query_id = UUID(payload["id"])
+            filters = payload.get("f")
+        except (binascii.Error, ValueError, TypeError, KeyError, UnicodeError):
+            raise DomainValidationError("El cursor de paginación no es válido")
+
+        if filters is not None and not isinstance(filters, str):
+            raise DomainValidationError("El cursor de paginación no es válido")
+
+        return cls(executed_at=executed_at, id=query_id, filters=filters)
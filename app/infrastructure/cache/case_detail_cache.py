@@ -0,0 +1,78 @@
+import sys
+from dataclasses import replace
+from typing import Optional
+from uuid import UUID
+from app.application.interfaces.case_detail_cache import CaseDetailCache
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.infrastructure.cache.lru_cache import MISSING, CacheStats, TTLLRUCache
+
+# Costo fijo aproximado de cada objeto (dataclass, UUID, datetimes, enums)
+_CASE_OVERHEAD_BYTES = 1024
+_QUERY_OVERHEAD_BYTES = 512
+
+
+def _text_size(value: Optional[str]) -> int:
+    return sys.getsizeof(value) if value else 0
+
+
+def _query_size(query: CaseQuery) -> int:
+    return (
+        _QUERY_OVERHEAD_BYTES
+        + _text_size(query.database_name)
+        + _text_size(query.schema_name)
+        + _text_size(query.query_text)
+        + _text_size(query.executed_by)
+    )
+
+
+def estimate_case_size(case: SupportCase) -> int:
+    """
+    Bytes aproximados que ocupa un caso con sus queries.
+
+    Domina el texto (título, descripción y SQL de las queries); el resto se
+    cuenta como un costo fijo por objeto. Alcanza para acotar la memoria del
+    cache sin recorrer el grafo de objetos.
+    """
+    return (
+        _CASE_OVERHEAD_BYTES
+        + _text_size(case.title)
+        + _text_size(case.description)
+        + _text_size(case.created_by)
+        + sum(_query_size(query) for query in case.queries)
+    )
+
+
+class LRUCaseDetailCache(CaseDetailCache):
+    """
+    Cache de detalle sobre TTLLRUCache, acotado en entradas y en bytes.
+
+    Los casos y sus queries solo se insertan, así que una entrada deja de ser
+    válida únicamente cuando se agregan queries al caso (invalidate). Una
+    lectura que empezó antes de una invalidación no guarda su resultado.
+    """
+
+    def __init__(self, cache: TTLLRUCache):
+        self._cache = cache
+        self._generation = 0
+
+    def get(self, case_id: UUID) -> Optional[SupportCase]:
+        case = self._cache.get(case_id)
+        if case is MISSING:
+            return None
+        # Copia superficial: el llamador puede reasignar la lista de queries
+        return replace(case, queries=list(case.queries))
+
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, case: SupportCase, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._cache.set(case.id, replace(case, queries=list(case.queries)))
+
+    def invalidate(self, case_id: UUID) -> None:
+        self._generation += 1
+        self._cache.delete(case_id)
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
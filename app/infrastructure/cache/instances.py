@@ -0,0 +1,26 @@
+"""Instancias de cache compartidas por el proceso (evita imports circulares)"""
+from app.config import settings
+from app.infrastructure.cache.case_detail_cache import LRUCaseDetailCache, estimate_case_size
+from app.infrastructure.cache.lru_cache import TTLLRUCache
+
+# Totales del listado de casos, por firma de filtros
+count_cache = TTLLRUCache(
+    max_entries=settings.COUNT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS,
+)
+
+# Facetas del listado (status/priority/case_type), por firma de filtros
+facets_cache = TTLLRUCache(
+    max_entries=settings.FACETS_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.FACETS_CACHE_TTL_SECONDS,
+)
+
+# Detalle de casos con sus queries, acotado en entradas y en bytes
+case_detail_cache = LRUCaseDetailCache(
+    TTLLRUCache(
+        max_entries=settings.CASE_DETAIL_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.CASE_DETAIL_CACHE_TTL_SECONDS,
+        max_bytes=settings.CASE_DETAIL_CACHE_MAX_BYTES,
+        size_of=estimate_case_size,
+    )
+)
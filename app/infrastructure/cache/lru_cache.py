@@ -0,0 +1,133 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+# Marca de "no encontrado" (None es un valor cacheable)
+MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Contadores de uso de un cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+    bytes: int = 0  # Tamaño estimado (solo si el cache mide sus entradas)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLLRUCache:
+    """
+    Cache en memoria con TTL, desalojo LRU, máximo de entradas y,
+    opcionalmente, máximo de bytes (estimados con `size_of`).
+
+    Cada entrada guarda la versión de datos con la que se calculó (la marca de
+    agua data_version_seq) y deja de ser válida cuando se la consulta con otra
+    versión (invalidación por escritura sin recorrer las claves). No es
+    thread-safe: pensado para el event loop de asyncio.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        max_bytes: int = 0,
+        size_of: Optional[Callable[[Any], int]] = None,
+    ):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._max_bytes = max_bytes  # 0: sin límite de bytes
+        self._size_of = size_of
+        # clave -> (valor, vencimiento, versión, bytes estimados)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, int, int]]" = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl_seconds > 0
+
+    def get(self, key: Hashable, version: int = 0) -> Any:
+        """Retorna el valor cacheado para la versión de datos `version` o MISSING"""
+        if not self.enabled:
+            return MISSING
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return MISSING
+
+        value, expires_at, entry_version, _ = entry
+        if expires_at <= self._clock() or entry_version != version:
+            self._remove(key)
+            self._stats.invalidations += 1
+            self._stats.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, version: int = 0) -> None:
+        """
+        Guarda un valor calculado con la versión de datos `version`.
+
+        La versión debe leerse antes de calcular el valor: si una escritura la
+        avanza mientras tanto, la entrada nace ya vencida en lugar de quedar
+        marcada como vigente con datos viejos.
+        """
+        if not self.enabled:
+            return
+
+        size = self._size_of(value) if self._size_of else 0
+        self._remove(key)
+        if self._max_bytes and size > self._max_bytes:
+            # Más grande que todo el cache: no se guarda
+            return
+
+        self._entries[key] = (value, self._clock() + self._ttl_seconds, version, size)
+        self._bytes += size
+        while len(self._entries) > self._max_entries or (
+            self._max_bytes and self._bytes > self._max_bytes
+        ):
+            _, (_, _, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self._stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Descarta la entrada de `key` si existe (cuenta como invalidación)"""
+        if self._remove(key):
+            self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Elimina todas las entradas (los contadores se conservan)"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Snapshot de los contadores"""
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            invalidations=self._stats.invalidations,
+            size=len(self._entries),
+            bytes=self._bytes,
+        )
+
+    def _remove(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[3]
+        return True
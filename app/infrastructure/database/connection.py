@@ -1,11 +1,84 @@
 import asyncpg
+import time
+from collections import OrderedDict
 from typing import Optional, List, Any
 from app.config import settings
+from app.infrastructure.database.query_builder import hot_statements
+from app.infrastructure.database.statement_stats import statement_stats
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class InstrumentedConnection(asyncpg.Connection):
+    """
+    Conexión que instrumenta las consultas de forma canónica (ver query_builder).
+
+    Las sentencias viven en el cache propio de asyncpg (statement_cache_size,
+    por conexión y válido entre acquire/release); el texto canónico hace que
+    cada forma se prepare una sola vez por conexión. Esta clase solo lleva la
+    cuenta de qué formas ya preparó, para separar en statement_stats el
+    tiempo de parse/plan del de ejecución.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Formas preparadas en esta conexión; mismo tamaño y política LRU que el cache de asyncpg
+        self._prepared_shapes: "OrderedDict[str, str]" = OrderedDict()
+
+    async def prepare_shape(self, shape: str, query: str) -> None:
+        """Prepara `query` en el cache de sentencias de la conexión si aún no lo está"""
+        if query in self._prepared_shapes:
+            self._prepared_shapes.move_to_end(query)
+            return
+
+        started = time.perf_counter()
+        # A diferencia de prepare(), _prepare(use_cache=True) deja la sentencia en el
+        # cache de asyncpg, el mismo que usan fetch()/fetchval()
+        await self._prepare(query, use_cache=True)
+        statement_stats.record_prepare(shape, time.perf_counter() - started)
+
+        self._prepared_shapes[query] = shape
+        while len(self._prepared_shapes) > settings.DB_STATEMENT_CACHE_SIZE:
+            self._prepared_shapes.popitem(last=False)
+
+    async def fetch_shape(self, shape: str, query: str, *args) -> List[asyncpg.Record]:
+        """Ejecuta `query` (preparada una vez por conexión) y registra el tiempo"""
+        await self.prepare_shape(shape, query)
+        started = time.perf_counter()
+        # Si el esquema cambió, asyncpg vuelve a preparar la sentencia por su cuenta
+        rows = await self.fetch(query, *args)
+        statement_stats.record_execute(shape, time.perf_counter() - started)
+        return rows
+
+
+async def _init_connection(connection: InstrumentedConnection) -> None:
+    """
+    Prepara las formas frecuentes del listado en cada conexión nueva del pool.
+
+    Se paga al abrir cada conexión (también al reciclarla por max_queries);
+    con las formas de HOT_LISTING_SHAPES son unos pocos milisegundos, que se
+    registran en el log y en statement_stats. PREPARE_HOT_LISTING_SHAPES=false
+    lo desactiva y las formas se preparan en su primer uso.
+    """
+    if not settings.PREPARE_HOT_LISTING_SHAPES:
+        return
+    started = time.perf_counter()
+    try:
+        # prepare() deja abierta una transacción implícita (con sus locks) hasta la
+        # próxima consulta; el bloque de transacción la cierra al terminar
+        async with connection.transaction():
+            for shape, query in hot_statements():
+                await connection.prepare_shape(shape, query)
+    except asyncpg.PostgresError as e:
+        # Sin migraciones aplicadas las formas no compilan; se preparan al usarse
+        logger.warning(f"Could not pre-prepare listing statements: {e}")
+        return
+    logger.debug(
+        f"Pre-prepared listing statements in {(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+
+
 class DatabaseConnection:
     """Gestiona el pool de conexiones a PostgreSQL"""
 
@@ -21,11 +94,14 @@ class DatabaseConnection:
                 user=settings.DB_USER,
                 password=settings.DB_PASSWORD,
                 database=settings.DB_NAME,
-                min_size=2,  # Reduced for development
-                max_size=10,  # Reduced for development
+                min_size=settings.DB_POOL_MIN_SIZE,
+                max_size=settings.DB_POOL_MAX_SIZE,
                 command_timeout=60,
                 max_queries=50000,
                 max_inactive_connection_lifetime=300,
+                statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+                connection_class=InstrumentedConnection,
+                init=_init_connection,
             )
             logger.info(
                 f"Database connection pool created successfully "
@@ -58,6 +134,13 @@ class DatabaseConnection:
         async with self._pool.acquire() as conn:
             return await conn.fetch(query, *args)
 
+    async def fetch_shape(self, shape: str, query: str, *args) -> List[asyncpg.Record]:
+        """Ejecuta una consulta de forma canónica con sentencia preparada e instrumentada"""
+        if not self._pool:
+            raise RuntimeError("Database pool not initialized")
+        async with self._pool.acquire() as conn:
+            return await conn.fetch_shape(shape, query, *args)
+
     async def fetchrow(self, query: str, *args) -> Optional[asyncpg.Record]:
         """Ejecuta query que retorna un registro"""
         if not self._pool:
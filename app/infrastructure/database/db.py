@@ -1,5 +1,15 @@
 """Database instance module to avoid circular imports"""
+from app.config import settings
 from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.write_coalescer import GroupCommitCaseWriter
 
 # Global database connection instance
 db = DatabaseConnection()
+
+# Group commit de altas de casos (se usa si CREATE_CASE_GROUP_COMMIT está activo)
+case_write_coalescer = GroupCommitCaseWriter(
+    CaseRepositoryImpl(db),
+    window_seconds=settings.CREATE_CASE_GROUP_COMMIT_WINDOW_MS / 1000,
+    max_batch=settings.CREATE_CASE_GROUP_COMMIT_MAX_BATCH,
+)
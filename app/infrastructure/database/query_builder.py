@@ -0,0 +1,285 @@
+"""
+Formas canónicas de las consultas del listado de casos.
+
+El texto SQL del listado depende solo de qué filtros vienen (máscara de bits),
+del modo de coincidencia, del orden, de si hay cursor keyset y de la
+proyección; nunca de los valores, que viajan como parámetros. Cada forma se
+compila una vez (memoizada) y su nombre identifica la sentencia preparada y
+sus métricas.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+from app.domain.repositories.case_repository import CASE_LIST_FIELDS
+
+# Configuración de búsqueda full-text; debe coincidir con la columna generada
+# search_vector (migrations/003_full_text_search.sql)
+SEARCH_TEXT_CONFIG = "spanish"
+
+# Filtros del listado en el orden de sus parámetros; el bit i corresponde a FILTER_FIELDS[i]
+FILTER_FIELDS = (
+    "status",
+    "priority",
+    "case_type",
+    "created_by",
+    "search",
+    "date_gte",
+    "date_lte",
+)
+
+# Filtros cuyo SQL cambia con el modo de coincidencia
+_MATCH_FIELDS_MASK = (1 << FILTER_FIELDS.index("created_by")) | (
+    1 << FILTER_FIELDS.index("search")
+)
+
+
+def _like_pattern(term: str) -> str:
+    """Patrón ILIKE '%term%' escapando los comodines del término"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def filter_mask(**values: Any) -> int:
+    """Máscara de bits de los filtros con valor (los vacíos no filtran)"""
+    mask = 0
+    for bit, name in enumerate(FILTER_FIELDS):
+        if values.get(name):
+            mask |= 1 << bit
+    return mask
+
+
+def filter_params(
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    case_type: Optional[str] = None,
+    created_by: Optional[str] = None,
+    search: Optional[str] = None,
+    date_gte: Optional[datetime] = None,
+    date_lte: Optional[datetime] = None,
+    match: Optional[str] = None,
+) -> List[Any]:
+    """Parámetros ($1..$n) de los filtros con valor, en el orden de FILTER_FIELDS"""
+    params: List[Any] = []
+    for name, value in (
+        ("status", status),
+        ("priority", priority),
+        ("case_type", case_type),
+        ("created_by", created_by),
+        ("search", search),
+        ("date_gte", date_gte),
+        ("date_lte", date_lte),
+    ):
+        if not value:
+            continue
+        if name in ("created_by", "search") and match == "substring":
+            value = _like_pattern(value)
+        params.append(value)
+    return params
+
+
+def normalize_match(mask: int, match: Optional[str]) -> Optional[str]:
+    """El modo de coincidencia solo distingue formas si hay created_by o search"""
+    return match if mask & _MATCH_FIELDS_MASK else None
+
+
+@lru_cache(maxsize=256)
+def compile_where(mask: int, match: Optional[str]) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """
+    Condiciones WHERE de una máscara de filtros.
+
+    Returns:
+        Tuple con las condiciones (parámetros numerados desde $1 en el orden de
+        FILTER_FIELDS) y la expresión de relevancia (None si no hay búsqueda)
+    """
+    conditions = []
+    param_idx = 1
+    rank_sql = None
+
+    for bit, name in enumerate(FILTER_FIELDS):
+        if not mask & (1 << bit):
+            continue
+
+        if name in ("status", "priority", "case_type"):
+            conditions.append(f"{name} = ${param_idx}")
+        elif name == "created_by":
+            # substring/fuzzy usan el índice trigram de created_by
+            if match == "substring":
+                conditions.append(f"created_by ILIKE ${param_idx}")
+            elif match == "fuzzy":
+                conditions.append(f"${param_idx} <% created_by")
+            else:
+                conditions.append(f"created_by = ${param_idx}")
+        elif name == "search":
+            if match == "substring":
+                # Fragmentos literales; el índice trigram resuelve el '%x%'
+                conditions.append(f"(title ILIKE ${param_idx} OR description ILIKE ${param_idx})")
+            elif match == "fuzzy":
+                # Tolerante a errores de tipeo (umbral pg_trgm.word_similarity_threshold)
+                conditions.append(f"(${param_idx} <% title OR ${param_idx} <% description)")
+            else:
+                # Full-text sobre la columna generada search_vector (índice GIN)
+                search_query_sql = f"websearch_to_tsquery('{SEARCH_TEXT_CONFIG}', ${param_idx})"
+                conditions.append(f"search_vector @@ {search_query_sql}")
+                rank_sql = f"ts_rank_cd(search_vector, {search_query_sql})"
+
+            if rank_sql is None:
+                # Los comodines del patrón no generan trigramas: no alteran la similitud
+                rank_sql = (
+                    f"GREATEST(word_similarity(${param_idx}, title), "
+                    f"word_similarity(${param_idx}, coalesce(description, '')))"
+                )
+        elif name == "date_gte":
+            conditions.append(f"created_at >= ${param_idx}")
+        elif name == "date_lte":
+            conditions.append(f"created_at <= ${param_idx}")
+
+        param_idx += 1
+
+    return tuple(conditions), rank_sql
+
+
+@dataclass(frozen=True)
+class ListingShape:
+    """Forma de una consulta del listado: todo lo que cambia su texto SQL"""
+
+    mask: int
+    match: Optional[str]
+    sort_by: str
+    sort_order: str  # "ASC" o "DESC"
+    keyset: bool
+    fields: Optional[Tuple[str, ...]]  # None: todas las columnas
+
+    @classmethod
+    def create(
+        cls,
+        mask: int,
+        match: Optional[str],
+        sort_by: str,
+        sort_order: str,
+        keyset: bool,
+        fields: Optional[Sequence[str]] = None,
+    ) -> "ListingShape":
+        """Normaliza los componentes para que formas equivalentes sean iguales"""
+        columns = None
+        if fields is not None:
+            # Orden fijo de CASE_LIST_FIELDS e id siempre incluido
+            columns = tuple(c for c in CASE_LIST_FIELDS if c == "id" or c in fields)
+        return cls(
+            mask=mask,
+            match=normalize_match(mask, match),
+            sort_by=sort_by,
+            sort_order="DESC" if sort_order.upper() == "DESC" else "ASC",
+            keyset=keyset,
+            fields=columns,
+        )
+
+    @property
+    def filters_name(self) -> str:
+        """Filtros de la forma, p. ej. "status+search~fuzzy" ("all" sin filtros)"""
+        names = [name for bit, name in enumerate(FILTER_FIELDS) if self.mask & (1 << bit)]
+        name = "+".join(names) or "all"
+        return f"{name}~{self.match}" if self.match else name
+
+    @property
+    def name(self) -> str:
+        """Nombre estable de la forma, usado como clave de métricas"""
+        parts = [
+            f"list:{self.filters_name}",
+            f"{self.sort_by}:{self.sort_order.lower()}",
+            "keyset" if self.keyset else "offset",
+        ]
+        if self.fields is not None:
+            parts.append("cols=" + ",".join(self.fields))
+        return "|".join(parts)
+
+    @property
+    def count_name(self) -> str:
+        """Nombre de la consulta de total (no depende del orden ni de la proyección)"""
+        return f"count:{self.filters_name}"
+
+
+@dataclass(frozen=True)
+class CompiledListing:
+    """SQL de una forma del listado; los parámetros de página siguen a los de filtros"""
+
+    where_clause: str
+    data_sql: str
+    count_sql: str
+    filter_param_count: int
+
+
+@lru_cache(maxsize=1024)
+def compile_listing(shape: ListingShape) -> CompiledListing:
+    """
+    Compila (una vez por forma) la consulta de datos y la de total.
+
+    Parámetros de la consulta de datos: los de filter_params, luego
+    (valor, id) del cursor si es keyset, y LIMIT (más OFFSET sin cursor).
+    """
+    conditions, rank_sql = compile_where(shape.mask, shape.match)
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    param_idx = len(conditions) + 1
+
+    sort_expr = rank_sql if shape.sort_by == "relevance" else shape.sort_by
+    order = shape.sort_order
+
+    if shape.keyset:
+        comparator = "<" if order == "DESC" else ">"
+        keyset_condition = f"({sort_expr}, id) {comparator} (${param_idx}, ${param_idx + 1})"
+        data_where = f"{where_clause} AND {keyset_condition}"
+        page_clause = f"LIMIT ${param_idx + 2}"
+    else:
+        data_where = where_clause
+        page_clause = f"LIMIT ${param_idx} OFFSET ${param_idx + 1}"
+
+    select_list = ", ".join(shape.fields if shape.fields is not None else CASE_LIST_FIELDS)
+
+    # page_size + 1 filas para saber si hay más
+    data_sql = (
+        f"SELECT {select_list}, {sort_expr} AS sort_value "
+        f"FROM support_cases WHERE {data_where} "
+        f"ORDER BY sort_value {order}, id {order} {page_clause}"
+    )
+    count_sql = f"SELECT COUNT(*) FROM support_cases WHERE {where_clause}"
+
+    return CompiledListing(
+        where_clause=where_clause,
+        data_sql=data_sql,
+        count_sql=count_sql,
+        filter_param_count=len(conditions),
+    )
+
+
+def query_text_preview_sql(column: str, param_idx: int, alias: str = "query_text") -> str:
+    """
+    Columnas de vista previa de `column`: los primeros $param_idx caracteres
+    y el tamaño total en bytes.
+
+    left() solo descomprime el prefijo del valor TOAST y octet_length lee el
+    tamaño del encabezado, así que el texto completo nunca se lee.
+    """
+    return (
+        f"left({column}, ${param_idx}) AS {alias}, "
+        f"octet_length({column}) AS {alias}_bytes"
+    )
+
+
+# Formas más frecuentes, preparadas al abrir cada conexión del pool: listado
+# inicial, scroll infinito, filtro por estado y búsqueda por relevancia
+HOT_LISTING_SHAPES = (
+    ListingShape.create(0, None, "created_at", "DESC", keyset=False),
+    ListingShape.create(0, None, "created_at", "DESC", keyset=True),
+    ListingShape.create(filter_mask(status=True), None, "created_at", "DESC", keyset=False),
+    ListingShape.create(filter_mask(search=True), None, "relevance", "DESC", keyset=False),
+)
+
+
+def hot_statements() -> List[Tuple[str, str]]:
+    """(nombre, SQL) de las consultas de datos y total de las formas frecuentes"""
+    statements = {}
+    for shape in HOT_LISTING_SHAPES:
+        compiled = compile_listing(shape)
+        statements[shape.name] = compiled.data_sql
+        statements[shape.count_name] = compiled.count_sql
+    return list(statements.items())
@@ -0,0 +1,34 @@
+"""
+Textos SQL direccionados por contenido (tabla query_texts, migración 010).
+
+case_queries guarda solo query_text_hash, el sha256 del texto en UTF-8; el
+texto se guarda una vez por hash y se lee con la vista
+case_queries_with_text. La normalización la aplica el dominio
+(CaseQuery.create): aquí el hash es del texto tal cual se guarda.
+"""
+import hashlib
+from typing import List, Tuple
+
+# Upsert de un lote de textos: ($1 hashes, $2 textos) de text_arrays
+UPSERT_QUERY_TEXTS_SQL = """
+    INSERT INTO query_texts (hash, query_text)
+    SELECT * FROM unnest($1::bytea[], $2::text[])
+    ON CONFLICT (hash) DO NOTHING
+"""
+
+
+def query_text_hash(query_text: str) -> bytes:
+    """Clave de `query_text` en query_texts (coincide con sha256(convert_to(.., 'UTF8')))"""
+    return hashlib.sha256(query_text.encode("utf-8")).digest()
+
+
+def text_arrays(hashes: List[bytes], texts: List[str]) -> Tuple[List[bytes], List[str]]:
+    """
+    Pares (hash, texto) de las filas sin repetir, para UPSERT_QUERY_TEXTS_SQL.
+
+    Ordenados por hash: lotes concurrentes con textos en común toman los
+    bloqueos del índice en el mismo orden y no se bloquean mutuamente.
+    """
+    unique = dict(zip(hashes, texts))
+    ordered = sorted(unique)
+    return ordered, [unique[text_hash] for text_hash in ordered]
@@ -1,22 +1,60 @@
 from uuid import UUID
-from typing import Optional, List, Tuple
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
 from datetime import datetime
+import asyncio
+import json
 import asyncpg
-from app.domain.entities.case import SupportCase
-from app.domain.repositories.case_repository import CaseRepository
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.repositories.case_repository import (
+    CASE_LIST_FIELDS,
+    CaseFacets,
+    CasePage,
+    CaseRepository,
+)
+from app.domain.value_objects.case_cursor import CaseCursor, normalize_sort_by
+from app.domain.value_objects.case_filters import CaseFilters
 from app.domain.value_objects.case_status import CaseStatus
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
+from app.infrastructure.cache.lru_cache import MISSING, TTLLRUCache
 from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
+from app.infrastructure.database.query_builder import (
+    ListingShape,
+    compile_listing,
+    compile_where,
+    filter_mask,
+    filter_params,
+    normalize_match,
+    query_text_preview_sql,
+)
+from app.infrastructure.database.query_texts import query_text_hash, text_arrays
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Faceta de cada fila según GROUPING(status, priority, case_type): el bit de la
+# columna agrupada vale 0; el grouping set vacío (total) da 0b111
+_FACET_GROUPING = {0b011: "status", 0b101: "priority", 0b110: "case_type"}
+
+# Por debajo de este total estimado se hace el COUNT(*) exacto
+ESTIMATED_COUNT_EXACT_THRESHOLD = 10_000
+
 
 class CaseRepositoryImpl(CaseRepository):
-    def __init__(self, db: DatabaseConnection, connection: Optional[asyncpg.Connection] = None):
+    def __init__(
+        self,
+        db: DatabaseConnection,
+        connection: Optional[asyncpg.Connection] = None,
+        count_cache: Optional[TTLLRUCache] = None,
+        facets_cache: Optional[TTLLRUCache] = None,
+    ):
         self._db = db
         self._connection = connection  # Conexión de transacción si está disponible
+        self._count_cache = count_cache  # Totales del listado por firma de filtros
+        self._facets_cache = facets_cache  # Facetas por firma de filtros
 
     async def save(self, case: SupportCase) -> None:
         """Guarda un caso (solo INSERT)"""
@@ -58,12 +96,142 @@ class CaseRepositoryImpl(CaseRepository):
             )
         logger.debug(f"Case saved: {case.id}")
 
+    async def create_with_queries(self, case: SupportCase) -> None:
+        """Guarda un caso nuevo y todas sus queries en una sola sentencia"""
+        await self.create_many_with_queries([case])
+
+    async def create_many_with_queries(self, cases: List[SupportCase]) -> None:
+        """
+        Guarda casos nuevos y todas sus queries en una sola sentencia.
+
+        CTE que modifica datos: el upsert de los textos en query_texts, el
+        INSERT de los casos (ya con su queries_count) y el de las queries,
+        todos desde arrays por columna (unnest), viajan juntos, así que es un
+        round-trip y es atómico sin BEGIN/COMMIT. Las FK de case_queries se
+        verifican al final de la sentencia, con casos y textos ya insertados.
+        """
+        if not cases:
+            return
+
+        query = """
+            WITH new_cases AS (
+                INSERT INTO support_cases (
+                    id, title, description, case_type, priority,
+                    status, created_by, created_at, updated_at, queries_count
+                )
+                SELECT * FROM unnest(
+                    $1::uuid[], $2::varchar[], $3::text[], $4::varchar[], $5::varchar[],
+                    $6::varchar[], $7::varchar[], $8::timestamp[], $9::timestamp[], $10::int[]
+                )
+                RETURNING id
+            ),
+            texts AS (
+                INSERT INTO query_texts (hash, query_text)
+                SELECT * FROM unnest($20::bytea[], $21::text[])
+                ON CONFLICT (hash) DO NOTHING
+            )
+            INSERT INTO case_queries (
+                id, case_id, database_name, schema_name, query_text_hash,
+                execution_time_ms, rows_affected, executed_at, executed_by
+            )
+            SELECT * FROM unnest(
+                $11::uuid[], $12::uuid[], $13::varchar[], $14::varchar[], $15::bytea[],
+                $16::int[], $17::int[], $18::timestamp[], $19::varchar[]
+            )
+        """
+        queries = [query for case in cases for query in case.queries]
+        hashes = [query_text_hash(q.query_text) for q in queries]
+        args = (
+            [case.id for case in cases],
+            [case.title for case in cases],
+            [case.description for case in cases],
+            [case.case_type.value for case in cases],
+            [case.priority.value for case in cases],
+            [case.status.value for case in cases],
+            [case.created_by for case in cases],
+            [case.created_at for case in cases],
+            [case.updated_at for case in cases],
+            [len(case.queries) for case in cases],
+            [q.id for q in queries],
+            [q.case_id for q in queries],
+            [q.database_name for q in queries],
+            [q.schema_name for q in queries],
+            hashes,
+            [q.execution_time_ms for q in queries],
+            [q.rows_affected for q in queries],
+            [q.executed_at for q in queries],
+            [q.executed_by for q in queries],
+            *text_arrays(hashes, [q.query_text for q in queries]),
+        )
+
+        if self._connection:
+            await self._connection.execute(query, *args)
+        else:
+            # Misma conexión para la sentencia y la marca de agua: un solo reset del pool
+            async with self._db.transaction() as connection:
+                await connection.execute(query, *args)
+                # Autocommit: ya confirmada, avanzar aquí la marca de agua
+                await DataVersionRepositoryImpl(self._db, connection).bump()
+        logger.debug(f"{len(cases)} cases saved with {len(queries)} queries in one statement")
+
+    async def save_many(self, cases: List[SupportCase]) -> None:
+        """
+        Guarda varios casos con un COPY (solo INSERT), con su queries_count.
+
+        Un solo flujo de datos en lugar de un INSERT por caso; pensado para la
+        importación masiva, donde las queries se guardan después con
+        QueryRepositoryImpl.save_many(update_counts=False).
+        """
+        if not cases:
+            return
+
+        records = [
+            (
+                case.id,
+                case.title,
+                case.description,
+                case.case_type.value,
+                case.priority.value,
+                case.status.value,
+                case.created_by,
+                case.created_at,
+                case.updated_at,
+                case.queries_count,
+            )
+            for case in cases
+        ]
+        columns = (
+            "id",
+            "title",
+            "description",
+            "case_type",
+            "priority",
+            "status",
+            "created_by",
+            "created_at",
+            "updated_at",
+            "queries_count",
+        )
+
+        if self._connection:
+            await self._connection.copy_records_to_table(
+                "support_cases", records=records, columns=columns
+            )
+        else:
+            async with self._db.transaction() as connection:
+                await connection.copy_records_to_table(
+                    "support_cases", records=records, columns=columns
+                )
+            # Confirmada fuera del Unit of Work: avanzar aquí la marca de agua
+            await DataVersionRepositoryImpl(self._db).bump()
+        logger.debug(f"Saved {len(cases)} cases in batch")
+
     async def get_by_id(self, case_id: UUID) -> Optional[SupportCase]:
         """Obtiene un caso por ID"""
         query = """
             SELECT
                 id, title, description, case_type, priority,
-                status, created_by, created_at, updated_at
+                status, created_by, created_at, updated_at, queries_count
             FROM support_cases
             WHERE id = $1
         """
@@ -78,6 +246,100 @@ class CaseRepositoryImpl(CaseRepository):
 
         return self._map_to_entity(row)
 
+    async def get_with_queries(
+        self,
+        case_id: UUID,
+        queries_limit: Optional[int] = None,
+        preview_chars: Optional[int] = None,
+    ) -> Optional[SupportCase]:
+        """
+        Obtiene un caso con sus queries en un solo round-trip.
+
+        LEFT JOIN: una fila por query (o una sola con columnas q_* nulas si el
+        caso no tiene queries). Repetir las columnas del caso en cada fila
+        cuesta menos que una segunda ida y vuelta a la DB. Con `queries_limit`
+        el join es LATERAL con LIMIT: un rango acotado del índice
+        (case_id, executed_at, id) en lugar de todas las queries del caso.
+        Con `preview_chars` el texto completo de las queries no se lee.
+        """
+        params: List[object] = [case_id]
+        if queries_limit is None:
+            queries_source = "case_queries_with_text q ON q.case_id = sc.id"
+        else:
+            params.append(queries_limit)
+            queries_source = f"""LATERAL (
+                SELECT * FROM case_queries_with_text
+                WHERE case_id = sc.id
+                ORDER BY executed_at ASC, id ASC
+                LIMIT ${len(params)}
+            ) q ON true"""
+
+        text_columns = "q.query_text AS q_query_text"
+        if preview_chars is not None:
+            params.append(preview_chars)
+            text_columns = query_text_preview_sql("q.query_text", len(params), "q_query_text")
+
+        query = f"""
+            SELECT
+                sc.id, sc.title, sc.description, sc.case_type, sc.priority,
+                sc.status, sc.created_by, sc.created_at, sc.updated_at, sc.queries_count,
+                q.id AS q_id, q.database_name AS q_database_name,
+                q.schema_name AS q_schema_name, {text_columns},
+                q.execution_time_ms AS q_execution_time_ms,
+                q.rows_affected AS q_rows_affected, q.executed_at AS q_executed_at,
+                q.executed_by AS q_executed_by
+            FROM support_cases sc
+            LEFT JOIN {queries_source}
+            WHERE sc.id = $1
+            ORDER BY q.executed_at ASC, q.id ASC
+        """
+
+        if self._connection:
+            rows = await self._connection.fetch(query, *params)
+        else:
+            rows = await self._db.fetch(query, *params)
+
+        if not rows:
+            return None
+
+        case = self._map_to_entity(rows[0])
+        case.queries = [self._map_joined_query(row) for row in rows if row["q_id"] is not None]
+        return case
+
+    async def get_many(self, case_ids: List[UUID]) -> List[SupportCase]:
+        """Obtiene varios casos por ID (lookup por PK); el orden no está garantizado"""
+        if not case_ids:
+            return []
+
+        query = """
+            SELECT
+                id, title, description, case_type, priority,
+                status, created_by, created_at, updated_at, queries_count
+            FROM support_cases
+            WHERE id = ANY($1::uuid[])
+        """
+
+        if self._connection:
+            rows = await self._connection.fetch(query, case_ids)
+        else:
+            rows = await self._db.fetch(query, case_ids)
+
+        return [self._map_to_entity(row) for row in rows]
+
+    async def get_revision(self, case_id: UUID) -> Optional[Tuple[datetime, int]]:
+        """Obtiene (updated_at, queries_count) de un caso (lookup por PK, sin queries)"""
+        query = "SELECT updated_at, queries_count FROM support_cases WHERE id = $1"
+
+        if self._connection:
+            row = await self._connection.fetchrow(query, case_id)
+        else:
+            row = await self._db.fetchrow(query, case_id)
+
+        if not row:
+            return None
+
+        return row["updated_at"], row["queries_count"]
+
     async def get_all(
         self,
         status: Optional[str] = None,
@@ -91,101 +353,425 @@ class CaseRepositoryImpl(CaseRepository):
         sort_order: str = "desc",
         page: int = 1,
         page_size: int = 10,
-    ) -> Tuple[List[SupportCase], int]:
-        """Obtiene casos con filtros y paginación"""
-        offset = (page - 1) * page_size
-        conditions = []
-        params = []
-        param_idx = 1
-
-        # Construir condiciones dinámicamente
-        if status:
-            conditions.append(f"status = ${param_idx}")
-            params.append(status)
-            param_idx += 1
-
-        if priority:
-            conditions.append(f"priority = ${param_idx}")
-            params.append(priority)
-            param_idx += 1
-
-        if case_type:
-            conditions.append(f"case_type = ${param_idx}")
-            params.append(case_type)
-            param_idx += 1
-
-        if created_by:
-            conditions.append(f"created_by = ${param_idx}")
-            params.append(created_by)
-            param_idx += 1
-
-        if search:
-            conditions.append(f"(title ILIKE ${param_idx} OR description ILIKE ${param_idx})")
-            search_term = f"%{search}%"
-            params.append(search_term)
-            param_idx += 1
-
-        if date_gte:
-            conditions.append(f"created_at >= ${param_idx}")
-            params.append(date_gte)
-            param_idx += 1
-
-        if date_lte:
-            conditions.append(f"created_at <= ${param_idx}")
-            params.append(date_lte)
-            param_idx += 1
+        cursor: Optional[CaseCursor] = None,
+        count_mode: str = "exact",
+        match: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> CasePage:
+        """
+        Obtiene casos con filtros y paginación.
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        `search` usa full-text (websearch_to_tsquery) y habilita sort_by="relevance".
+        Con match="substring" o "fuzzy", `search` y `created_by` usan los índices
+        trigram (fragmentos con ILIKE o similitud de palabras) y la relevancia es
+        la similitud trigram.
+        Sin cursor pagina con LIMIT/OFFSET. Con cursor usa paginación keyset
+        sobre (sort_by, id): el costo de la página N es el mismo que el de la
+        primera porque no hay filas descartadas por OFFSET.
+
+        count_mode controla el total: "exact" (COUNT(*) en paralelo a los datos),
+        "estimated" (estadísticas de PostgreSQL) o "none" (sin total, solo has_more).
+        Con count_cache el total se reutiliza entre requests con los mismos filtros.
+
+        `fields` reduce la lista del SELECT (id siempre va: es el desempate del
+        orden y del cursor). Una proyección angosta, cubierta por un índice
+        compuesto (p. ej. status, created_at, id), permite un Index Only Scan.
+        """
+        filter_values = dict(
+            status=status,
+            priority=priority,
+            case_type=case_type,
+            created_by=created_by,
+            search=search,
+            date_gte=date_gte,
+            date_lte=date_lte,
+        )
 
         # Validar sort_by para prevenir SQL injection
-        allowed_sort_fields = [
-            "status",
-            "priority",
-            "case_type",
-            "created_by",
-            "created_at",
-            "title",
-        ]
-        if sort_by not in allowed_sort_fields:
-            sort_by = "created_at"
+        sort_by = normalize_sort_by(sort_by, search)
+
+        # El texto SQL depende solo de la forma (filtros presentes, orden,
+        # keyset, proyección): se compila una vez y se reutiliza preparado
+        shape = ListingShape.create(
+            mask=filter_mask(**filter_values),
+            match=match,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            keyset=cursor is not None,
+            fields=fields,
+        )
+        compiled = compile_listing(shape)
+
+        params = filter_params(**filter_values, match=match)
+        count_params = list(params)
+
+        # Paginación keyset: continuar después de (valor, id) del cursor
+        if cursor:
+            params.extend([cursor.value, cursor.id, page_size + 1])
+        else:
+            params.extend([page_size + 1, (page - 1) * page_size])
+
+        # Ejecutar datos y total. Con el pool van en paralelo (dos conexiones);
+        # con la conexión de una transacción deben ir en secuencia.
+        if self._connection:
+            rows = await self._fetch_shape(shape.name, compiled.data_sql, params)
+            total, total_estimated = await self._count(shape, count_params, count_mode)
+        else:
+            rows, (total, total_estimated) = await asyncio.gather(
+                self._fetch_shape(shape.name, compiled.data_sql, params),
+                self._count(shape, count_params, count_mode),
+            )
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if fields is None:
+            cases = [self._map_to_entity(row) for row in rows]
+        else:
+            cases = [self._map_projection_to_entity(row) for row in rows]
+        logger.debug(f"Retrieved {len(cases)} cases (total: {total}, has_more: {has_more})")
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = CaseCursor(
+                sort_by=sort_by,
+                sort_order=shape.sort_order.lower(),
+                value=last["sort_value"],
+                id=last["id"],
+            )
 
-        # Validar sort_order
-        sort_order_sql = "DESC" if sort_order.lower() == "desc" else "ASC"
+        return CasePage(
+            items=cases,
+            total=total,
+            has_more=has_more,
+            total_estimated=total_estimated,
+            next_cursor=next_cursor,
+        )
+
+    async def iter_all(
+        self, filters: CaseFilters, chunk_size: int = 1000
+    ) -> AsyncIterator[List[SupportCase]]:
+        """
+        Recorre los casos filtrados con un cursor del servidor (orden created_at, id).
 
-        # Query para datos
+        La memoria queda acotada por `chunk_size` (ver _iter_cursor).
+        """
+        conditions, params, _ = self._build_filter_conditions(**filters.as_dict())
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
         query = f"""
             SELECT
                 id, title, description, case_type, priority,
-                status, created_by, created_at, updated_at
+                status, created_by, created_at, updated_at, queries_count
+            FROM support_cases
+            WHERE {where_clause}
+            ORDER BY created_at, id
+        """
+
+        async for rows in self._iter_cursor(query, params, chunk_size):
+            yield [self._map_to_entity(row) for row in rows]
+
+    async def iter_rows(
+        self, filters: CaseFilters, table: str, columns: List[str], chunk_size: int = 1000
+    ) -> AsyncIterator[List[asyncpg.Record]]:
+        """
+        Recorre en bloques las filas crudas de `table` (una de CASE_EXPORT_TABLES)
+        que corresponden a los casos filtrados.
+
+        Pensado para la exportación columnar: las filas se convierten a
+        columnas sin pasar por las entidades. Ambas tablas salen ordenadas por
+        su fecha (created_at / executed_at), así los min/max por bloque del
+        archivo permiten descartar bloques al filtrar por fecha.
+        `columns` debe venir de un esquema fijo, nunca de la entrada del usuario.
+        """
+        conditions, params, _ = self._build_filter_conditions(**filters.as_dict())
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        column_list = ", ".join(columns)
+
+        if table == "support_cases":
+            query = f"""
+                SELECT {column_list}
+                FROM support_cases
+                WHERE {where_clause}
+                ORDER BY created_at, id
+            """
+        elif table == "case_queries":
+            # Sin filtros no hace falta el semi-join con support_cases
+            case_condition = (
+                f"case_id IN (SELECT id FROM support_cases WHERE {where_clause})"
+                if conditions
+                else "1=1"
+            )
+            query = f"""
+                SELECT {column_list}
+                FROM case_queries_with_text
+                WHERE {case_condition}
+                ORDER BY executed_at, id
+            """
+        else:
+            raise ValueError(f"Tabla no exportable: {table}")
+
+        async for rows in self._iter_cursor(query, params, chunk_size):
+            yield rows
+
+    async def _iter_cursor(
+        self, query: str, params: List[Any], chunk_size: int
+    ) -> AsyncIterator[List[asyncpg.Record]]:
+        """
+        Ejecuta `query` con un cursor del servidor y entrega bloques de filas.
+
+        El cursor vive en una transacción sobre una conexión dedicada; cada
+        bloque se pide recién cuando el consumidor terminó con el anterior,
+        así que la memoria queda acotada por `chunk_size` y un consumidor
+        lento (backpressure del cliente HTTP) frena la lectura.
+        """
+
+        async def fetch_chunks(connection: asyncpg.Connection):
+            cursor = await connection.cursor(query, *params)
+            while True:
+                rows = await cursor.fetch(chunk_size)
+                if not rows:
+                    break
+                yield rows
+                if len(rows) < chunk_size:
+                    break
+
+        if self._connection:
+            # Ya dentro de la transacción del llamador
+            async for rows in fetch_chunks(self._connection):
+                yield rows
+            return
+
+        async with self._db.transaction() as connection:
+            async with connection.transaction(readonly=True):
+                async for rows in fetch_chunks(connection):
+                    yield rows
+
+    async def get_facets(self, filters: CaseFilters) -> CaseFacets:
+        """
+        Cuenta los casos filtrados por cada valor de status, priority y case_type.
+
+        Un solo GROUPING SETS recorre las filas filtradas una vez y produce las
+        tres facetas más el total (grouping set vacío). Los valores sin casos
+        aparecen con 0.
+        """
+        conditions, params, _ = self._build_filter_conditions(**filters.as_dict())
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+        # Dentro de una transacción no se usa el cache: podría ver escrituras sin confirmar
+        cache = self._facets_cache if not self._connection else None
+        cache_key = (where_clause, tuple(params))
+        if cache is not None:
+            # Versión previa a la consulta: una escritura concurrente invalida el resultado
+            version = await self._data_version()
+            cached = cache.get(cache_key, version)
+            if cached is not MISSING:
+                return cached
+
+        query = f"""
+            SELECT
+                status, priority, case_type,
+                GROUPING(status, priority, case_type) AS grouping_id,
+                COUNT(*) AS total
             FROM support_cases
             WHERE {where_clause}
-            ORDER BY {sort_by} {sort_order_sql}
-            LIMIT ${param_idx} OFFSET ${param_idx + 1}
+            GROUP BY GROUPING SETS ((status), (priority), (case_type), ())
         """
-        params.extend([page_size, offset])
 
-        # Ejecutar query
         if self._connection:
             rows = await self._connection.fetch(query, *params)
         else:
             rows = await self._db.fetch(query, *params)
 
-        # Query para total (sin LIMIT y OFFSET)
-        count_query = f"""
-            SELECT COUNT(*) FROM support_cases
-            WHERE {where_clause}
+        facets = CaseFacets(
+            status={value.value: 0 for value in CaseStatus},
+            priority={value.value: 0 for value in CasePriority},
+            case_type={value.value: 0 for value in CaseType},
+        )
+        for row in rows:
+            facet = _FACET_GROUPING.get(row["grouping_id"])
+            if facet is None:
+                facets.total = row["total"]
+            else:
+                getattr(facets, facet)[row[facet]] = row["total"]
+
+        if cache is not None:
+            cache.set(cache_key, facets, version)
+        return facets
+
+    def _build_filter_conditions(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        case_type: Optional[str] = None,
+        created_by: Optional[str] = None,
+        search: Optional[str] = None,
+        date_gte: Optional[datetime] = None,
+        date_lte: Optional[datetime] = None,
+        match: Optional[str] = None,
+    ) -> Tuple[List[str], List[Any], Optional[str]]:
+        """
+        Construye las condiciones WHERE de los filtros del listado.
+
+        Returns:
+            Tuple con las condiciones, sus parámetros ($1..$n) y la expresión de
+            relevancia (None si no hay búsqueda)
+        """
+        filter_values = dict(
+            status=status,
+            priority=priority,
+            case_type=case_type,
+            created_by=created_by,
+            search=search,
+            date_gte=date_gte,
+            date_lte=date_lte,
+        )
+        mask = filter_mask(**filter_values)
+        conditions, rank_sql = compile_where(mask, normalize_match(mask, match))
+        return list(conditions), filter_params(**filter_values, match=match), rank_sql
+
+    async def repair_queries_count(self) -> int:
+        """
+        Recalcula la columna desnormalizada queries_count desde case_queries.
+
+        Solo actualiza los casos cuyo valor difiere del conteo real.
+
+        Returns:
+            Cantidad de casos corregidos
+        """
+        query = """
+            UPDATE support_cases sc
+            SET queries_count = c.queries_count
+            FROM (
+                SELECT s.id, COUNT(q.id) AS queries_count
+                FROM support_cases s
+                LEFT JOIN case_queries q ON q.case_id = s.id
+                GROUP BY s.id
+            ) c
+            WHERE sc.id = c.id AND sc.queries_count <> c.queries_count
+        """
+
+        if self._connection:
+            result = await self._connection.execute(query)
+        else:
+            result = await self._db.execute(query)
+
+        # asyncpg retorna el status del comando, p. ej. "UPDATE 3"
+        repaired = int(result.split()[-1])
+        if repaired and not self._connection:
+            # Con Unit of Work la marca de agua se avanza al confirmar
+            await DataVersionRepositoryImpl(self._db).bump()
+        logger.info(f"Repaired queries_count on {repaired} cases")
+        return repaired
+
+    async def _count(
+        self, shape: ListingShape, params: List[Any], count_mode: str
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Calcula el total del listado según `count_mode`.
+
+        Returns:
+            Tuple con el total (None si count_mode es "none") y si es una estimación
+        """
+        if count_mode == "none":
+            return None, False
+
+        # La cláusula WHERE y sus parámetros son la firma normalizada de los filtros.
+        # Dentro de una transacción no se usa: podría ver escrituras sin confirmar.
+        cache = self._count_cache if not self._connection else None
+        where_clause = compile_listing(shape).where_clause
+        cache_key = (count_mode, where_clause, tuple(params))
+        if cache is not None:
+            # Versión previa al conteo: una escritura concurrente invalida el resultado
+            version = await self._data_version()
+            cached = cache.get(cache_key, version)
+            if cached is not MISSING:
+                return cached
+
+        result = await self._compute_count(shape, params, count_mode)
+        if cache is not None:
+            cache.set(cache_key, result, version)
+        return result
+
+    async def _data_version(self) -> int:
+        """
+        Marca de agua de datos (data_version_seq) con la que se versionan los caches.
+
+        Es la misma que usan los ETag y la avanza cualquier proceso al confirmar
+        una escritura, así un worker no sirve totales de antes de un commit ajeno.
+        """
+        return await DataVersionRepositoryImpl(self._db).current()
+
+    async def _compute_count(
+        self, shape: ListingShape, params: List[Any], count_mode: str
+    ) -> Tuple[Optional[int], bool]:
+        """Ejecuta el conteo (exacto o estimado) contra la base de datos"""
+        compiled = compile_listing(shape)
+        if count_mode == "estimated":
+            estimate = await self._estimate_count(compiled.where_clause, params)
+            # Bajo el umbral el COUNT(*) exacto es barato y no vale la pena estimar
+            if estimate is not None and estimate >= ESTIMATED_COUNT_EXACT_THRESHOLD:
+                return estimate, True
+
+        rows = await self._fetch_shape(shape.count_name, compiled.count_sql, params)
+        return rows[0][0], False
+
+    async def _fetch_shape(
+        self, shape_name: str, query: str, params: List[Any]
+    ) -> List[asyncpg.Record]:
+        """Ejecuta una consulta de forma canónica (preparada e instrumentada) en ambos caminos"""
+        if self._connection:
+            return await self._connection.fetch_shape(shape_name, query, *params)
+        return await self._db.fetch_shape(shape_name, query, *params)
+
+    async def _estimate_count(self, where_clause: str, params: List[Any]) -> Optional[int]:
         """
-        count_params = params[:-2]  # Excluir LIMIT y OFFSET
+        Estima el total sin recorrer la tabla.
 
+        Sin filtros usa pg_class.reltuples (mantenido por ANALYZE/autovacuum);
+        con filtros usa las filas estimadas por el planner. Retorna None si la
+        tabla nunca fue analizada.
+        """
+        if not params:
+            query = "SELECT reltuples::bigint FROM pg_class WHERE oid = 'support_cases'::regclass"
+            if self._connection:
+                estimate = await self._connection.fetchval(query)
+            else:
+                estimate = await self._db.fetchval(query)
+            return estimate if estimate is not None and estimate >= 0 else None
+
+        query = f"EXPLAIN (FORMAT JSON) SELECT 1 FROM support_cases WHERE {where_clause}"
         if self._connection:
-            total = await self._connection.fetchval(count_query, *count_params)
+            plan = await self._connection.fetchval(query, *params)
         else:
-            total = await self._db.fetchval(count_query, *count_params)
+            plan = await self._db.fetchval(query, *params)
+        return int(json.loads(plan)[0]["Plan"]["Plan Rows"])
 
-        cases = [self._map_to_entity(row) for row in rows]
-        logger.debug(f"Retrieved {len(cases)} cases (total: {total})")
+    def _map_projection_to_entity(self, row: asyncpg.Record) -> SupportCase:
+        """Mapea un registro con un subconjunto de columnas (proyección del listado)"""
+        values = {key: row[key] for key in row.keys() if key in CASE_LIST_FIELDS}
+        for key, enum_type in (
+            ("case_type", CaseType),
+            ("priority", CasePriority),
+            ("status", CaseStatus),
+        ):
+            if key in values:
+                values[key] = enum_type(values[key])
+        return SupportCase(**values)
 
-        return cases, total
+    def _map_joined_query(self, row: asyncpg.Record) -> CaseQuery:
+        """Mapea las columnas q_* de get_with_queries a una query del caso"""
+        return CaseQuery(
+            id=row["q_id"],
+            case_id=row["id"],
+            database_name=row["q_database_name"],
+            schema_name=row["q_schema_name"],
+            query_text=row["q_query_text"],
+            execution_time_ms=row["q_execution_time_ms"],
+            rows_affected=row["q_rows_affected"],
+            executed_at=row["q_executed_at"],
+            executed_by=row["q_executed_by"],
+            query_text_bytes=row.get("q_query_text_bytes"),
+        )
 
     def _map_to_entity(self, row: asyncpg.Record) -> SupportCase:
         """Mapea un registro de DB a una entidad de dominio"""
@@ -199,4 +785,5 @@ class CaseRepositoryImpl(CaseRepository):
             created_by=row["created_by"],
             created_at=row["created_at"],
             updated_at=row["updated_at"],
+            queries_count=row["queries_count"],
         )
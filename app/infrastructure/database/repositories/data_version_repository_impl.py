@@ -0,0 +1,41 @@
+from typing import Optional
+import asyncpg
+from app.domain.repositories.data_version_repository import DataVersionRepository
+from app.infrastructure.database.connection import DatabaseConnection
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersionRepositoryImpl(DataVersionRepository):
+    """
+    Marca de agua sobre la secuencia data_version_seq.
+
+    Versiona los ETag del listado y los caches en memoria; es compartida por
+    todos los procesos y sobrevive reinicios.
+    """
+
+    def __init__(self, db: DatabaseConnection, connection: Optional[asyncpg.Connection] = None):
+        self._db = db
+        self._connection = connection  # Conexión de transacción si está disponible
+
+    async def current(self) -> int:
+        """Retorna la versión de datos vigente (0 si nunca se avanzó)"""
+        # Antes del primer nextval last_value ya vale 1 con is_called = false:
+        # sin el CASE el primer bump no cambiaría la versión observada
+        query = "SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM data_version_seq"
+
+        if self._connection:
+            return await self._connection.fetchval(query)
+        return await self._db.fetchval(query)
+
+    async def bump(self) -> int:
+        """Avanza la versión de datos"""
+        query = "SELECT nextval('data_version_seq')"
+
+        if self._connection:
+            version = await self._connection.fetchval(query)
+        else:
+            version = await self._db.fetchval(query)
+        logger.debug(f"Data version bumped to {version}")
+        return version
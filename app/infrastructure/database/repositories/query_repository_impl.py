@@ -1,13 +1,43 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 import asyncpg
+from app.config import settings
 from app.domain.entities.case import CaseQuery
-from app.domain.repositories.query_repository import QueryRepository
+from app.domain.repositories.query_repository import (
+    QueryPage,
+    QueryRepository,
+    QueryText,
+    QueryTextStorage,
+)
+from app.domain.value_objects.query_cursor import QueryCursor
 from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.query_builder import query_text_preview_sql
+from app.infrastructure.database.query_texts import (
+    UPSERT_QUERY_TEXTS_SQL,
+    query_text_hash,
+    text_arrays,
+)
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columnas de case_queries en el orden de las tuplas de save_many (el texto va
+# aparte, en query_texts)
+_INSERT_COLUMNS = (
+    "id",
+    "case_id",
+    "database_name",
+    "schema_name",
+    "query_text_hash",
+    "execution_time_ms",
+    "rows_affected",
+    "executed_at",
+    "executed_by",
+)
+
 
 class QueryRepositoryImpl(QueryRepository):
     def __init__(self, db: DatabaseConnection, connection: Optional[asyncpg.Connection] = None):
@@ -15,90 +45,155 @@ class QueryRepositoryImpl(QueryRepository):
         self._connection = connection  # Conexión de transacción si está disponible
 
     async def save(self, query: CaseQuery) -> None:
-        """Guarda una query"""
+        """Guarda una query (y su texto si es nuevo) e incrementa el queries_count del caso"""
+        # Un solo statement: el texto, el INSERT y el contador quedan en la misma transacción
         sql = """
-            INSERT INTO case_queries (
-                id, case_id, database_name, schema_name, query_text,
-                execution_time_ms, rows_affected, executed_at, executed_by
+            WITH text AS (
+                INSERT INTO query_texts (hash, query_text)
+                VALUES ($5, $10)
+                ON CONFLICT (hash) DO NOTHING
+            ),
+            inserted AS (
+                INSERT INTO case_queries (
+                    id, case_id, database_name, schema_name, query_text_hash,
+                    execution_time_ms, rows_affected, executed_at, executed_by
+                )
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                RETURNING case_id
             )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+            UPDATE support_cases
+            SET queries_count = queries_count + 1
+            WHERE id = (SELECT case_id FROM inserted)
         """
+        args = (
+            query.id,
+            query.case_id,
+            query.database_name,
+            query.schema_name,
+            query_text_hash(query.query_text),
+            query.execution_time_ms,
+            query.rows_affected,
+            query.executed_at,
+            query.executed_by,
+            query.query_text,
+        )
 
         if self._connection:
             # Usar conexión de transacción
-            await self._connection.execute(
-                sql,
-                query.id,
-                query.case_id,
-                query.database_name,
-                query.schema_name,
-                query.query_text,
-                query.execution_time_ms,
-                query.rows_affected,
-                query.executed_at,
-                query.executed_by,
-            )
+            await self._connection.execute(sql, *args)
         else:
             # Usar pool normal
-            await self._db.execute(
-                sql,
-                query.id,
-                query.case_id,
-                query.database_name,
-                query.schema_name,
-                query.query_text,
-                query.execution_time_ms,
-                query.rows_affected,
-                query.executed_at,
-                query.executed_by,
-            )
+            await self._db.execute(sql, *args)
         logger.debug(f"Query saved: {query.id}")
 
-    async def save_many(self, queries: List[CaseQuery]) -> None:
-        """Guarda múltiples queries en batch"""
+    async def save_many(self, queries: List[CaseQuery], update_counts: bool = True) -> None:
+        """
+        Guarda múltiples queries en batch y actualiza el queries_count de sus casos.
+
+        Con update_counts=False los casos ya se guardaron con su queries_count
+        (CaseRepositoryImpl.save_many) y no hay UPDATE.
+
+        Los textos van antes, en un solo upsert a query_texts (cada texto
+        distinto una vez). Desde SAVE_MANY_COPY_THRESHOLD filas el INSERT de
+        las queries es un COPY (un solo flujo de datos en lugar de un
+        bind/execute por fila). Las restricciones y sus errores (asyncpg) son
+        los mismos en los dos caminos.
+        """
         if not queries:
             return
 
-        sql = """
-            INSERT INTO case_queries (
-                id, case_id, database_name, schema_name, query_text,
-                execution_time_ms, rows_affected, executed_at, executed_by
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-        """
+        hashes = [query_text_hash(q.query_text) for q in queries]
+        texts = text_arrays(hashes, [q.query_text for q in queries])
 
-        # Preparar valores para bulk insert
+        # Preparar valores para bulk insert (orden de _INSERT_COLUMNS)
         values = [
             (
                 q.id,
                 q.case_id,
                 q.database_name,
                 q.schema_name,
-                q.query_text,
+                text_hash,
                 q.execution_time_ms,
                 q.rows_affected,
                 q.executed_at,
                 q.executed_by,
             )
-            for q in queries
+            for q, text_hash in zip(queries, hashes)
         ]
 
+        # Incremento por caso en un solo UPDATE
+        increments: Dict[UUID, int] = {}
+        for q in queries:
+            increments[q.case_id] = increments.get(q.case_id, 0) + 1
+        count_sql = """
+            UPDATE support_cases sc
+            SET queries_count = sc.queries_count + inc.amount
+            FROM unnest($1::uuid[], $2::int[]) AS inc(case_id, amount)
+            WHERE sc.id = inc.case_id
+        """
+        count_args = (list(increments.keys()), list(increments.values()))
+
         if self._connection:
-            # Usar conexión de transacción
-            await self._connection.executemany(sql, values)
+            # Usar conexión de transacción (la del Unit of Work)
+            await self._connection.execute(UPSERT_QUERY_TEXTS_SQL, *texts)
+            await self._insert_many(self._connection, values)
+            if update_counts:
+                await self._connection.execute(count_sql, *count_args)
         else:
-            # Usar pool normal
-            await self._db.executemany(sql, values)
+            # Sin Unit of Work: transacción propia para que el contador no se desincronice
+            async with self._db.transaction() as connection:
+                async with connection.transaction():
+                    await connection.execute(UPSERT_QUERY_TEXTS_SQL, *texts)
+                    await self._insert_many(connection, values)
+                    if update_counts:
+                        await connection.execute(count_sql, *count_args)
+            # Confirmada fuera del Unit of Work: avanzar aquí la marca de agua
+            await DataVersionRepositoryImpl(self._db).bump()
 
         logger.debug(f"Saved {len(queries)} queries in batch")
 
+    async def _insert_many(self, connection: asyncpg.Connection, values: List[tuple]) -> None:
+        """Inserta las filas con COPY o executemany según SAVE_MANY_COPY_THRESHOLD"""
+        threshold = settings.SAVE_MANY_COPY_THRESHOLD
+        if threshold and len(values) >= threshold:
+            await connection.copy_records_to_table(
+                "case_queries", records=values, columns=_INSERT_COLUMNS
+            )
+            return
+
+        sql = f"""
+            INSERT INTO case_queries ({", ".join(_INSERT_COLUMNS)})
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+        """
+        await connection.executemany(sql, values)
+
+    async def get_by_id(self, case_id: UUID, query_id: UUID) -> Optional[CaseQuery]:
+        """Obtiene una query de un caso"""
+        query = """
+            SELECT
+                id, case_id, database_name, schema_name, query_text,
+                execution_time_ms, rows_affected, executed_at, executed_by
+            FROM case_queries_with_text
+            WHERE id = $1 AND case_id = $2
+        """
+
+        if self._connection:
+            row = await self._connection.fetchrow(query, query_id, case_id)
+        else:
+            row = await self._db.fetchrow(query, query_id, case_id)
+
+        if not row:
+            return None
+
+        return self._map_to_entity(row)
+
     async def get_by_case_id(self, case_id: UUID) -> List[CaseQuery]:
         """Obtiene todas las queries de un caso"""
         query = """
             SELECT
                 id, case_id, database_name, schema_name, query_text,
                 execution_time_ms, rows_affected, executed_at, executed_by
-            FROM case_queries
+            FROM case_queries_with_text
             WHERE case_id = $1
             ORDER BY executed_at ASC
         """
@@ -110,6 +205,182 @@ class QueryRepositoryImpl(QueryRepository):
 
         return [self._map_to_entity(row) for row in rows]
 
+    async def get_by_case_ids(self, case_ids: List[UUID]) -> List[CaseQuery]:
+        """
+        Obtiene las queries de varios casos en una sola consulta.
+
+        Vienen ordenadas por caso y fecha de ejecución; el agrupado por caso
+        queda a cargo del llamador.
+        """
+        if not case_ids:
+            return []
+
+        query = """
+            SELECT
+                id, case_id, database_name, schema_name, query_text,
+                execution_time_ms, rows_affected, executed_at, executed_by
+            FROM case_queries_with_text
+            WHERE case_id = ANY($1::uuid[])
+            ORDER BY case_id, executed_at ASC
+        """
+
+        if self._connection:
+            rows = await self._connection.fetch(query, case_ids)
+        else:
+            rows = await self._db.fetch(query, case_ids)
+
+        return [self._map_to_entity(row) for row in rows]
+
+    async def get_page(
+        self,
+        case_id: UUID,
+        limit: int,
+        after: Optional[QueryCursor] = None,
+        database_name: Optional[str] = None,
+        schema_name: Optional[str] = None,
+        executed_by: Optional[str] = None,
+        preview_chars: Optional[int] = None,
+    ) -> QueryPage:
+        """
+        Obtiene una página de queries del caso ordenadas por (executed_at, id).
+
+        Cada página es un rango del índice (case_id, executed_at, id) que
+        empieza después del cursor: el costo no depende de la posición.
+        """
+        conditions = ["case_id = $1"]
+        params: List[object] = [case_id]
+        for column, value in (
+            ("database_name", database_name),
+            ("schema_name", schema_name),
+            ("executed_by", executed_by),
+        ):
+            if value:
+                params.append(value)
+                conditions.append(f"{column} = ${len(params)}")
+
+        if after is not None:
+            params.extend([after.executed_at, after.id])
+            conditions.append(f"(executed_at, id) > (${len(params) - 1}, ${len(params)})")
+
+        text_columns = "query_text"
+        if preview_chars is not None:
+            params.append(preview_chars)
+            text_columns = query_text_preview_sql("query_text", len(params))
+
+        # limit + 1 filas para saber si hay más
+        params.append(limit + 1)
+        query = f"""
+            SELECT
+                id, case_id, database_name, schema_name, {text_columns},
+                execution_time_ms, rows_affected, executed_at, executed_by
+            FROM case_queries_with_text
+            WHERE {" AND ".join(conditions)}
+            ORDER BY executed_at ASC, id ASC
+            LIMIT ${len(params)}
+        """
+
+        if self._connection:
+            rows = await self._connection.fetch(query, *params)
+        else:
+            rows = await self._db.fetch(query, *params)
+
+        items = [self._map_to_entity(row) for row in rows[:limit]]
+        has_more = len(rows) > limit
+        next_cursor = QueryCursor.after(items[-1]) if has_more and items else None
+        return QueryPage(items=items, has_more=has_more, next_cursor=next_cursor)
+
+    async def get_text(self, case_id: UUID, query_id: UUID, max_bytes: int) -> Optional[QueryText]:
+        """
+        Obtiene el tamaño del texto de una query y el texto si no supera `max_bytes`.
+
+        octet_length sale del encabezado TOAST: un texto grande no se lee
+        (ni se descomprime) hasta recorrerlo con iter_text.
+        """
+        query = """
+            SELECT
+                octet_length(query_text) AS size_bytes,
+                CASE WHEN octet_length(query_text) <= $3 THEN query_text END AS query_text
+            FROM case_queries_with_text
+            WHERE id = $1 AND case_id = $2
+        """
+
+        if self._connection:
+            row = await self._connection.fetchrow(query, query_id, case_id, max_bytes)
+        else:
+            row = await self._db.fetchrow(query, query_id, case_id, max_bytes)
+
+        if not row:
+            return None
+
+        return QueryText(size_bytes=row["size_bytes"], text=row["query_text"])
+
+    async def iter_text(
+        self, case_id: UUID, query_id: UUID, chunk_chars: int
+    ) -> AsyncIterator[str]:
+        """
+        Recorre el texto de una query en partes de `chunk_chars` caracteres.
+
+        Una consulta substr por parte: la memoria queda acotada por el tamaño
+        de la parte y no por el del texto. Las queries son inmutables, así que
+        las partes no necesitan una transacción en común.
+        """
+        query = """
+            SELECT substr(query_text, $3, $4)
+            FROM case_queries_with_text
+            WHERE id = $1 AND case_id = $2
+        """
+        start = 1
+        while True:
+            if self._connection:
+                chunk = await self._connection.fetchval(
+                    query, query_id, case_id, start, chunk_chars
+                )
+            else:
+                chunk = await self._db.fetchval(query, query_id, case_id, start, chunk_chars)
+
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < chunk_chars:
+                return
+            start += chunk_chars
+
+    async def text_storage(self) -> QueryTextStorage:
+        """
+        Compara los bytes de texto guardados en query_texts con los que
+        ocuparía una copia por query. Recorre case_queries completa: pensado
+        para reportes de mantenimiento, no para el camino de las solicitudes.
+        """
+        query = """
+            SELECT
+                (SELECT COUNT(*) FROM case_queries) AS queries,
+                (SELECT COUNT(*) FROM query_texts) AS distinct_texts,
+                (
+                    SELECT COALESCE(SUM(octet_length(t.query_text) * refs.count), 0)
+                    FROM (
+                        SELECT query_text_hash, COUNT(*) AS count
+                        FROM case_queries
+                        GROUP BY query_text_hash
+                    ) refs
+                    JOIN query_texts t ON t.hash = refs.query_text_hash
+                ) AS logical_bytes,
+                (
+                    SELECT COALESCE(SUM(octet_length(query_text)), 0) FROM query_texts
+                ) AS stored_bytes,
+                (
+                    SELECT COALESCE(SUM(octet_length(query_text_hash)), 0) FROM case_queries
+                ) AS hash_bytes,
+                pg_total_relation_size('case_queries') AS case_queries_disk_bytes,
+                pg_total_relation_size('query_texts') AS query_texts_disk_bytes
+        """
+
+        if self._connection:
+            row = await self._connection.fetchrow(query)
+        else:
+            row = await self._db.fetchrow(query)
+
+        return QueryTextStorage(**dict(row))
+
     def _map_to_entity(self, row: asyncpg.Record) -> CaseQuery:
         """Mapea un registro de DB a una entidad de dominio"""
         return CaseQuery(
@@ -122,4 +393,5 @@ class QueryRepositoryImpl(QueryRepository):
             rows_affected=row["rows_affected"],
             executed_at=row["executed_at"],
             executed_by=row["executed_by"],
+            query_text_bytes=row.get("query_text_bytes"),
         )
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, replace
+from typing import Dict
+
+
+@dataclass
+class ShapeStats:
+    """Contadores de una forma de consulta: preparaciones (parse/plan) y ejecuciones"""
+
+    prepares: int = 0
+    prepare_seconds: float = 0.0
+    executions: int = 0
+    execute_seconds: float = 0.0
+
+
+class StatementStats:
+    """
+    Contadores por forma canónica de consulta (ver query_builder).
+
+    Una forma que se prepara casi tantas veces como se ejecuta indica que el
+    cache de sentencias de las conexiones no la está reteniendo. No es
+    thread-safe: pensado para el event loop de asyncio.
+    """
+
+    def __init__(self):
+        self._shapes: Dict[str, ShapeStats] = {}
+
+    def record_prepare(self, shape: str, seconds: float) -> None:
+        stats = self._shapes.setdefault(shape, ShapeStats())
+        stats.prepares += 1
+        stats.prepare_seconds += seconds
+
+    def record_execute(self, shape: str, seconds: float) -> None:
+        stats = self._shapes.setdefault(shape, ShapeStats())
+        stats.executions += 1
+        stats.execute_seconds += seconds
+
+    def snapshot(self) -> Dict[str, ShapeStats]:
+        """Copia de los contadores actuales por forma"""
+        return {shape: replace(stats) for shape, stats in self._shapes.items()}
+
+    def reset(self) -> None:
+        self._shapes.clear()
+
+
+# Contadores del proceso (uno por worker)
+statement_stats = StatementStats()
@@ -2,6 +2,9 @@ from typing import Optional
 import asyncpg
 from app.application.interfaces.unit_of_work import UnitOfWork
 from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -38,6 +41,7 @@ class PostgreSQLUnitOfWork(UnitOfWork):
                 # No hubo excepciones, hacer commit
                 await self.commit()
                 logger.debug("Transaction committed")
+                await self._bump_data_version()
         finally:
             if self._connection:
                 pool = getattr(self._db, "_pool", None)
@@ -56,6 +60,19 @@ class PostgreSQLUnitOfWork(UnitOfWork):
         if self._transaction:
             await self._transaction.rollback()
 
+    async def _bump_data_version(self) -> None:
+        """
+        Avanza la marca de agua de datos después del commit.
+
+        Se hace fuera de la transacción para que un lector nunca vea la versión
+        nueva antes que los datos; si falla, el commit ya está hecho y solo se
+        registra el error.
+        """
+        try:
+            await DataVersionRepositoryImpl(self._db, self._connection).bump()
+        except Exception as e:
+            logger.error(f"Failed to bump data version: {e}")
+
     def get_connection(self) -> asyncpg.Connection:
         """Obtiene la conexión actual para uso en repositorios"""
         if not self._connection:
@@ -0,0 +1,123 @@
+"""
+Group commit de las altas de casos (POST /cases).
+
+Las altas concurrentes que llegan dentro de una ventana corta, o hasta
+completar un lote, se escriben juntas con create_many_with_queries: una
+sentencia y una conexión del pool por lote en lugar de una transacción por
+caso. Así el throughput crece con el tamaño del lote y no con el del pool.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Set, Tuple
+import asyncio
+import logging
+from app.application.interfaces.case_write_coalescer import CaseWriteCoalescer
+from app.domain.entities.case import SupportCase
+from app.domain.repositories.case_repository import CaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GroupCommitStats:
+    """Contadores del group commit"""
+
+    batches: int = 0
+    cases: int = 0
+    failed_batches: int = 0  # Lotes rechazados, reintentados caso por caso
+    largest_batch: int = 0
+
+    @property
+    def avg_batch_size(self) -> float:
+        return self.cases / self.batches if self.batches else 0.0
+
+
+class GroupCommitCaseWriter(CaseWriteCoalescer):
+    """
+    Agrupa las altas concurrentes: el primer caso de un lote abre una ventana
+    de `window_seconds`; el lote se escribe al cerrarse la ventana o al
+    llegar a `max_batch` casos. Cada solicitud espera su propio futuro.
+
+    Si el lote falla se reintenta caso por caso, para que cada solicitud
+    reciba su propio resultado. Un caso cuya solicitud se canceló igual se
+    guarda si ya estaba en un lote.
+    """
+
+    def __init__(self, case_repository: CaseRepository, window_seconds: float, max_batch: int):
+        self._case_repository = case_repository
+        self._window_seconds = window_seconds
+        self._max_batch = max(1, max_batch)
+        self._pending: List[Tuple[SupportCase, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._writes: Set[asyncio.Task] = set()
+        self._stats = GroupCommitStats()
+
+    async def submit(self, case: SupportCase) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((case, future))
+
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_seconds, self._flush)
+
+        await future
+
+    async def close(self) -> None:
+        self._flush()
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def stats(self) -> GroupCommitStats:
+        return GroupCommitStats(**vars(self._stats))
+
+    def _flush(self) -> None:
+        """Cierra el lote pendiente y lo escribe en una tarea aparte"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        self._stats.batches += 1
+        self._stats.cases += len(batch)
+        self._stats.largest_batch = max(self._stats.largest_batch, len(batch))
+
+        task = asyncio.get_running_loop().create_task(self._write(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: List[Tuple[SupportCase, asyncio.Future]]) -> None:
+        try:
+            await self._case_repository.create_many_with_queries([case for case, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                _resolve(batch[0][1], e)
+                return
+            self._stats.failed_batches += 1
+            logger.warning(f"Group commit of {len(batch)} cases failed, retrying one by one: {e}")
+            for item in batch:
+                await self._write([item])
+            return
+        except BaseException:
+            # Tarea cancelada (p. ej. al cerrar el loop): no dejar solicitudes colgadas
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+            raise
+
+        for _, future in batch:
+            _resolve(future)
+        logger.debug(f"Group commit of {len(batch)} cases")
+
+
+def _resolve(future: asyncio.Future, error: Optional[Exception] = None) -> None:
+    """Entrega el resultado salvo que la solicitud ya se haya cancelado"""
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
@@ -0,0 +1,200 @@
+"""
+Exportación columnar (Arrow IPC stream / Parquet) de support_cases y case_queries.
+
+Los bloques de filas (ExportColumnarUseCase) se convierten directamente en
+record batches con un esquema tipado que refleja las columnas de las migraciones. pyarrow es una
+dependencia opcional (extra "analytics") y se importa recién al exportar.
+"""
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Tuple
+from uuid import UUID
+import importlib.util
+from app.domain.repositories.case_repository import CASE_EXPORT_TABLES
+
+COLUMNAR_FORMATS = ("arrow", "parquet")
+COLUMNAR_TABLES = CASE_EXPORT_TABLES
+
+COLUMNAR_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Extensión de archivo por formato (.arrows es la convención del formato stream)
+COLUMNAR_EXTENSIONS = {"arrow": "arrows", "parquet": "parquet"}
+
+# Columnas por tabla: (nombre, tipo, nullable). Tipos como nombres de fábrica de
+# pyarrow para no importarlo al cargar el módulo; deben seguir a las migraciones.
+_TABLE_COLUMNS: Dict[str, List[Tuple[str, str, bool]]] = {
+    "support_cases": [
+        ("id", "uuid", False),
+        ("title", "string", False),
+        ("description", "string", True),
+        ("case_type", "category", False),
+        ("priority", "category", False),
+        ("status", "category", False),
+        ("created_by", "string", False),
+        ("created_at", "timestamp", False),
+        ("updated_at", "timestamp", False),
+        ("queries_count", "int32", False),
+    ],
+    "case_queries": [
+        ("id", "uuid", False),
+        ("case_id", "uuid", False),
+        ("database_name", "string", False),
+        ("schema_name", "string", False),
+        ("query_text", "string", False),
+        ("execution_time_ms", "int32", True),
+        ("rows_affected", "int32", True),
+        ("executed_at", "timestamp", False),
+        ("executed_by", "string", False),
+    ],
+}
+
+
+class ColumnarExportUnavailable(RuntimeError):
+    """pyarrow no está instalado (extra "analytics")"""
+
+    pass
+
+
+def columnar_available() -> bool:
+    """Indica si pyarrow está instalado"""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _require_pyarrow():
+    if not columnar_available():
+        raise ColumnarExportUnavailable(
+            "La exportación columnar requiere pyarrow (instalar el extra 'analytics')"
+        )
+    import pyarrow
+
+    return pyarrow
+
+
+def table_columns(table: str) -> List[str]:
+    """Columnas exportadas de `table`; ValueError si la tabla no es exportable"""
+    if table not in _TABLE_COLUMNS:
+        raise ValueError(f"Tabla no exportable: {table}")
+    return [name for name, _, _ in _TABLE_COLUMNS[table]]
+
+
+def table_schema(table: str):
+    """
+    Esquema Arrow de `table`.
+
+    UUID como string (lo leen pandas y DuckDB sin extensiones), TIMESTAMP sin
+    zona como timestamp[us] y los enums con CHECK como diccionario.
+    """
+    pa = _require_pyarrow()
+    types = {
+        "uuid": pa.string(),
+        "string": pa.string(),
+        "category": pa.dictionary(pa.int8(), pa.string()),
+        "timestamp": pa.timestamp("us"),
+        "int32": pa.int32(),
+    }
+    return pa.schema(
+        [
+            pa.field(name, types[type_name], nullable=nullable)
+            for name, type_name, nullable in _TABLE_COLUMNS[table]
+        ]
+    )
+
+
+def records_to_batch(rows: List[Mapping[str, Any]], schema):
+    """Convierte un bloque de filas en un RecordBatch de `schema`"""
+    pa = _require_pyarrow()
+    arrays = []
+    for field in schema:
+        values = [row[field.name] for row in rows]
+        if values and isinstance(values[0], UUID):
+            values = [str(value) for value in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _ChunkSink:
+    """
+    Archivo de solo escritura que acumula lo que escribe pyarrow, para
+    entregarlo por partes en lugar de armar el archivo completo en memoria.
+    """
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _open_writer(export_format: str, sink: _ChunkSink, schema):
+    pa = _require_pyarrow()
+    if export_format == "parquet":
+        import pyarrow.parquet as pq
+
+        # Cada batch es un row group: el lector puede filtrar por sus estadísticas
+        return pq.ParquetWriter(sink, schema, compression="zstd")
+    return pa.ipc.new_stream(sink, schema)
+
+
+def validate_columnar_export(export_format: str) -> None:
+    """
+    Valida el formato; ValueError si no es soportado y
+    ColumnarExportUnavailable si falta pyarrow.
+    """
+    if export_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Formato columnar no soportado: {export_format}")
+    _require_pyarrow()
+
+
+async def columnar_chunks(
+    batches: AsyncIterator[List[Mapping[str, Any]]], table: str, export_format: str
+) -> AsyncIterator[bytes]:
+    """
+    Convierte los bloques de filas de `table` en Arrow IPC o Parquet.
+
+    Cada bloque se convierte en un record batch y se entrega apenas se
+    escribe, así la memoria queda acotada por el tamaño del bloque.
+    Llamar antes a validate_columnar_export.
+    """
+    schema = table_schema(table)
+    sink = _ChunkSink()
+    writer = _open_writer(export_format, sink, schema)
+
+    try:
+        async for rows in batches:
+            writer.write_batch(records_to_batch(rows, schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        # Cierra el stream (o escribe el footer de Parquet); con 0 filas queda un archivo válido
+        writer.close()
+
+    data = sink.drain()
+    if data:
+        yield data
+
+
+async def write_columnar(
+    batches: AsyncIterator[List[Mapping[str, Any]]],
+    table: str,
+    export_format: str,
+    write: Callable[[bytes], Any],
+) -> None:
+    """Exporta con columnar_chunks pasando cada parte a `write` (p. ej. un archivo)"""
+    validate_columnar_export(export_format)
+    async for data in columnar_chunks(batches, table, export_format):
+        write(data)
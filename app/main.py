@@ -3,8 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 import logging
 import sys
 from app.config import settings
-from app.infrastructure.database.db import db
+from app.infrastructure.database.db import case_write_coalescer, db
 from app.api.v1.routers import cases as cases_router
+from app.api.v1.routers import metrics as metrics_router
 
 # Setup logging
 logging.basicConfig(
@@ -33,6 +34,7 @@ app.add_middleware(
 
 # Include routers
 app.include_router(cases_router.router, prefix="/api/v1")
+app.include_router(metrics_router.router, prefix="/api/v1")
 
 
 @app.on_event("startup")
@@ -56,6 +58,8 @@ async def startup():
 async def shutdown():
     """Close database connection on shutdown"""
     logger.info("Shutting down application...")
+    # Altas agrupadas pendientes antes de cerrar el pool
+    await case_write_coalescer.close()
     await db.disconnect()
     logger.info("Database disconnected")
 
@@ -0,0 +1,21 @@
+BEGIN;
+
+-- Índices (campo de orden, id) para la paginación keyset del listado de casos.
+-- El id desempata filas con el mismo valor y permite que la condición
+-- (campo, id) < ($1, $2) sea un rango de índice: la página N cuesta lo mismo
+-- que la primera.
+CREATE INDEX IF NOT EXISTS idx_support_cases_created_at_id ON support_cases(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_support_cases_title_id ON support_cases(title, id);
+CREATE INDEX IF NOT EXISTS idx_support_cases_status_id ON support_cases(status, id);
+CREATE INDEX IF NOT EXISTS idx_support_cases_priority_id ON support_cases(priority, id);
+CREATE INDEX IF NOT EXISTS idx_support_cases_type_id ON support_cases(case_type, id);
+CREATE INDEX IF NOT EXISTS idx_support_cases_created_by_id ON support_cases(created_by, id);
+
+-- Reemplazados por los índices compuestos anteriores
+DROP INDEX IF EXISTS idx_support_cases_created_at;
+DROP INDEX IF EXISTS idx_support_cases_status;
+DROP INDEX IF EXISTS idx_support_cases_priority;
+DROP INDEX IF EXISTS idx_support_cases_type;
+DROP INDEX IF EXISTS idx_support_cases_created_by;
+
+COMMIT;
@@ -0,0 +1,21 @@
+BEGIN;
+
+-- Vector de búsqueda full-text sobre título (peso A) y descripción (peso B).
+-- Al ser una columna generada STORED, el ALTER TABLE reescribe la tabla y
+-- calcula el vector de todas las filas existentes (backfill) y PostgreSQL lo
+-- mantiene en cada INSERT sin cambios en la aplicación.
+-- La configuración 'spanish' debe coincidir con SEARCH_TEXT_CONFIG en
+-- app/infrastructure/database/query_builder.py.
+ALTER TABLE support_cases
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('spanish', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('spanish', coalesce(description, '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_support_cases_search_vector ON support_cases USING gin(search_vector);
+
+-- Índice de solo título que ninguna consulta usaba
+DROP INDEX IF EXISTS idx_support_cases_title_search;
+
+COMMIT;
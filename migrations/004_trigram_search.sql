@@ -0,0 +1,12 @@
+BEGIN;
+
+-- Búsqueda por fragmentos (ILIKE '%x%') y difusa (word_similarity) con pg_trgm.
+-- Los índices GIN de trigramas convierten estos filtros en bitmap index scans
+-- en lugar de seq scans sobre toda la tabla.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_support_cases_title_trgm ON support_cases USING gin(title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_support_cases_description_trgm ON support_cases USING gin(description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_support_cases_created_by_trgm ON support_cases USING gin(created_by gin_trgm_ops);
+
+COMMIT;
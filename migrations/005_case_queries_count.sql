@@ -0,0 +1,21 @@
+BEGIN;
+
+-- Conteo de queries desnormalizado en support_cases. Lo mantiene
+-- QueryRepositoryImpl.save/save_many en la misma transacción del INSERT;
+-- `python -m app.cli repair-queries-count` lo recalcula si se desincroniza.
+ALTER TABLE support_cases ADD COLUMN IF NOT EXISTS queries_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill de los casos existentes
+UPDATE support_cases sc
+SET queries_count = c.queries_count
+FROM (
+    SELECT case_id, COUNT(*) AS queries_count
+    FROM case_queries
+    GROUP BY case_id
+) c
+WHERE sc.id = c.case_id;
+
+-- Orden por queries_count con desempate por id (paginación keyset)
+CREATE INDEX IF NOT EXISTS idx_support_cases_queries_count_id ON support_cases(queries_count, id);
+
+COMMIT;
@@ -0,0 +1,17 @@
+BEGIN;
+
+-- Índices compuestos (filtro de igualdad, created_at DESC, id DESC) para el
+-- patrón real del listado: "filtros + ORDER BY created_at DESC LIMIT n".
+-- El filtro fija el prefijo del índice y el orden sale del resto de columnas:
+-- sin Sort y sin descartar filas, también en la paginación keyset.
+-- Los índices (campo, id) de 002 siguen cubriendo sort_by=campo.
+CREATE INDEX IF NOT EXISTS idx_support_cases_status_created_at ON support_cases(status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_support_cases_priority_created_at ON support_cases(priority, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_support_cases_type_created_at ON support_cases(case_type, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_support_cases_created_by_created_at ON support_cases(created_by, created_at DESC, id DESC);
+
+-- (status, priority) no coincide con ningún orden del listado; status + priority
+-- se resuelve con idx_support_cases_status_created_at y filtro de priority
+DROP INDEX IF EXISTS idx_support_cases_status_priority;
+
+COMMIT;
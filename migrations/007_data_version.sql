@@ -0,0 +1,8 @@
+BEGIN;
+
+-- Marca de agua de datos para los ETag del listado. La avanza la aplicación
+-- (PostgreSQLUnitOfWork) después de cada commit; leerla es O(1).
+-- Las secuencias no son transaccionales: no bloquea escrituras concurrentes.
+CREATE SEQUENCE IF NOT EXISTS data_version_seq;
+
+COMMIT;
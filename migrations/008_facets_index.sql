@@ -0,0 +1,9 @@
+BEGIN;
+
+-- Índice de las tres facetas para GET /cases/facets: el GROUPING SETS se
+-- resuelve con un index-only scan (sin leer el heap) y el prefijo status
+-- sirve para los filtros por estado. Reemplaza a idx_support_cases_status_priority
+-- (eliminado en 006) con la columna case_type agregada.
+CREATE INDEX IF NOT EXISTS idx_support_cases_facets ON support_cases(status, priority, case_type);
+
+COMMIT;
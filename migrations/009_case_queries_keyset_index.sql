@@ -0,0 +1,12 @@
+BEGIN;
+
+-- Paginación keyset de GET /cases/{id}/queries y del detalle con
+-- queries_limit: cada página es un rango acotado del índice
+-- (case_id, executed_at, id), ya ordenado. Reemplaza a idx_case_queries_case_id,
+-- que queda cubierto por el prefijo case_id (también para la FK).
+CREATE INDEX IF NOT EXISTS idx_case_queries_case_executed_at
+    ON case_queries(case_id, executed_at, id);
+
+DROP INDEX IF EXISTS idx_case_queries_case_id;
+
+COMMIT;
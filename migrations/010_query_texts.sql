@@ -0,0 +1,79 @@
+BEGIN;
+
+-- Textos SQL direccionados por contenido: el mismo diagnóstico pegado en
+-- miles de casos se guarda una sola vez. La clave es el sha256 del texto en
+-- UTF-8, ya normalizado por CaseQuery.create (sin espacios en los extremos y
+-- con fines de línea \n); case_queries guarda solo el hash. No se borran
+-- textos: los casos no se eliminan desde la aplicación.
+CREATE TABLE IF NOT EXISTS query_texts (
+    hash BYTEA PRIMARY KEY,
+    query_text TEXT NOT NULL
+);
+
+DO $$
+DECLARE
+    queries_total BIGINT;
+    bytes_before BIGINT;
+    texts_total BIGINT;
+    bytes_after BIGINT;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'case_queries' AND column_name = 'query_text'
+    ) THEN
+        RETURN;  -- Ya migrada
+    END IF;
+
+    SELECT COUNT(*), COALESCE(SUM(octet_length(query_text)), 0)
+    INTO queries_total, bytes_before
+    FROM case_queries;
+
+    ALTER TABLE case_queries ADD COLUMN query_text_hash BYTEA;
+    ALTER TABLE case_queries ALTER COLUMN query_text DROP NOT NULL;
+
+    -- Un texto por hash (los fines de línea \r\n y \r pasan a \n, como en el dominio)
+    INSERT INTO query_texts (hash, query_text)
+    SELECT DISTINCT ON (hash) hash, normalized
+    FROM (
+        SELECT sha256(convert_to(normalized, 'UTF8')) AS hash, normalized
+        FROM (
+            SELECT replace(replace(query_text, E'\r\n', E'\n'), E'\r', E'\n') AS normalized
+            FROM case_queries
+        ) n
+    ) h
+    ORDER BY hash
+    ON CONFLICT (hash) DO NOTHING;
+
+    -- Vaciar el texto en la misma pasada: las versiones nuevas de las filas no
+    -- referencian el TOAST anterior y VACUUM recupera el espacio sin reescribir
+    -- la tabla (VACUUM FULL case_queries lo devuelve al sistema operativo)
+    UPDATE case_queries
+    SET query_text_hash = sha256(convert_to(
+            replace(replace(query_text, E'\r\n', E'\n'), E'\r', E'\n'), 'UTF8'
+        )),
+        query_text = NULL;
+
+    ALTER TABLE case_queries
+        ALTER COLUMN query_text_hash SET NOT NULL,
+        ADD CONSTRAINT fk_case_queries_query_text
+            FOREIGN KEY (query_text_hash) REFERENCES query_texts(hash),
+        DROP COLUMN query_text;
+
+    SELECT COUNT(*), COALESCE(SUM(octet_length(query_text)), 0)
+    INTO texts_total, bytes_after
+    FROM query_texts;
+
+    RAISE NOTICE
+        'query_texts: % queries, % distinct texts; text bytes % -> % (% saved, minus 32 bytes of hash per query)',
+        queries_total, texts_total, bytes_before, bytes_after, bytes_before - bytes_after;
+END $$;
+
+-- Lectura transparente: las queries con su texto
+CREATE OR REPLACE VIEW case_queries_with_text AS
+SELECT
+    q.id, q.case_id, q.database_name, q.schema_name, t.query_text,
+    q.execution_time_ms, q.rows_affected, q.executed_at, q.executed_by, q.query_text_hash
+FROM case_queries q
+JOIN query_texts t ON t.hash = q.query_text_hash;
+
+COMMIT;
@@ -0,0 +1,16 @@
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_support_cases_status ON support_cases(status);
+CREATE INDEX IF NOT EXISTS idx_support_cases_priority ON support_cases(priority);
+CREATE INDEX IF NOT EXISTS idx_support_cases_type ON support_cases(case_type);
+CREATE INDEX IF NOT EXISTS idx_support_cases_created_by ON support_cases(created_by);
+CREATE INDEX IF NOT EXISTS idx_support_cases_created_at ON support_cases(created_at DESC);
+
+DROP INDEX IF EXISTS idx_support_cases_created_at_id;
+DROP INDEX IF EXISTS idx_support_cases_title_id;
+DROP INDEX IF EXISTS idx_support_cases_status_id;
+DROP INDEX IF EXISTS idx_support_cases_priority_id;
+DROP INDEX IF EXISTS idx_support_cases_type_id;
+DROP INDEX IF EXISTS idx_support_cases_created_by_id;
+
+COMMIT;
@@ -0,0 +1,8 @@
+BEGIN;
+
+DROP INDEX IF EXISTS idx_support_cases_search_vector;
+ALTER TABLE support_cases DROP COLUMN IF EXISTS search_vector;
+
+CREATE INDEX IF NOT EXISTS idx_support_cases_title_search ON support_cases USING gin(to_tsvector('spanish', title));
+
+COMMIT;
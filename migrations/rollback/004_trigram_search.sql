@@ -0,0 +1,7 @@
+BEGIN;
+
+DROP INDEX IF EXISTS idx_support_cases_title_trgm;
+DROP INDEX IF EXISTS idx_support_cases_description_trgm;
+DROP INDEX IF EXISTS idx_support_cases_created_by_trgm;
+
+COMMIT;
@@ -0,0 +1,6 @@
+BEGIN;
+
+DROP INDEX IF EXISTS idx_support_cases_queries_count_id;
+ALTER TABLE support_cases DROP COLUMN IF EXISTS queries_count;
+
+COMMIT;
@@ -0,0 +1,10 @@
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_support_cases_status_priority ON support_cases(status, priority);
+
+DROP INDEX IF EXISTS idx_support_cases_status_created_at;
+DROP INDEX IF EXISTS idx_support_cases_priority_created_at;
+DROP INDEX IF EXISTS idx_support_cases_type_created_at;
+DROP INDEX IF EXISTS idx_support_cases_created_by_created_at;
+
+COMMIT;
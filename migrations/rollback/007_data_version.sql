@@ -0,0 +1,5 @@
+BEGIN;
+
+DROP SEQUENCE IF EXISTS data_version_seq;
+
+COMMIT;
@@ -0,0 +1,5 @@
+BEGIN;
+
+DROP INDEX IF EXISTS idx_support_cases_facets;
+
+COMMIT;
@@ -0,0 +1,7 @@
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_case_queries_case_id ON case_queries(case_id);
+
+DROP INDEX IF EXISTS idx_case_queries_case_executed_at;
+
+COMMIT;
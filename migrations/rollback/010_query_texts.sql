@@ -0,0 +1,17 @@
+BEGIN;
+
+DROP VIEW IF EXISTS case_queries_with_text;
+
+ALTER TABLE case_queries ADD COLUMN IF NOT EXISTS query_text TEXT;
+
+UPDATE case_queries q
+SET query_text = t.query_text
+FROM query_texts t
+WHERE t.hash = q.query_text_hash;
+
+ALTER TABLE case_queries ALTER COLUMN query_text SET NOT NULL;
+ALTER TABLE case_queries DROP COLUMN IF EXISTS query_text_hash;
+
+DROP TABLE IF EXISTS query_texts;
+
+COMMIT;
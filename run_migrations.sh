@@ -24,11 +24,15 @@ export PGPASSWORD=${DB_PASSWORD:-tracker_pass}
 
 echo "➡️ Conectando a $DB_USER@$DB_HOST:$DB_PORT/$DB_NAME"
 
-psql \
-  -h "$DB_HOST" \
-  -p "$DB_PORT" \
-  -U "$DB_USER" \
-  -d "$DB_NAME" \
-  -f migrations/001_initial_schema.sql
+# Aplicar migraciones en orden numérico
+for migration in migrations/[0-9]*.sql; do
+  echo "📄 Aplicando $migration"
+  psql \
+    -h "$DB_HOST" \
+    -p "$DB_PORT" \
+    -U "$DB_USER" \
+    -d "$DB_NAME" \
+    -f "$migration"
+done
 
 echo "✅ Migraciones ejecutadas correctamente"
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Benchmark de inserción masiva de queries (QueryRepositoryImpl.save_many).
+
+Compara filas/segundo de las tres formas de insertar un lote en una tabla
+temporal con la forma de case_queries: executemany (un bind/execute por
+fila), un solo INSERT ... SELECT FROM unnest() con arrays por columna y
+COPY (copy_records_to_table). Todo corre dentro de una transacción que se
+revierte: no deja rastros. Sirve para elegir SAVE_MANY_COPY_THRESHOLD.
+
+Uso:
+    python -m scripts.benchmarks.bulk_insert --sizes 10,100,1000,10000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime
+import asyncpg
+from app.config import settings
+
+COLUMNS = (
+    "id",
+    "case_id",
+    "database_name",
+    "schema_name",
+    "query_text",
+    "execution_time_ms",
+    "rows_affected",
+    "executed_at",
+    "executed_by",
+)
+
+EXECUTEMANY_SQL = f"""
+    INSERT INTO bench_queries ({", ".join(COLUMNS)})
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+"""
+
+UNNEST_SQL = f"""
+    INSERT INTO bench_queries ({", ".join(COLUMNS)})
+    SELECT * FROM unnest(
+        $1::uuid[], $2::uuid[], $3::varchar[], $4::varchar[], $5::text[],
+        $6::int[], $7::int[], $8::timestamp[], $9::varchar[]
+    )
+"""
+
+
+def _records(size: int) -> list:
+    """Filas sintéticas: un caso por lote y SQL de largo típico"""
+    case_id = uuid.uuid4()
+    now = datetime.utcnow()
+    return [
+        (
+            uuid.uuid4(),
+            case_id,
+            f"db_{i % 7}",
+            "public",
+            f"SELECT o.id, o.total FROM orders o WHERE o.customer_id = {i} AND o.status = 'open'",
+            i % 500,
+            i % 1000,
+            now,
+            "bench@empresa.com",
+        )
+        for i in range(size)
+    ]
+
+
+async def _executemany(conn: asyncpg.Connection, records: list) -> None:
+    await conn.executemany(EXECUTEMANY_SQL, records)
+
+
+async def _unnest(conn: asyncpg.Connection, records: list) -> None:
+    await conn.execute(UNNEST_SQL, *(list(column) for column in zip(*records)))
+
+
+async def _copy(conn: asyncpg.Connection, records: list) -> None:
+    await conn.copy_records_to_table("bench_queries", records=records, columns=COLUMNS)
+
+
+METHODS = {"executemany": _executemany, "unnest": _unnest, "copy": _copy}
+
+
+async def _rows_per_second(conn: asyncpg.Connection, method, size: int, rounds: int) -> float:
+    """Mejor tiempo de `rounds` lotes (cada uno en su savepoint, revertido)"""
+    best = float("inf")
+    for _ in range(rounds):
+        records = _records(size)
+        savepoint = conn.transaction()
+        await savepoint.start()
+        started = time.perf_counter()
+        await method(conn, records)
+        best = min(best, time.perf_counter() - started)
+        await savepoint.rollback()
+    return size / best
+
+
+async def main(sizes: list, rounds: int) -> None:
+    conn = await asyncpg.connect(settings.DATABASE_URL)
+    try:
+        tr = conn.transaction()
+        await tr.start()
+        try:
+            # Forma e índices de case_queries con el texto en línea (antes de query_texts);
+            # sin FK: no hace falta sembrar casos
+            await conn.execute(
+                """
+                CREATE TEMP TABLE bench_queries (
+                    id UUID PRIMARY KEY,
+                    case_id UUID NOT NULL,
+                    database_name VARCHAR(255) NOT NULL,
+                    schema_name VARCHAR(255) NOT NULL,
+                    query_text TEXT NOT NULL,
+                    execution_time_ms INTEGER,
+                    rows_affected INTEGER,
+                    executed_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                    executed_by VARCHAR(255) NOT NULL
+                ) ON COMMIT DROP
+                """
+            )
+            await conn.execute(
+                "CREATE INDEX ON bench_queries (case_id, executed_at, id);"
+                "CREATE INDEX ON bench_queries (executed_at DESC);"
+                "CREATE INDEX ON bench_queries (executed_by)"
+            )
+
+            # Calentamiento: prepara sentencias y carga el catálogo
+            for method in METHODS.values():
+                await _rows_per_second(conn, method, 10, 1)
+
+            print(f"{'filas':>8} " + " ".join(f"{name:>14}" for name in METHODS) + "   (filas/s)")
+            for size in sizes:
+                results = [
+                    await _rows_per_second(conn, method, size, rounds)
+                    for method in METHODS.values()
+                ]
+                print(f"{size:>8} " + " ".join(f"{value:>14,.0f}" for value in results))
+        finally:
+            await tr.rollback()
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="1,10,50,100,200,500,1000,10000",
+        help="Tamaños de lote separados por coma",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Repeticiones por tamaño (mejor tiempo)"
+    )
+    args = parser.parse_args()
+    asyncio.run(main([int(size) for size in args.sizes.split(",")], args.rounds))
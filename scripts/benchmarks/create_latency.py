@@ -0,0 +1,127 @@
+"""
+Benchmark de latencia de POST /cases: sentencia única vs Unit of Work.
+
+Levanta un proxy TCP local que demora cada paquete entre la app y
+PostgreSQL (la mitad del RTT en cada sentido) y crea casos con
+CreateCaseUseCase por los dos caminos: una sentencia con CTE (un
+round-trip) y la transacción del Unit of Work (BEGIN, INSERT, save_many,
+COMMIT). Muestra p50/p95 por camino y cantidad de queries. Los casos
+creados se borran al final.
+
+Uso:
+    python -m scripts.benchmarks.create_latency --rtt-ms 2 --creates 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from app.config import settings
+from app.application.use_cases.create_case import CreateCaseUseCase
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
+from app.infrastructure.database.unit_of_work import PostgreSQLUnitOfWork
+
+BENCH_TITLE = "bench-create-latency"
+
+
+async def _pipe(reader, writer, delay: float) -> None:
+    """Reenvía lo que llega por `reader` después de `delay` segundos, sin reordenar"""
+    pending: asyncio.Queue = asyncio.Queue()
+
+    async def forward():
+        while True:
+            due, data = await pending.get()
+            if data is None:
+                break
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    forwarder = asyncio.create_task(forward())
+    try:
+        while data := await reader.read(65536):
+            pending.put_nowait((time.perf_counter() + delay, data))
+    finally:
+        pending.put_nowait((0.0, None))
+        await forwarder
+
+
+async def _start_proxy(host: str, port: int, rtt: float):
+    """Proxy hacia host:port con `rtt` segundos de ida y vuelta"""
+
+    async def handle(client_reader, client_writer):
+        server_reader, server_writer = await asyncio.open_connection(host, port)
+        await asyncio.gather(
+            _pipe(client_reader, server_writer, rtt / 2),
+            _pipe(server_reader, client_writer, rtt / 2),
+            return_exceptions=True,
+        )
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def _use_case(db: DatabaseConnection, single_statement: bool) -> CreateCaseUseCase:
+    return CreateCaseUseCase(
+        CaseRepositoryImpl(db),
+        QueryRepositoryImpl(db),
+        PostgreSQLUnitOfWork(db),
+        single_statement_max_queries=10_000 if single_statement else 0,
+    )
+
+
+async def _latencies(use_case: CreateCaseUseCase, queries: int, creates: int) -> list:
+    payload = [
+        {"database_name": "db", "schema_name": "public", "query_text": f"SELECT {i}"}
+        for i in range(queries)
+    ]
+    latencies = []
+    for _ in range(creates):
+        started = time.perf_counter()
+        await use_case.execute(
+            title=BENCH_TITLE,
+            description=None,
+            case_type="support",
+            priority="low",
+            queries=payload,
+            created_by="bench@empresa.com",
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def main(rtt_ms: float, creates: int, query_counts: list) -> None:
+    proxy = await _start_proxy(settings.DB_HOST, settings.DB_PORT, rtt_ms / 1000)
+    # El pool se conecta al proxy en lugar de a PostgreSQL
+    settings.DB_HOST, settings.DB_PORT = proxy.sockets[0].getsockname()[:2]
+    db = DatabaseConnection()
+    await db.connect()
+    try:
+        print(f"RTT simulado: {rtt_ms} ms, {creates} creaciones por caso")
+        print(f"{'queries':>8} {'camino':>16} {'p50 ms':>9} {'p95 ms':>9}")
+        for queries in query_counts:
+            for name, single in (("sentencia única", True), ("unit of work", False)):
+                use_case = _use_case(db, single)
+                await _latencies(use_case, queries, 3)  # calentamiento
+                latencies = sorted(await _latencies(use_case, queries, creates))
+                p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+                print(f"{queries:>8} {name:>16} {statistics.median(latencies):>9.2f} {p95:>9.2f}")
+    finally:
+        await db.execute("DELETE FROM support_cases WHERE title = $1", BENCH_TITLE)
+        await db.disconnect()
+        proxy.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="RTT simulado en milisegundos")
+    parser.add_argument("--creates", type=int, default=50, help="Creaciones por camino")
+    parser.add_argument(
+        "--queries", default="0,1,5,20", help="Cantidades de queries por caso, separadas por coma"
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        main(args.rtt_ms, args.creates, [int(count) for count in args.queries.split(",")])
+    )
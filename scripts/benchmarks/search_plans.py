@@ -0,0 +1,114 @@
+"""
+Benchmark de planes de búsqueda por fragmentos y difusa (pg_trgm).
+
+Crea una tabla temporal con la forma de support_cases, la llena con filas
+sintéticas y muestra el plan (EXPLAIN ANALYZE) de las búsquedas de
+match=substring y match=fuzzy antes y después de crear los índices trigram.
+Todo corre dentro de una transacción que se revierte: no deja rastros.
+
+Uso (requiere la migración 004 aplicada para la extensión pg_trgm):
+    python -m scripts.benchmarks.search_plans --rows 200000
+"""
+
+import argparse
+import asyncio
+import json
+import asyncpg
+from app.config import settings
+
+SEED_SQL = """
+    INSERT INTO bench_cases (id, title, description, created_by)
+    SELECT
+        gen_random_uuid(),
+        (ARRAY['Error', 'Timeout', 'Bloqueo', 'Lentitud', 'Fallo'])[1 + i % 5]
+            || ' en ' || (ARRAY['replicación', 'reportes', 'facturación', 'login', 'backup'])[1 + i % 7 % 5]
+            || ' #' || i,
+        'Detalle del incidente ' || md5(i::text),
+        'usuario' || (i % 5000) || '@empresa' || (i % 37) || '.com'
+    FROM generate_series(1, $1) AS i
+"""
+
+INDEX_SQL = (
+    "CREATE INDEX ON bench_cases USING GIN (title gin_trgm_ops)",
+    "CREATE INDEX ON bench_cases USING GIN (description gin_trgm_ops)",
+    "CREATE INDEX ON bench_cases USING GIN (created_by gin_trgm_ops)",
+)
+
+# Las mismas condiciones que arma CaseRepositoryImpl.get_all
+QUERIES = {
+    "search substring": (
+        "SELECT id FROM bench_cases WHERE title ILIKE $1 OR description ILIKE $1",
+        "%plicaci%",
+    ),
+    "search fuzzy": (
+        "SELECT id FROM bench_cases WHERE $1 <% title OR $1 <% description",
+        "facturacion",
+    ),
+    "created_by substring": (
+        "SELECT id FROM bench_cases WHERE created_by ILIKE $1",
+        "%ario123@%",
+    ),
+    "created_by fuzzy": (
+        "SELECT id FROM bench_cases WHERE $1 <% created_by",
+        "usuario1234@empesa",
+    ),
+}
+
+
+def _scan_nodes(plan: dict) -> list:
+    """Lista los nodos de acceso a la tabla del plan"""
+    nodes = []
+    if "Relation Name" in plan or plan["Node Type"].startswith("Bitmap Index"):
+        nodes.append(plan["Node Type"])
+    for child in plan.get("Plans", []):
+        nodes.extend(_scan_nodes(child))
+    return nodes
+
+
+async def _explain(conn: asyncpg.Connection, label: str) -> None:
+    print(f"\n== {label} ==")
+    for name, (sql, term) in QUERIES.items():
+        raw = await conn.fetchval(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", term)
+        result = json.loads(raw)[0]
+        plan = result["Plan"]
+        print(
+            f"{name:<22} {result['Execution Time']:>9.2f} ms  "
+            f"rows={int(plan['Actual Rows']):<6} {' + '.join(_scan_nodes(plan))}"
+        )
+
+
+async def main(rows: int) -> None:
+    conn = await asyncpg.connect(settings.DATABASE_URL)
+    try:
+        tr = conn.transaction()
+        await tr.start()
+        try:
+            await conn.execute(
+                """
+                CREATE TEMP TABLE bench_cases (
+                    id UUID PRIMARY KEY,
+                    title VARCHAR(255) NOT NULL,
+                    description TEXT,
+                    created_by VARCHAR(255) NOT NULL
+                ) ON COMMIT DROP
+                """
+            )
+            await conn.execute(SEED_SQL, rows)
+            await conn.execute("ANALYZE bench_cases")
+            await _explain(conn, f"sin índices trigram ({rows} filas)")
+
+            for sql in INDEX_SQL:
+                await conn.execute(sql)
+            await conn.execute("ANALYZE bench_cases")
+            await _explain(conn, f"con índices trigram ({rows} filas)")
+        finally:
+            await tr.rollback()
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="Filas sintéticas a generar")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
@@ -29,7 +29,9 @@ async def db_connection():
 async def clean_database(db_connection):
     """Limpia la DB antes de cada test"""
     try:
-        await db_connection.execute("TRUNCATE case_queries, support_cases CASCADE")
+        await db_connection.execute("TRUNCATE case_queries, support_cases, query_texts CASCADE")
+        # El TRUNCATE es una escritura: invalidar los caches en memoria y los ETag
+        await db_connection.execute("SELECT nextval('data_version_seq')")
     except Exception:
         # Si las tablas no existen, no hacer nada
         pass
@@ -1,6 +1,13 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
 import pytest
 from httpx import AsyncClient
 from uuid import uuid4
+from app.config import settings
+from app.infrastructure.database.db import case_write_coalescer
 from app.main import app
 
 
@@ -37,6 +44,43 @@ class TestCaseAPI:
             assert len(data["queries"]) == 1
             assert data["queries"][0]["database_name"] == "test_db"
 
+    async def test_create_cases_concurrently_with_group_commit(self, monkeypatch):
+        """Con group commit, altas concurrentes deben escribirse en menos lotes que casos"""
+        monkeypatch.setattr(settings, "CREATE_CASE_GROUP_COMMIT", True)
+        monkeypatch.setattr(case_write_coalescer, "_window_seconds", 0.05)
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            before = (await client.get("/api/v1/metrics/group-commit")).json()
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        "/api/v1/cases/",
+                        json={
+                            "title": f"Concurrente {i}",
+                            "case_type": "support",
+                            "priority": "low",
+                            "queries": [
+                                {
+                                    "database_name": "db",
+                                    "schema_name": "public",
+                                    "query_text": f"SELECT {i}",
+                                }
+                            ],
+                            "created_by": "test@example.com",
+                        },
+                    )
+                    for i in range(8)
+                )
+            )
+            assert [response.status_code for response in responses] == [201] * 8
+
+            for response in responses:
+                detail = await client.get(f"/api/v1/cases/{response.json()['id']}")
+                assert detail.json()["queries_count"] == 1
+            after = (await client.get("/api/v1/metrics/group-commit")).json()
+            assert after["enabled"] is True
+            assert after["cases"] - before["cases"] == 8
+            assert after["batches"] - before["batches"] < 8
+
     async def test_create_case_endpoint_without_queries(self):
         """Test crear caso sin queries"""
         async with AsyncClient(app=app, base_url="http://test") as client:
@@ -280,6 +324,125 @@ class TestCaseAPI:
             assert data["queries"][0]["database_name"] == "test_db"
             assert data["queries"][0]["query_text"] == "SELECT * FROM users"
 
+    async def test_get_case_queries_endpoint_keyset_pagination(self):
+        """Test paginar las queries de un caso y el detalle con queries_limit"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            create_response = await client.post(
+                "/api/v1/cases/",
+                json={
+                    "title": "Case with many queries",
+                    "case_type": "support",
+                    "priority": "low",
+                    "created_by": "test@example.com",
+                    "queries": [
+                        {
+                            "database_name": "sales" if i % 2 else "hr",
+                            "schema_name": "public",
+                            "query_text": f"SELECT {i}",
+                        }
+                        for i in range(5)
+                    ],
+                },
+            )
+            assert create_response.status_code == 201
+            case_id = create_response.json()["id"]
+
+            detail = await client.get(f"/api/v1/cases/{case_id}?queries_limit=2")
+            assert detail.status_code == 200
+            data = detail.json()
+            assert len(data["queries"]) == 2
+            assert data["queries_count"] == 5
+
+            # El cursor del detalle continúa en el sub-recurso
+            seen = [q["id"] for q in data["queries"]]
+            cursor = data["queries_next_cursor"]
+            while cursor:
+                page = await client.get(
+                    f"/api/v1/cases/{case_id}/queries", params={"cursor": cursor, "limit": 2}
+                )
+                assert page.status_code == 200
+                seen.extend(q["id"] for q in page.json()["items"])
+                cursor = page.json()["next_cursor"]
+            assert sorted(seen) == sorted(q["id"] for q in create_response.json()["queries"])
+            assert len(set(seen)) == 5
+
+            full = await client.get(f"/api/v1/cases/{case_id}")
+            assert full.json()["queries_next_cursor"] is None
+            assert full.headers["etag"] != detail.headers["etag"]
+
+            filtered = await client.get(
+                f"/api/v1/cases/{case_id}/queries", params={"database_name": "sales"}
+            )
+            assert filtered.status_code == 200
+            assert [q["query_text"] for q in filtered.json()["items"]] == [
+                "SELECT 1",
+                "SELECT 3",
+            ]
+            assert filtered.json()["has_more"] is False
+
+            # Un cursor de otros filtros no es válido
+            mismatch = await client.get(
+                f"/api/v1/cases/{case_id}/queries",
+                params={"cursor": data["queries_next_cursor"], "database_name": "hr"},
+            )
+            assert mismatch.status_code == 400
+
+            missing = await client.get(f"/api/v1/cases/{uuid4()}/queries")
+            assert missing.status_code == 404
+
+    async def test_query_text_preview_and_full_text_endpoint(self):
+        """Test vista previa de query_text y texto completo por endpoint dedicado"""
+        long_text = "SELECT " + ", ".join(f"column_{i}" for i in range(2000)) + " FROM t"
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            create_response = await client.post(
+                "/api/v1/cases/",
+                json={
+                    "title": "Case with a long query",
+                    "case_type": "support",
+                    "priority": "low",
+                    "created_by": "test@example.com",
+                    "queries": [
+                        {"database_name": "db", "schema_name": "public", "query_text": long_text}
+                    ],
+                },
+            )
+            assert create_response.status_code == 201
+            case_id = create_response.json()["id"]
+            query_id = create_response.json()["queries"][0]["id"]
+
+            full = await client.get(f"/api/v1/cases/{case_id}")
+            preview = await client.get(f"/api/v1/cases/{case_id}?query_text=preview")
+            assert preview.status_code == 200
+            query = preview.json()["queries"][0]
+            assert long_text.startswith(query["query_text"])
+            assert len(query["query_text"]) < len(long_text)
+            assert query["query_text_truncated"] is True
+            assert query["query_text_bytes"] == len(long_text)
+            assert full.json()["queries"][0]["query_text"] == long_text
+            assert preview.headers["etag"] != full.headers["etag"]
+
+            page = await client.get(
+                f"/api/v1/cases/{case_id}/queries", params={"query_text": "preview"}
+            )
+            assert page.json()["items"][0]["query_text_truncated"] is True
+
+            text = await client.get(f"/api/v1/cases/{case_id}/queries/{query_id}/text")
+            assert text.status_code == 200
+            assert text.headers["content-type"].startswith("text/plain")
+            assert text.text == long_text
+
+            not_modified = await client.get(
+                f"/api/v1/cases/{case_id}/queries/{query_id}/text",
+                headers={"If-None-Match": text.headers["etag"]},
+            )
+            assert not_modified.status_code == 304
+
+            missing = await client.get(f"/api/v1/cases/{case_id}/queries/{uuid4()}/text")
+            assert missing.status_code == 404
+
+            invalid = await client.get(f"/api/v1/cases/{case_id}?query_text=short")
+            assert invalid.status_code == 422
+
     async def test_get_case_by_id_endpoint_not_found(self):
         """Test obtener caso con ID inexistente"""
         async with AsyncClient(app=app, base_url="http://test") as client:
@@ -305,3 +468,549 @@ class TestCaseAPI:
 
             # FastAPI valida automáticamente el UUID y retorna 422
             assert response.status_code == 422
+
+    async def test_get_cases_endpoint_with_cursor_pagination(self):
+        """Test paginación keyset recorriendo next_cursor"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            for i in range(5):
+                await client.post(
+                    "/api/v1/cases/",
+                    json={
+                        "title": f"Cursor test case {i+1}",
+                        "case_type": "support",
+                        "priority": "medium",
+                        "created_by": "test@example.com",
+                        "queries": [],
+                    },
+                )
+
+            response = await client.get("/api/v1/cases/?page_size=2&sort_by=title&sort_order=asc")
+            assert response.status_code == 200
+            data = response.json()
+            titles = [item["title"] for item in data["items"]]
+            assert data["has_more"] is True
+
+            while data["next_cursor"]:
+                response = await client.get(
+                    "/api/v1/cases/",
+                    params={
+                        "page_size": 2,
+                        "sort_by": "title",
+                        "sort_order": "asc",
+                        "cursor": data["next_cursor"],
+                    },
+                )
+                assert response.status_code == 200
+                data = response.json()
+                titles.extend(item["title"] for item in data["items"])
+
+            assert titles == [f"Cursor test case {i+1}" for i in range(5)]
+
+            # El cursor queda ligado a los filtros con los que se generó
+            first = await client.get("/api/v1/cases/?page_size=2&sort_by=title&sort_order=asc")
+            response = await client.get(
+                "/api/v1/cases/",
+                params={
+                    "page_size": 2,
+                    "sort_by": "title",
+                    "sort_order": "asc",
+                    "status": "open",
+                    "cursor": first.json()["next_cursor"],
+                },
+            )
+            assert response.status_code == 400
+
+    async def test_get_cases_endpoint_with_invalid_cursor(self):
+        """Test cursor inválido retorna 400"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/api/v1/cases/?cursor=invalid")
+
+            assert response.status_code == 400
+
+    async def test_get_cases_endpoint_without_count(self):
+        """Test listado sin total (count_mode=none)"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            for i in range(3):
+                await client.post(
+                    "/api/v1/cases/",
+                    json={
+                        "title": f"No count case {i+1}",
+                        "case_type": "support",
+                        "priority": "medium",
+                        "created_by": "test@example.com",
+                        "queries": [],
+                    },
+                )
+
+            response = await client.get("/api/v1/cases/?page_size=2&count_mode=none")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["items"]) == 2
+            assert data["total"] is None
+            assert data["pages"] is None
+            assert data["has_more"] is True
+
+    async def test_cache_metrics_endpoint_counts_hits(self):
+        """Test que el total repetido se sirve desde el cache de conteo"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            before = (await client.get("/api/v1/metrics/cache")).json()["count_cache"]
+
+            await client.get("/api/v1/cases/?status=open")
+            await client.get("/api/v1/cases/?status=open")
+
+            response = await client.get("/api/v1/metrics/cache")
+
+            assert response.status_code == 200
+            after = response.json()["count_cache"]
+            assert after["misses"] == before["misses"] + 1
+            assert after["hits"] == before["hits"] + 1
+
+    async def test_case_detail_is_served_from_cache(self):
+        """Test el segundo detalle del mismo caso se sirve desde el cache"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            created = await client.post(
+                "/api/v1/cases/",
+                json={
+                    "title": "Detail cache case",
+                    "case_type": "support",
+                    "priority": "low",
+                    "created_by": "test@example.com",
+                    "queries": [
+                        {"database_name": "db", "schema_name": "public", "query_text": "SELECT 1"}
+                    ],
+                },
+            )
+            case_id = created.json()["id"]
+            before = (await client.get("/api/v1/metrics/cache")).json()["case_detail_cache"]
+
+            first = await client.get(f"/api/v1/cases/{case_id}")
+            second = await client.get(f"/api/v1/cases/{case_id}")
+
+            assert first.json() == second.json()
+            after = (await client.get("/api/v1/metrics/cache")).json()["case_detail_cache"]
+            assert after["misses"] == before["misses"] + 1
+            assert after["hits"] == before["hits"] + 1
+            assert after["bytes"] > 0
+
+    async def test_statement_metrics_endpoint(self):
+        """Test métricas por forma de consulta del listado"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            await client.get("/api/v1/cases/?status=open&count_mode=exact")
+            await client.get("/api/v1/cases/?status=open&count_mode=exact")
+
+            response = await client.get("/api/v1/metrics/statements")
+            assert response.status_code == 200
+            shapes = {item["shape"]: item for item in response.json()["statements"]}
+            listing = shapes["list:status|created_at:desc|offset"]
+            assert listing["executions"] >= 2
+            assert "count:status" in shapes
+
+    async def test_get_cases_endpoint_returns_304_when_unchanged(self):
+        """Test ETag del listado: 304 mientras no haya escrituras"""
+        case_json = {
+            "title": "ETag case",
+            "case_type": "support",
+            "priority": "low",
+            "created_by": "test@example.com",
+            "queries": [],
+        }
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            await client.post("/api/v1/cases/", json=case_json)
+
+            response = await client.get("/api/v1/cases/?page_size=5")
+            etag = response.headers["etag"]
+            assert response.headers["cache-control"] == "private, no-cache"
+
+            cached = await client.get("/api/v1/cases/?page_size=5", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.content == b""
+
+            # Otros parámetros son otra representación
+            other = await client.get("/api/v1/cases/?page_size=6", headers={"If-None-Match": etag})
+            assert other.status_code == 200
+
+            # Una escritura cambia la marca de agua
+            await client.post("/api/v1/cases/", json=case_json)
+            changed = await client.get("/api/v1/cases/?page_size=5", headers={"If-None-Match": etag})
+            assert changed.status_code == 200
+            assert changed.headers["etag"] != etag
+            assert changed.json()["total"] == 2
+
+    async def test_get_case_by_id_endpoint_returns_304_when_unchanged(self):
+        """Test ETag del detalle basado en id, updated_at y cantidad de queries"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            create_response = await client.post(
+                "/api/v1/cases/",
+                json={
+                    "title": "ETag detail",
+                    "case_type": "support",
+                    "priority": "low",
+                    "created_by": "test@example.com",
+                    "queries": [
+                        {
+                            "database_name": "test_db",
+                            "schema_name": "public",
+                            "query_text": "SELECT 1",
+                        }
+                    ],
+                },
+            )
+            case_id = create_response.json()["id"]
+
+            response = await client.get(f"/api/v1/cases/{case_id}")
+            etag = response.headers["etag"]
+
+            cached = await client.get(f"/api/v1/cases/{case_id}", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.headers["etag"] == etag
+
+            stale = await client.get(
+                f"/api/v1/cases/{case_id}", headers={"If-None-Match": '"otro"'}
+            )
+            assert stale.status_code == 200
+
+    async def test_get_case_query_endpoint_is_immutable(self):
+        """Test que una query se sirve con Cache-Control immutable"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            create_response = await client.post(
+                "/api/v1/cases/",
+                json={
+                    "title": "Immutable query",
+                    "case_type": "support",
+                    "priority": "low",
+                    "created_by": "test@example.com",
+                    "queries": [
+                        {
+                            "database_name": "test_db",
+                            "schema_name": "public",
+                            "query_text": "SELECT 42",
+                        }
+                    ],
+                },
+            )
+            case = create_response.json()
+            query_id = case["queries"][0]["id"]
+            url = f"/api/v1/cases/{case['id']}/queries/{query_id}"
+
+            response = await client.get(url)
+            assert response.status_code == 200
+            assert response.json()["query_text"] == "SELECT 42"
+            assert "immutable" in response.headers["cache-control"]
+
+            cached = await client.get(url, headers={"If-None-Match": response.headers["etag"]})
+            assert cached.status_code == 304
+
+            missing = await client.get(f"/api/v1/cases/{case['id']}/queries/{uuid4()}")
+            assert missing.status_code == 404
+
+    async def test_get_case_facets_endpoint(self):
+        """Test facetas por estado, prioridad y tipo en una sola llamada"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            for priority in ("high", "high", "low"):
+                await client.post(
+                    "/api/v1/cases/",
+                    json={
+                        "title": f"Facet case {priority}",
+                        "case_type": "support",
+                        "priority": priority,
+                        "created_by": "test@example.com",
+                        "queries": [],
+                    },
+                )
+
+            response = await client.get("/api/v1/cases/facets?case_type=support")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 3
+            assert data["status"]["open"] == 3
+            assert data["priority"] == {"low": 1, "medium": 0, "high": 2, "critical": 0}
+            assert data["case_type"]["support"] == 3
+
+            filtered = await client.get("/api/v1/cases/facets?priority=low")
+            assert filtered.json()["total"] == 1
+
+    async def test_export_cases_endpoint_ndjson_and_csv(self):
+        """Test exportación en streaming como NDJSON y CSV"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            for i in range(3):
+                await client.post(
+                    "/api/v1/cases/",
+                    json={
+                        "title": f"Export case {i}",
+                        "case_type": "support",
+                        "priority": "medium",
+                        "created_by": "test@example.com",
+                        "queries": [
+                            {
+                                "database_name": "test_db",
+                                "schema_name": "public",
+                                "query_text": f"SELECT {i}",
+                            }
+                        ],
+                    },
+                )
+
+            response = await client.get("/api/v1/cases/export?format=ndjson&include_queries=true")
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert [line["title"] for line in lines] == [f"Export case {i}" for i in range(3)]
+            assert lines[0]["queries"][0]["query_text"] == "SELECT 0"
+
+            response = await client.get("/api/v1/cases/export?format=csv&priority=medium")
+            assert response.status_code == 200
+            rows = list(csv.DictReader(io.StringIO(response.text)))
+            assert len(rows) == 3
+            assert rows[0]["queries_count"] == "1"
+
+            empty = await client.get("/api/v1/cases/export?format=csv&priority=low")
+            assert empty.text.strip().startswith("id,title")
+            assert len(empty.text.strip().splitlines()) == 1
+
+            invalid = await client.get("/api/v1/cases/export?format=xml")
+            assert invalid.status_code == 422
+
+    async def test_list_cases_with_fields_and_include_queries(self):
+        """Test proyección fields= e include=queries en el listado"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            await client.post(
+                "/api/v1/cases/",
+                json={
+                    "title": "Projected case",
+                    "description": "No debería viajar",
+                    "case_type": "support",
+                    "priority": "high",
+                    "created_by": "test@example.com",
+                    "queries": [
+                        {
+                            "database_name": "test_db",
+                            "schema_name": "public",
+                            "query_text": "SELECT 1",
+                        }
+                    ],
+                },
+            )
+
+            response = await client.get("/api/v1/cases/?fields=title,status")
+            assert response.status_code == 200
+            item = response.json()["items"][0]
+            assert set(item) == {"id", "title", "status"}
+
+            response = await client.get("/api/v1/cases/?fields=title&include=queries")
+            item = response.json()["items"][0]
+            assert set(item) == {"id", "title", "queries"}
+            assert item["queries"][0]["query_text"] == "SELECT 1"
+
+            response = await client.get("/api/v1/cases/")
+            item = response.json()["items"][0]
+            assert "queries" not in item
+            assert item["description"] == "No debería viajar"
+
+            invalid = await client.get("/api/v1/cases/?fields=title,secret")
+            assert invalid.status_code == 400
+
+    async def test_batch_get_cases_endpoint(self):
+        """Test multi-get: casos en el orden pedido e IDs inexistentes en missing"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            ids = []
+            for i in range(2):
+                response = await client.post(
+                    "/api/v1/cases/",
+                    json={
+                        "title": f"Batch case {i}",
+                        "case_type": "support",
+                        "priority": "low",
+                        "created_by": "test@example.com",
+                        "queries": [
+                            {
+                                "database_name": "test_db",
+                                "schema_name": "public",
+                                "query_text": f"SELECT {i}",
+                            }
+                        ],
+                    },
+                )
+                ids.append(response.json()["id"])
+            missing_id = str(uuid4())
+
+            response = await client.post(
+                "/api/v1/cases/batch-get", json={"ids": [ids[1], missing_id, ids[0]]}
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert [item["id"] for item in data["items"]] == [ids[1], ids[0]]
+            assert data["items"][0]["queries"][0]["query_text"] == "SELECT 1"
+            assert data["missing"] == [missing_id]
+
+            empty = await client.post("/api/v1/cases/batch-get", json={"ids": []})
+            assert empty.status_code == 422
+
+    async def test_export_columnar_endpoint(self):
+        """Test exportación columnar de casos (Parquet) y queries (Arrow IPC)"""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            for i in range(2):
+                await client.post(
+                    "/api/v1/cases/",
+                    json={
+                        "title": f"Columnar case {i}",
+                        "case_type": "support",
+                        "priority": "high",
+                        "created_by": "test@example.com",
+                        "queries": [
+                            {
+                                "database_name": "test_db",
+                                "schema_name": "public",
+                                "query_text": f"SELECT {i}",
+                            }
+                        ],
+                    },
+                )
+
+            response = await client.get("/api/v1/cases/export/columnar?format=parquet")
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/vnd.apache.parquet"
+            assert "support_cases.parquet" in response.headers["content-disposition"]
+            cases = pq.read_table(io.BytesIO(response.content))
+            assert cases.column("title").to_pylist() == ["Columnar case 0", "Columnar case 1"]
+
+            response = await client.get(
+                "/api/v1/cases/export/columnar?format=arrow&table=case_queries&priority=high"
+            )
+            assert response.status_code == 200
+            queries = pa.ipc.open_stream(response.content).read_all()
+            assert queries.column("query_text").to_pylist() == ["SELECT 0", "SELECT 1"]
+            assert queries.column("execution_time_ms").type == pa.int32()
+
+            invalid = await client.get("/api/v1/cases/export/columnar?table=users")
+            assert invalid.status_code == 422
+
+    async def test_ingest_cases_ndjson_endpoint(self, monkeypatch):
+        """Test ingesta NDJSON en streaming: lotes, errores por línea y líneas largas"""
+        monkeypatch.setattr(settings, "BULK_IMPORT_CHUNK_SIZE", 2)
+        monkeypatch.setattr(settings, "INGEST_MAX_LINE_BYTES", 512)
+
+        def case_line(i):
+            return json.dumps(
+                {
+                    "title": f"Ingerido {i}",
+                    "case_type": "support",
+                    "priority": "low",
+                    "created_by": "legacy@example.com",
+                    "queries": [
+                        {"database_name": "db", "schema_name": "public", "query_text": "SELECT 1"}
+                    ],
+                }
+            )
+
+        lines = [
+            case_line(1),
+            "",
+            "{not json",
+            case_line(2),
+            json.dumps({"title": "", "case_type": "support"}),
+            json.dumps({"title": "x" * 1000}),
+            case_line(3),
+            case_line(4),
+        ]
+        body = "\n".join(lines).encode("utf-8")  # La última línea sin salto final
+
+        async def chunks(data: bytes):
+            # Partes que cortan las líneas por la mitad
+            for start in range(0, len(data), 37):
+                yield data[start : start + 37]
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.post(
+                "/api/v1/cases/ingest",
+                content=chunks(body),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert (data["received"], data["created"], data["failed"]) == (7, 4, 3)
+            assert data["batches"] == 2
+            assert [error["line"] for error in data["errors"]] == [3, 5, 6]
+            assert "512 bytes" in data["errors"][2]["error"]
+            assert data["errors_truncated"] is False
+
+            listing = await client.get("/api/v1/cases/?search=Ingerido&page_size=10")
+            assert listing.json()["total"] == 4
+
+            compressed = await client.post(
+                "/api/v1/cases/ingest",
+                content=chunks(gzip.compress((case_line(5) + "\n").encode("utf-8"))),
+                headers={"Content-Encoding": "gzip"},
+            )
+            assert compressed.json()["created"] == 1
+
+            monkeypatch.setattr(settings, "INGEST_MAX_REPORTED_ERRORS", 1)
+            truncated = await client.post("/api/v1/cases/ingest", content=b"{}\n{}\n")
+            assert truncated.json()["failed"] == 2
+            assert len(truncated.json()["errors"]) == 1
+            assert truncated.json()["errors_truncated"] is True
+
+    async def test_bulk_create_cases_endpoint(self, monkeypatch):
+        """Test importación masiva: resultados por elemento, gzip y límites"""
+        monkeypatch.setattr(settings, "BULK_IMPORT_MAX_ITEMS", 5)
+        items = [
+            {
+                "title": f"Legacy ticket {i}",
+                "case_type": "support",
+                "priority": "low",
+                "created_by": "legacy@example.com",
+                "queries": [
+                    {"database_name": "db", "schema_name": "public", "query_text": f"SELECT {i}"}
+                ],
+            }
+            for i in range(3)
+        ]
+        items.insert(1, {"title": "", "case_type": "support"})
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.post(
+                "/api/v1/cases/bulk",
+                content=gzip.compress(json.dumps({"items": items}).encode("utf-8")),
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["created"] == 3 and data["failed"] == 1
+            assert [item["status"] for item in data["items"]] == [
+                "created",
+                "error",
+                "created",
+                "created",
+            ]
+            assert data["items"][1]["id"] is None and "title" in data["items"][1]["error"]
+
+            detail = await client.get(f"/api/v1/cases/{data['items'][3]['id']}")
+            assert detail.status_code == 200
+            assert detail.json()["title"] == "Legacy ticket 2"
+            assert detail.json()["queries_count"] == 1
+
+            too_many = await client.post("/api/v1/cases/bulk", json={"items": items * 2})
+            assert too_many.status_code == 413
+
+            empty = await client.post("/api/v1/cases/bulk", json={"items": []})
+            assert empty.status_code == 400
+
+            bad_gzip = await client.post(
+                "/api/v1/cases/bulk",
+                content=b"not gzip",
+                headers={"Content-Encoding": "gzip"},
+            )
+            assert bad_gzip.status_code == 400
+
+            monkeypatch.setattr(settings, "BULK_IMPORT_MAX_BYTES", 1024)
+            bomb = gzip.compress(b'{"items": [' + b" " * 100_000 + b"]}")
+            too_large = await client.post(
+                "/api/v1/cases/bulk", content=bomb, headers={"Content-Encoding": "gzip"}
+            )
+            assert too_large.status_code == 413
@@ -1,9 +1,13 @@
 import pytest
 from uuid import uuid4
-from app.domain.entities.case import SupportCase
+from app.domain.entities.case import SupportCase, CaseQuery
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
 from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
+from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
 
 
 @pytest.mark.asyncio
@@ -41,3 +45,128 @@ class TestCaseRepository:
 
         result = await repo.get_by_id(non_existent_id)
         assert result is None
+
+    async def test_get_with_queries_loads_case_and_ordered_queries(self, db_connection):
+        """Debe traer el caso con sus queries ordenadas por ejecución en una consulta"""
+        repo = CaseRepositoryImpl(db_connection)
+        query_repo = QueryRepositoryImpl(db_connection)
+
+        case = SupportCase.create(
+            title="Test case",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            created_by="test@example.com",
+        )
+        await repo.save(case)
+        queries = [
+            CaseQuery.create(
+                case_id=case.id,
+                database_name="db",
+                schema_name="public",
+                query_text=f"SELECT {i}",
+                executed_by="test@example.com",
+                execution_time_ms=i,
+            )
+            for i in range(3)
+        ]
+        # Guardadas en orden inverso: el orden debe venir de executed_at
+        for query in reversed(queries):
+            await query_repo.save(query)
+
+        retrieved = await repo.get_with_queries(case.id)
+
+        assert retrieved.id == case.id
+        assert retrieved.title == "Test case"
+        assert retrieved.queries_count == 3
+        assert [q.query_text for q in retrieved.queries] == ["SELECT 0", "SELECT 1", "SELECT 2"]
+        assert retrieved.queries[1].execution_time_ms == 1
+        assert all(q.case_id == case.id for q in retrieved.queries)
+
+    async def test_get_with_queries_without_queries_or_case(self, db_connection):
+        """Debe retornar el caso sin queries, o None si no existe"""
+        repo = CaseRepositoryImpl(db_connection)
+        case = SupportCase.create(
+            title="Empty case",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.LOW,
+            created_by="test@example.com",
+        )
+        await repo.save(case)
+
+        retrieved = await repo.get_with_queries(case.id)
+
+        assert retrieved.id == case.id
+        assert retrieved.queries == []
+        assert await repo.get_with_queries(uuid4()) is None
+
+    async def test_get_many_returns_existing_cases(self, db_connection):
+        """Debe retornar los casos existentes en una consulta e ignorar IDs inexistentes"""
+        repo = CaseRepositoryImpl(db_connection)
+        cases = [
+            SupportCase.create(
+                title=f"Case {i}",
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.LOW,
+                created_by="test@example.com",
+            )
+            for i in range(3)
+        ]
+        for case in cases:
+            await repo.save(case)
+
+        result = await repo.get_many([cases[0].id, uuid4(), cases[2].id])
+
+        assert {case.id for case in result} == {cases[0].id, cases[2].id}
+        assert await repo.get_many([]) == []
+
+    async def test_repair_queries_count(self, db_connection):
+        """Debe recalcular queries_count solo en los casos desincronizados"""
+        repo = CaseRepositoryImpl(db_connection)
+        query_repo = QueryRepositoryImpl(db_connection)
+
+        case = SupportCase.create(
+            title="Test case",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            created_by="test@example.com",
+        )
+        other = SupportCase.create(
+            title="Other case",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.LOW,
+            created_by="test@example.com",
+        )
+        await repo.save(case)
+        await repo.save(other)
+        await query_repo.save_many(
+            [
+                CaseQuery.create(
+                    case_id=case.id,
+                    database_name="db",
+                    schema_name="public",
+                    query_text=f"SELECT {i}",
+                    executed_by="test@example.com",
+                )
+                for i in range(2)
+            ]
+        )
+
+        # Simular un contador desincronizado
+        await db_connection.execute(
+            "UPDATE support_cases SET queries_count = 7 WHERE id = $1", case.id
+        )
+
+        versions = DataVersionRepositoryImpl(db_connection)
+        before = await versions.current()
+
+        repaired = await repo.repair_queries_count()
+
+        assert repaired == 1
+        assert (await repo.get_by_id(case.id)).queries_count == 2
+        assert (await repo.get_by_id(other.id)).queries_count == 0
+        # La corrección es una escritura: invalida caches y ETag
+        after = await versions.current()
+        assert after > before
+
+        assert await repo.repair_queries_count() == 0
+        assert await versions.current() == after
@@ -0,0 +1,92 @@
+import pytest
+from app.domain.entities.case import SupportCase
+from app.domain.value_objects.case_filters import CaseFilters
+from app.domain.value_objects.case_type import CaseType
+from app.domain.value_objects.case_priority import CasePriority
+from app.infrastructure.cache.lru_cache import TTLLRUCache
+from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
+
+
+async def _save_cases(repo):
+    """Guarda tres casos con distintas facetas"""
+    data = [
+        ("Case 1", CaseType.SUPPORT, CasePriority.HIGH, "ana@test.com"),
+        ("Case 2", CaseType.SUPPORT, CasePriority.LOW, "ana@test.com"),
+        ("Case 3", CaseType.INVESTIGATION, CasePriority.HIGH, "luis@test.com"),
+    ]
+    for title, case_type, priority, created_by in data:
+        await repo.save(
+            SupportCase.create(
+                title=title, case_type=case_type, priority=priority, created_by=created_by
+            )
+        )
+
+
+@pytest.mark.asyncio
+class TestCaseRepositoryFacets:
+    async def test_get_facets_counts_every_facet(self, db_connection):
+        """Debe contar por status, priority y case_type con ceros para valores sin casos"""
+        repo = CaseRepositoryImpl(db_connection)
+        await _save_cases(repo)
+
+        facets = await repo.get_facets(CaseFilters())
+
+        assert facets.total == 3
+        assert facets.status == {"open": 3, "in_progress": 0, "resolved": 0, "closed": 0}
+        assert facets.priority == {"low": 1, "medium": 0, "high": 2, "critical": 0}
+        assert facets.case_type == {"support": 2, "requirement": 0, "investigation": 1}
+
+    async def test_get_facets_applies_listing_filters(self, db_connection):
+        """Debe aplicar los mismos filtros que el listado"""
+        repo = CaseRepositoryImpl(db_connection)
+        await _save_cases(repo)
+
+        facets = await repo.get_facets(CaseFilters(created_by="ana", match="substring"))
+
+        assert facets.total == 2
+        assert facets.priority["high"] == 1
+        assert facets.priority["low"] == 1
+        assert facets.case_type["investigation"] == 0
+
+    async def test_get_facets_uses_cache_until_write(self, db_connection):
+        """Debe servir las facetas desde el cache hasta que avance la versión"""
+        versions = DataVersionRepositoryImpl(db_connection)
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=60)
+        repo = CaseRepositoryImpl(db_connection, facets_cache=cache)
+        await _save_cases(repo)
+
+        assert (await repo.get_facets(CaseFilters())).total == 3
+        await _save_cases(repo)
+        assert (await repo.get_facets(CaseFilters())).total == 3
+        assert cache.stats().hits == 1
+
+        await versions.bump()
+        assert (await repo.get_facets(CaseFilters())).total == 6
+
+    async def test_get_facets_computed_during_a_write_is_not_served(self, db_connection):
+        """Si una escritura avanza la versión durante la consulta, el resultado no se reutiliza"""
+        versions = DataVersionRepositoryImpl(db_connection)
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=60)
+        repo = CaseRepositoryImpl(db_connection, facets_cache=cache)
+        await _save_cases(repo)
+
+        class WriteDuringFetch:
+            """Simula un commit concurrente mientras corre el GROUPING SETS"""
+
+            async def fetchval(self, query, *args):
+                return await db_connection.fetchval(query, *args)
+
+            async def fetch(self, query, *args):
+                rows = await db_connection.fetch(query, *args)
+                await versions.bump()
+                return rows
+
+        racing_repo = CaseRepositoryImpl(WriteDuringFetch(), facets_cache=cache)
+        await racing_repo.get_facets(CaseFilters())
+        await _save_cases(repo)
+
+        assert (await repo.get_facets(CaseFilters())).total == 6
+        assert cache.stats().hits == 0
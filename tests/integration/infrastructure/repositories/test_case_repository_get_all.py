@@ -1,10 +1,16 @@
 import pytest
 from datetime import datetime, timedelta
-from app.domain.entities.case import SupportCase
+from app.domain.entities.case import SupportCase, CaseQuery
+from app.domain.value_objects.case_filters import CaseFilters
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
 from app.domain.value_objects.case_status import CaseStatus
+from app.infrastructure.cache.lru_cache import TTLLRUCache
 from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
+from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
 
 
 @pytest.mark.asyncio
@@ -41,7 +47,8 @@ class TestCaseRepositoryGetAll:
         await repo.save(case3)
 
         # Obtener todos
-        cases, total = await repo.get_all(page=1, page_size=10)
+        result = await repo.get_all(page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
         assert len(cases) == 3
@@ -72,7 +79,8 @@ class TestCaseRepositoryGetAll:
         await repo.save(case2)
 
         # Filtrar por estado "open"
-        cases, total = await repo.get_all(status="open", page=1, page_size=10)
+        result = await repo.get_all(status="open", page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
         assert len(cases) == 1
@@ -101,7 +109,8 @@ class TestCaseRepositoryGetAll:
         await repo.save(case2)
 
         # Filtrar por prioridad "high"
-        cases, total = await repo.get_all(priority="high", page=1, page_size=10)
+        result = await repo.get_all(priority="high", page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
         assert len(cases) == 1
@@ -130,7 +139,8 @@ class TestCaseRepositoryGetAll:
         await repo.save(case2)
 
         # Filtrar por tipo "requirement"
-        cases, total = await repo.get_all(case_type="requirement", page=1, page_size=10)
+        result = await repo.get_all(case_type="requirement", page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
         assert len(cases) == 1
@@ -159,7 +169,8 @@ class TestCaseRepositoryGetAll:
         await repo.save(case2)
 
         # Filtrar por creador
-        cases, total = await repo.get_all(created_by="user1@test.com", page=1, page_size=10)
+        result = await repo.get_all(created_by="user1@test.com", page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
         assert len(cases) == 1
@@ -190,13 +201,136 @@ class TestCaseRepositoryGetAll:
         await repo.save(case2)
 
         # Buscar por "query"
-        cases, total = await repo.get_all(search="query", page=1, page_size=10)
+        result = await repo.get_all(search="query", page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar - debe encontrar case1 (en title y description)
         assert len(cases) == 1
         assert total == 1
         assert "query" in cases[0].title.lower() or "query" in (cases[0].description or "").lower()
 
+    async def test_get_all_with_search_in_description(self, db_connection):
+        """Debe encontrar casos por palabras de la descripción (con stemming)"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        case1 = SupportCase.create(
+            title="Reporte lento",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            created_by="user@test.com",
+            description="Las consultas de facturación tardan minutos",
+        )
+        case2 = SupportCase.create(
+            title="Nuevo endpoint",
+            case_type=CaseType.REQUIREMENT,
+            priority=CasePriority.MEDIUM,
+            created_by="user@test.com",
+            description="Exponer inventario",
+        )
+        await repo.save(case1)
+        await repo.save(case2)
+
+        result = await repo.get_all(search="consulta facturación", page=1, page_size=10)
+
+        assert result.total == 1
+        assert result.items[0].id == case1.id
+
+    async def test_get_all_sorted_by_relevance(self, db_connection):
+        """Debe ordenar por relevancia: coincidencias en título pesan más"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        in_description = SupportCase.create(
+            title="Revisión general",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.MEDIUM,
+            created_by="user@test.com",
+            description="Bloqueo en la tabla de pagos",
+        )
+        in_title = SupportCase.create(
+            title="Bloqueo en pagos",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.MEDIUM,
+            created_by="user@test.com",
+            description="Se detectó durante el cierre",
+        )
+        await repo.save(in_description)
+        await repo.save(in_title)
+
+        result = await repo.get_all(
+            search="bloqueo", sort_by="relevance", sort_order="desc", page=1, page_size=1
+        )
+
+        assert result.items[0].id == in_title.id
+        assert result.has_more is True
+
+        result = await repo.get_all(
+            search="bloqueo",
+            sort_by="relevance",
+            sort_order="desc",
+            page_size=1,
+            cursor=result.next_cursor,
+        )
+
+        assert result.items[0].id == in_description.id
+        assert result.has_more is False
+
+    async def test_get_all_with_substring_match(self, db_connection):
+        """Debe encontrar fragmentos de título y de email con match substring"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        case1 = SupportCase.create(
+            title="Interrupción en replicación",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            created_by="ana.gomez@test.com",
+        )
+        case2 = SupportCase.create(
+            title="100% CPU en reportes",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            created_by="luis@test.com",
+        )
+        await repo.save(case1)
+        await repo.save(case2)
+
+        result = await repo.get_all(search="plicaci", match="substring", page=1, page_size=10)
+        assert [case.id for case in result.items] == [case1.id]
+
+        result = await repo.get_all(created_by="a.gom", match="substring", page=1, page_size=10)
+        assert [case.id for case in result.items] == [case1.id]
+
+        # Los comodines del término se buscan de forma literal
+        result = await repo.get_all(search="0% C", match="substring", page=1, page_size=10)
+        assert [case.id for case in result.items] == [case2.id]
+
+        result = await repo.get_all(search="%", match="substring", page=1, page_size=10)
+        assert [case.id for case in result.items] == [case2.id]
+
+    async def test_get_all_with_fuzzy_match(self, db_connection):
+        """Debe tolerar errores de tipeo con match fuzzy y ordenar por similitud"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        exact = SupportCase.create(
+            title="Database connection timeout",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            created_by="user@test.com",
+        )
+        unrelated = SupportCase.create(
+            title="Nuevo reporte de ventas",
+            case_type=CaseType.REQUIREMENT,
+            priority=CasePriority.LOW,
+            created_by="user@test.com",
+        )
+        await repo.save(exact)
+        await repo.save(unrelated)
+
+        result = await repo.get_all(
+            search="conection", match="fuzzy", sort_by="relevance", page=1, page_size=10
+        )
+
+        assert [case.id for case in result.items] == [exact.id]
+
     async def test_get_all_with_date_range_filter(self, db_connection):
         """Debe filtrar por rango de fechas correctamente"""
         repo = CaseRepositoryImpl(db_connection)
@@ -224,7 +358,8 @@ class TestCaseRepositoryGetAll:
         await repo.save(case2)
 
         # Filtrar casos desde hoy
-        cases, total = await repo.get_all(date_gte=now - timedelta(hours=1), page=1, page_size=10)
+        result = await repo.get_all(date_gte=now - timedelta(hours=1), page=1, page_size=10)
+        cases = result.items
 
         # Verificar - solo debe encontrar case2
         assert len(cases) == 1
@@ -245,12 +380,14 @@ class TestCaseRepositoryGetAll:
             await repo.save(case)
 
         # Página 1 (10 elementos)
-        cases_page1, total_page1 = await repo.get_all(page=1, page_size=10)
+        result = await repo.get_all(page=1, page_size=10)
+        cases_page1, total_page1 = result.items, result.total
         assert len(cases_page1) == 10
         assert total_page1 == 15
 
         # Página 2 (5 elementos restantes)
-        cases_page2, total_page2 = await repo.get_all(page=2, page_size=10)
+        result = await repo.get_all(page=2, page_size=10)
+        cases_page2, total_page2 = result.items, result.total
         assert len(cases_page2) == 5
         assert total_page2 == 15
 
@@ -276,12 +413,14 @@ class TestCaseRepositoryGetAll:
         await repo.save(case2)
 
         # Ordenar por título ascendente
-        cases_asc, _ = await repo.get_all(sort_by="title", sort_order="asc", page=1, page_size=10)
+        result = await repo.get_all(sort_by="title", sort_order="asc", page=1, page_size=10)
+        cases_asc = result.items
         assert cases_asc[0].title == "AAA Case"
         assert cases_asc[1].title == "ZZZ Case"
 
         # Ordenar por título descendente
-        cases_desc, _ = await repo.get_all(sort_by="title", sort_order="desc", page=1, page_size=10)
+        result = await repo.get_all(sort_by="title", sort_order="desc", page=1, page_size=10)
+        cases_desc = result.items
         assert cases_desc[0].title == "ZZZ Case"
         assert cases_desc[1].title == "AAA Case"
 
@@ -314,15 +453,176 @@ class TestCaseRepositoryGetAll:
         await repo.save(case3)
 
         # Filtrar: tipo=support, prioridad=high, creador=user1
-        cases, total = await repo.get_all(
+        result = await repo.get_all(
             case_type="support", priority="high", created_by="user1@test.com", page=1, page_size=10
         )
+        cases, total = result.items, result.total
 
         # Verificar - solo debe encontrar case1
         assert len(cases) == 1
         assert total == 1
         assert cases[0].title == "High Priority Support"
 
+    async def test_get_all_with_cursor_pagination(self, db_connection):
+        """Debe paginar con cursor keyset sin repetir ni saltar casos"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        # Títulos repetidos para forzar el desempate por id
+        saved_ids = set()
+        for i in range(7):
+            case = SupportCase.create(
+                title=f"Case {i % 3}",
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.MEDIUM,
+                created_by="user@test.com",
+            )
+            await repo.save(case)
+            saved_ids.add(case.id)
+
+        seen = []
+        cursor = None
+        while True:
+            result = await repo.get_all(
+                sort_by="title", sort_order="asc", page_size=3, cursor=cursor
+            )
+            seen.extend(result.items)
+            assert result.total == 7
+            if not result.has_more:
+                break
+            cursor = result.next_cursor
+
+        assert len(seen) == 7
+        assert {case.id for case in seen} == saved_ids
+        assert [case.title for case in seen] == sorted(case.title for case in seen)
+
+    async def test_get_all_sorted_by_queries_count(self, db_connection):
+        """Debe ordenar por queries_count y paginar con cursor sobre ese orden"""
+        repo = CaseRepositoryImpl(db_connection)
+        query_repo = QueryRepositoryImpl(db_connection)
+
+        for count in (2, 0, 3, 1):
+            case = SupportCase.create(
+                title=f"Case with {count} queries",
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.MEDIUM,
+                created_by="user@test.com",
+            )
+            await repo.save(case)
+            await query_repo.save_many(
+                [
+                    CaseQuery.create(
+                        case_id=case.id,
+                        database_name="db",
+                        schema_name="public",
+                        query_text=f"SELECT {i}",
+                        executed_by="user@test.com",
+                    )
+                    for i in range(count)
+                ]
+            )
+
+        first = await repo.get_all(sort_by="queries_count", sort_order="desc", page_size=2)
+        second = await repo.get_all(
+            sort_by="queries_count", sort_order="desc", page_size=2, cursor=first.next_cursor
+        )
+
+        assert [case.queries_count for case in first.items] == [3, 2]
+        assert [case.queries_count for case in second.items] == [1, 0]
+        assert second.has_more is False
+
+    async def test_get_all_reuses_cached_count_until_write(self, db_connection):
+        """Debe reutilizar el total cacheado hasta que avance la versión de datos"""
+        versions = DataVersionRepositoryImpl(db_connection)
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=60)
+        repo = CaseRepositoryImpl(db_connection, count_cache=cache)
+
+        def new_case(title):
+            return SupportCase.create(
+                title=title,
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.MEDIUM,
+                created_by="user@test.com",
+            )
+
+        await repo.save(new_case("Case 1"))
+        assert (await repo.get_all(status="open")).total == 1
+
+        # Escritura sin avisar al cache: el total sigue siendo el memorizado
+        await repo.save(new_case("Case 2"))
+        result = await repo.get_all(status="open")
+        assert result.total == 1
+        assert len(result.items) == 2
+        assert cache.stats().hits == 1
+
+        # Otros filtros tienen su propia entrada
+        assert (await repo.get_all(status="closed")).total == 0
+
+        await versions.bump()
+        assert (await repo.get_all(status="open")).total == 2
+
+    async def test_get_all_has_more_flag(self, db_connection):
+        """Debe indicar si existen más casos después de la página"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        for i in range(3):
+            case = SupportCase.create(
+                title=f"Case {i}",
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.MEDIUM,
+                created_by="user@test.com",
+            )
+            await repo.save(case)
+
+        result = await repo.get_all(page=1, page_size=2)
+        assert len(result.items) == 2
+        assert result.has_more is True
+
+        result = await repo.get_all(page=2, page_size=2)
+        assert len(result.items) == 1
+        assert result.has_more is False
+
+    async def test_get_all_without_count(self, db_connection):
+        """Debe omitir el total con count_mode none y reportar has_more"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        for i in range(3):
+            case = SupportCase.create(
+                title=f"Case {i}",
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.MEDIUM,
+                created_by="user@test.com",
+            )
+            await repo.save(case)
+
+        result = await repo.get_all(page=1, page_size=2, count_mode="none")
+
+        assert len(result.items) == 2
+        assert result.total is None
+        assert result.has_more is True
+
+    async def test_get_all_with_estimated_count(self, db_connection):
+        """Debe retornar el total exacto cuando la estimación es pequeña"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        for priority in (CasePriority.HIGH, CasePriority.LOW):
+            case = SupportCase.create(
+                title="Case",
+                case_type=CaseType.SUPPORT,
+                priority=priority,
+                created_by="user@test.com",
+            )
+            await repo.save(case)
+
+        result = await repo.get_all(page=1, page_size=10, count_mode="estimated")
+        assert result.total == 2
+        assert result.total_estimated is False
+
+        result = await repo.get_all(
+            priority="high", page=1, page_size=10, count_mode="estimated"
+        )
+        assert result.total == 1
+        assert result.total_estimated is False
+
     async def test_get_all_empty_result(self, db_connection):
         """Debe manejar resultado vacío correctamente"""
         repo = CaseRepositoryImpl(db_connection)
@@ -330,8 +630,63 @@ class TestCaseRepositoryGetAll:
         # No crear ningún caso
 
         # Obtener todos
-        cases, total = await repo.get_all(page=1, page_size=10)
+        result = await repo.get_all(page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
         assert len(cases) == 0
         assert total == 0
+
+    async def test_get_all_with_fields_projection(self, db_connection):
+        """Con fields solo debe leer las columnas pedidas (más id)"""
+        repo = CaseRepositoryImpl(db_connection)
+        case = SupportCase.create(
+            title="Projected",
+            case_type=CaseType.INVESTIGATION,
+            priority=CasePriority.CRITICAL,
+            created_by="user@test.com",
+            description="Descripción larga",
+        )
+        await repo.save(case)
+
+        result = await repo.get_all(fields=["title", "priority"], sort_by="title")
+
+        projected = result.items[0]
+        assert projected.id == case.id
+        assert projected.title == "Projected"
+        assert projected.priority == CasePriority.CRITICAL
+        assert projected.description is None
+        assert projected.created_by == ""
+
+    async def test_iter_all_streams_filtered_cases_in_chunks(self, db_connection):
+        """Debe recorrer todos los casos filtrados en bloques, en orden de creación"""
+        repo = CaseRepositoryImpl(db_connection)
+
+        base = datetime(2024, 1, 1)
+        saved = []
+        for i in range(5):
+            case = SupportCase.create(
+                title=f"Export {i}",
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.HIGH,
+                created_by="user@test.com",
+            )
+            case.created_at = base + timedelta(minutes=i)
+            await repo.save(case)
+            saved.append(case.id)
+        await repo.save(
+            SupportCase.create(
+                title="Otro",
+                case_type=CaseType.REQUIREMENT,
+                priority=CasePriority.LOW,
+                created_by="user@test.com",
+            )
+        )
+
+        chunks = [
+            chunk
+            async for chunk in repo.iter_all(CaseFilters(case_type="support"), chunk_size=2)
+        ]
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [case.id for chunk in chunks for case in chunk] == saved
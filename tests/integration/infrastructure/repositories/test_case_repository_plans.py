@@ -0,0 +1,191 @@
+import itertools
+import json
+import pytest
+from datetime import datetime
+from uuid import UUID
+from app.domain.value_objects.case_cursor import CASE_SORT_FIELDS, CaseCursor
+from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+
+# Filas sintéticas: suficientes para que el planner prefiera índices a un seq scan
+SEED_ROWS = 20_000
+
+SEED_SQL = """
+    INSERT INTO support_cases (
+        title, description, case_type, priority, status,
+        created_by, created_at, updated_at, queries_count
+    )
+    SELECT
+        'Caso ' || md5(i::text),
+        'Detalle del incidente ' || i,
+        (ARRAY['support', 'requirement', 'investigation'])[1 + i % 3],
+        (ARRAY['low', 'medium', 'high', 'critical'])[1 + i % 4],
+        (ARRAY['open', 'in_progress', 'resolved', 'closed'])[1 + i / 7 % 4],
+        'user' || (i % 400) || '@test.com',
+        TIMESTAMP '2024-01-01' + (i || ' minutes')::interval,
+        TIMESTAMP '2024-01-01' + (i || ' minutes')::interval,
+        i % 11
+    FROM generate_series(1, $1) AS i
+"""
+
+GIN_CLEAN_SQL = """
+    SELECT gin_clean_pending_list(i.indexrelid)
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_am am ON am.oid = c.relam
+    WHERE i.indrelid = 'support_cases'::regclass AND am.amname = 'gin'
+"""
+
+# Valor de cada filtro del listado tal como lo recibe get_all
+FILTER_VALUES = {
+    "status": "open",
+    "priority": "high",
+    "case_type": "support",
+    "created_by": "user7@test.com",
+    "date_gte": datetime(2024, 1, 5),
+    "date_lte": datetime(2024, 1, 10),
+}
+
+# Valor de cursor por campo de orden (para la variante keyset)
+CURSOR_VALUES = {
+    "status": "in_progress",
+    "priority": "medium",
+    "case_type": "requirement",
+    "created_by": "user200@test.com",
+    "created_at": datetime(2024, 1, 8),
+    "title": "Caso 8",
+    "queries_count": 5,
+}
+
+# Términos selectivos: un término presente en todas las filas justifica un seq scan
+SEARCH_VARIANTS = (
+    ("12345", None),
+    ("incidente 12345", "substring"),
+    ("incidnte 12345", "fuzzy"),
+)
+
+
+class _PlanRecorder:
+    """
+    Conexión falsa para CaseRepositoryImpl: en lugar de ejecutar la consulta
+    del listado guarda su plan (EXPLAIN) usando la conexión real.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.plan = None
+
+    async def fetch(self, query, *args):
+        raw = await self._connection.fetchval(f"EXPLAIN (FORMAT JSON) {query}", *args)
+        self.plan = json.loads(raw)[0]["Plan"]
+        return []
+
+    async def fetch_shape(self, shape, query, *args):
+        return await self.fetch(query, *args)
+
+
+def _node_types(plan: dict) -> list:
+    """Tipos de nodo del plan, recorriendo los hijos"""
+    nodes = [plan["Node Type"]]
+    for child in plan.get("Plans", []):
+        nodes.extend(_node_types(child))
+    return nodes
+
+
+def _listing_combinations():
+    """
+    Combinaciones de filtros x campo de orden x dirección (con y sin cursor).
+
+    Cada combinación es (filtros, sort_by, sort_order, valor del cursor o None).
+    """
+    sort_fields = [field for field in CASE_SORT_FIELDS if field != "relevance"]
+    filter_sets = [
+        {name: FILTER_VALUES[name] for name in filter_names}
+        for size in range(len(FILTER_VALUES) + 1)
+        for filter_names in itertools.combinations(FILTER_VALUES, size)
+    ]
+
+    for filters in filter_sets:
+        for sort_order in ("asc", "desc"):
+            for sort_by in sort_fields:
+                yield filters, sort_by, sort_order, None
+            # Variante keyset solo con el orden por defecto: es la que usa la paginación infinita
+            yield filters, "created_at", sort_order, CURSOR_VALUES["created_at"]
+
+    for sort_by, sort_order in itertools.product(sort_fields, ("asc", "desc")):
+        yield {}, sort_by, sort_order, CURSOR_VALUES[sort_by]
+
+    # Búsqueda sola, con cada filtro y con todos los filtros a la vez
+    search_filter_sets = [{}] + [{name: value} for name, value in FILTER_VALUES.items()]
+    search_filter_sets.append(dict(FILTER_VALUES))
+    for (search, match), filters in itertools.product(SEARCH_VARIANTS, search_filter_sets):
+        for sort_by, sort_order in itertools.product(("relevance", "created_at"), ("asc", "desc")):
+            yield {**filters, "search": search, "match": match}, sort_by, sort_order, None
+
+
+@pytest.mark.asyncio
+class TestCaseRepositoryPlans:
+    async def test_listing_plans_avoid_seq_scan_with_sort(self, db_connection):
+        """Ninguna combinación de filtros y orden debe resolverse con Seq Scan + Sort"""
+        failures = []
+
+        async with db_connection.transaction() as connection:
+            transaction = connection.transaction()
+            await transaction.start()
+            try:
+                await connection.execute(SEED_SQL, SEED_ROWS)
+                # Vaciar la pending list de los índices GIN (lo hace autovacuum en
+                # producción); si no, el planner los penaliza por las filas recién insertadas
+                await connection.execute(GIN_CLEAN_SQL)
+                await connection.execute("ANALYZE support_cases")
+
+                recorder = _PlanRecorder(connection)
+                repo = CaseRepositoryImpl(db_connection, recorder)
+
+                for filters, sort_by, sort_order, cursor_value in _listing_combinations():
+                    cursor = None
+                    if cursor_value is not None:
+                        cursor = CaseCursor(
+                            sort_by=sort_by,
+                            sort_order=sort_order,
+                            value=cursor_value,
+                            id=UUID(int=0),
+                        )
+
+                    await repo.get_all(
+                        **filters,
+                        sort_by=sort_by,
+                        sort_order=sort_order,
+                        page_size=10,
+                        cursor=cursor,
+                        count_mode="none",
+                    )
+
+                    nodes = _node_types(recorder.plan)
+                    if "Seq Scan" in nodes and "Sort" in nodes:
+                        failures.append(
+                            f"filters={sorted(filters)} sort_by={sort_by}:{sort_order} "
+                            f"cursor={cursor is not None}: {' > '.join(nodes)}"
+                        )
+            finally:
+                await transaction.rollback()
+
+        assert not failures, "Planes con Seq Scan + Sort:\n" + "\n".join(failures)
+
+    async def test_narrow_projection_uses_index_only_scan(self, db_connection):
+        """Una proyección cubierta por un índice compuesto debe resolverse con Index Only Scan"""
+        # Sin transacción: Index Only Scan depende del visibility map que arma
+        # VACUUM; clean_database vacía la tabla al terminar
+        await db_connection.execute(SEED_SQL, SEED_ROWS)
+        await db_connection.execute("VACUUM (ANALYZE) support_cases")
+
+        async with db_connection.transaction() as connection:
+            recorder = _PlanRecorder(connection)
+            repo = CaseRepositoryImpl(db_connection, recorder)
+            await repo.get_all(
+                status="open",
+                fields=["status", "created_at"],
+                page_size=10,
+                count_mode="none",
+            )
+
+        assert "Index Only Scan" in _node_types(recorder.plan)
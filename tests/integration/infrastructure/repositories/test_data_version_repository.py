@@ -0,0 +1,47 @@
+import pytest
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
+from app.infrastructure.database.unit_of_work import PostgreSQLUnitOfWork
+
+
+@pytest.mark.asyncio
+class TestDataVersionRepository:
+    async def test_bump_advances_current_version(self, db_connection):
+        """Debe avanzar la marca de agua en cada bump"""
+        repo = DataVersionRepositoryImpl(db_connection)
+
+        before = await repo.current()
+        bumped = await repo.bump()
+
+        assert bumped > before
+        assert await repo.current() == bumped
+
+    async def test_unit_of_work_bumps_version_only_on_commit(self, db_connection):
+        """El Unit of Work debe avanzar la versión después del commit, no en rollback"""
+        repo = DataVersionRepositoryImpl(db_connection)
+        before = await repo.current()
+
+        with pytest.raises(RuntimeError):
+            async with PostgreSQLUnitOfWork(db_connection):
+                raise RuntimeError("fallo en la transacción")
+        assert await repo.current() == before
+
+        async with PostgreSQLUnitOfWork(db_connection):
+            pass
+        assert await repo.current() > before
+
+    async def test_first_bump_of_a_fresh_sequence_changes_current(self, db_connection):
+        """Sin nextval previo (is_called = false) el primer bump debe cambiar la versión"""
+        repo = DataVersionRepositoryImpl(db_connection)
+        previous = await repo.current()
+        await db_connection.execute("ALTER SEQUENCE data_version_seq RESTART")
+        try:
+            before = await repo.current()
+            await repo.bump()
+
+            assert before == 0
+            assert await repo.current() != before
+        finally:
+            # La versión no debe retroceder para los caches del resto de la sesión
+            await db_connection.execute("SELECT setval('data_version_seq', $1)", previous + 1)
@@ -4,6 +4,9 @@ from app.domain.entities.case import SupportCase, CaseQuery
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
 from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
 from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
 
 
@@ -57,3 +60,69 @@ class TestQueryRepository:
 
         queries = await query_repo.get_by_case_id(non_existent_id)
         assert queries == []
+
+    async def test_save_many_without_unit_of_work_bumps_data_version(self, db_connection):
+        """Fuera del Unit of Work, save_many debe avanzar la marca de agua al confirmar"""
+        case_repo = CaseRepositoryImpl(db_connection)
+        query_repo = QueryRepositoryImpl(db_connection)
+        versions = DataVersionRepositoryImpl(db_connection)
+
+        case = SupportCase.create(
+            title="Test case",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            created_by="test@example.com",
+        )
+        await case_repo.save(case)
+        before = await versions.current()
+
+        await query_repo.save_many(
+            [
+                CaseQuery.create(
+                    case_id=case.id,
+                    database_name="db1",
+                    schema_name="public",
+                    query_text="SELECT 1",
+                    executed_by="test@example.com",
+                )
+            ]
+        )
+
+        assert await versions.current() > before
+
+    async def test_get_by_case_ids(self, db_connection):
+        """Debe obtener las queries de varios casos en una sola consulta"""
+        case_repo = CaseRepositoryImpl(db_connection)
+        query_repo = QueryRepositoryImpl(db_connection)
+
+        cases = [
+            SupportCase.create(
+                title=f"Case {i}",
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.HIGH,
+                created_by="test@example.com",
+            )
+            for i in range(3)
+        ]
+        for case in cases:
+            await case_repo.save(case)
+
+        await query_repo.save_many(
+            [
+                CaseQuery.create(
+                    case_id=case.id,
+                    database_name="db1",
+                    schema_name="public",
+                    query_text=f"SELECT {i}",
+                    executed_by="test@example.com",
+                )
+                for case in cases[:2]
+                for i in range(2)
+            ]
+        )
+
+        queries = await query_repo.get_by_case_ids([cases[0].id, cases[2].id])
+
+        assert len(queries) == 2
+        assert {q.case_id for q in queries} == {cases[0].id}
+        assert await query_repo.get_by_case_ids([]) == []
@@ -1,9 +1,30 @@
+import asyncpg
 import pytest
+from uuid import uuid4
+from app.config import settings
 from app.domain.entities.case import SupportCase, CaseQuery
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
 from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.data_version_repository_impl import (
+    DataVersionRepositoryImpl,
+)
 from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
+from app.infrastructure.database.unit_of_work import PostgreSQLUnitOfWork
+
+
+def _queries(case_id, count):
+    return [
+        CaseQuery.create(
+            case_id=case_id,
+            database_name=f"db{i}",
+            schema_name="public",
+            query_text=f"SELECT * FROM table{i}",
+            executed_by="test@example.com",
+            execution_time_ms=i if i % 2 else None,
+        )
+        for i in range(count)
+    ]
 
 
 @pytest.mark.asyncio
@@ -44,9 +65,211 @@ class TestQueryRepositoryBulk:
         # Verificar que todas tienen el case_id correcto
         assert all(q.case_id == case.id for q in retrieved_queries)
 
+        # El conteo desnormalizado se actualiza en la misma escritura
+        retrieved_case = await case_repo.get_by_id(case.id)
+        assert retrieved_case.queries_count == 5
+
+    async def test_save_many_updates_queries_count_per_case(self, db_connection):
+        """Debe incrementar queries_count de cada caso según sus queries"""
+        case_repo = CaseRepositoryImpl(db_connection)
+        query_repo = QueryRepositoryImpl(db_connection)
+
+        case1 = SupportCase.create(
+            title="Case 1",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            created_by="test@example.com",
+        )
+        case2 = SupportCase.create(
+            title="Case 2",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.LOW,
+            created_by="test@example.com",
+        )
+        await case_repo.save(case1)
+        await case_repo.save(case2)
+
+        queries = [
+            CaseQuery.create(
+                case_id=case_id,
+                database_name="db",
+                schema_name="public",
+                query_text="SELECT 1",
+                executed_by="test@example.com",
+            )
+            for case_id in (case1.id, case1.id, case2.id)
+        ]
+        await query_repo.save_many(queries)
+        await query_repo.save(
+            CaseQuery.create(
+                case_id=case1.id,
+                database_name="db",
+                schema_name="public",
+                query_text="SELECT 2",
+                executed_by="test@example.com",
+            )
+        )
+
+        assert (await case_repo.get_by_id(case1.id)).queries_count == 3
+        assert (await case_repo.get_by_id(case2.id)).queries_count == 1
+
     async def test_save_many_with_empty_list(self, db_connection):
         """Debe manejar lista vacía sin errores"""
         query_repo = QueryRepositoryImpl(db_connection)
 
         # No debe lanzar error
         await query_repo.save_many([])
+
+    @pytest.mark.parametrize("threshold", [0, 3])
+    async def test_save_many_executemany_and_copy_paths(
+        self, db_connection, monkeypatch, threshold
+    ):
+        """executemany (0: COPY desactivado) y COPY deben guardar lo mismo"""
+        monkeypatch.setattr(settings, "SAVE_MANY_COPY_THRESHOLD", threshold)
+        case = SupportCase.create(
+            title="Bulk",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.LOW,
+            created_by="test@example.com",
+        )
+        await CaseRepositoryImpl(db_connection).save(case)
+        queries = _queries(case.id, 5)
+
+        # Dentro del Unit of Work, como CreateCaseUseCase
+        async with PostgreSQLUnitOfWork(db_connection) as uow:
+            repo = QueryRepositoryImpl(db_connection, uow.get_connection())
+            await repo.save_many(queries)
+
+        retrieved = await QueryRepositoryImpl(db_connection).get_by_case_id(case.id)
+        assert {(q.id, q.query_text, q.execution_time_ms, q.executed_at) for q in retrieved} == {
+            (q.id, q.query_text, q.execution_time_ms, q.executed_at) for q in queries
+        }
+        assert (await CaseRepositoryImpl(db_connection).get_by_id(case.id)).queries_count == 5
+
+    @pytest.mark.parametrize("threshold", [0, 1])
+    async def test_save_many_errors_are_the_same_with_copy(
+        self, db_connection, monkeypatch, threshold
+    ):
+        """Una query de un caso inexistente debe fallar igual en ambos caminos y no dejar filas"""
+        monkeypatch.setattr(settings, "SAVE_MANY_COPY_THRESHOLD", threshold)
+
+        with pytest.raises(asyncpg.ForeignKeyViolationError):
+            await QueryRepositoryImpl(db_connection).save_many(_queries(uuid4(), 3))
+
+        assert await db_connection.fetchval("SELECT COUNT(*) FROM case_queries") == 0
+
+    async def test_case_save_many_with_queries_without_count_update(self, db_connection):
+        """Casos guardados con su queries_count y queries sin UPDATE de contadores"""
+        cases = []
+        for i in range(3):
+            case = SupportCase.create(
+                title=f"Importado {i}",
+                case_type=CaseType.REQUIREMENT,
+                priority=CasePriority.MEDIUM,
+                created_by="legacy@example.com",
+                description="Migrado" if i else None,
+            )
+            for query in _queries(case.id, i):
+                case.add_query(query)
+            cases.append(case)
+
+        async with PostgreSQLUnitOfWork(db_connection) as uow:
+            connection = uow.get_connection()
+            await CaseRepositoryImpl(db_connection, connection).save_many(cases)
+            await QueryRepositoryImpl(db_connection, connection).save_many(
+                [q for case in cases for q in case.queries], update_counts=False
+            )
+
+        case_repo = CaseRepositoryImpl(db_connection)
+        for case in cases:
+            stored = await case_repo.get_with_queries(case.id)
+            assert stored.title == case.title
+            assert stored.description == case.description
+            assert stored.queries_count == len(case.queries) == len(stored.queries)
+        repaired = await case_repo.repair_queries_count()
+        assert repaired == 0
+
+    async def test_create_with_queries_in_one_statement(self, db_connection):
+        """El caso y sus queries deben quedar guardados juntos, con su queries_count"""
+        case = SupportCase.create(
+            title="Un round-trip",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.CRITICAL,
+            created_by="test@example.com",
+        )
+        for query in _queries(case.id, 3):
+            case.add_query(query)
+        empty = SupportCase.create(
+            title="Sin queries",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.LOW,
+            created_by="test@example.com",
+        )
+        case_repo = CaseRepositoryImpl(db_connection)
+        version = await DataVersionRepositoryImpl(db_connection).current()
+
+        await case_repo.create_with_queries(case)
+        await case_repo.create_with_queries(empty)
+
+        stored = await case_repo.get_with_queries(case.id)
+        assert stored.queries_count == 3
+        assert [q.id for q in stored.queries] == [q.id for q in case.queries]
+        assert {q.execution_time_ms for q in stored.queries} == {None, 1}
+        assert (await case_repo.get_with_queries(empty.id)).queries == []
+        assert await DataVersionRepositoryImpl(db_connection).current() > version
+
+    async def test_create_with_queries_is_atomic(self, db_connection):
+        """Si una query falla, el caso tampoco debe quedar guardado"""
+        case = SupportCase.create(
+            title="Atómico",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.LOW,
+            created_by="test@example.com",
+        )
+        for query in _queries(case.id, 2):
+            case.add_query(query)
+        case.queries[1].database_name = "x" * 300  # VARCHAR(255)
+
+        with pytest.raises(asyncpg.StringDataRightTruncationError):
+            await CaseRepositoryImpl(db_connection).create_with_queries(case)
+
+        assert await CaseRepositoryImpl(db_connection).get_by_id(case.id) is None
+
+    async def test_create_many_with_queries_in_one_statement(self, db_connection):
+        """Varios casos con sus queries en una sentencia; si uno falla no se guarda ninguno"""
+        cases = []
+        for i, count in enumerate((2, 0, 3)):
+            case = SupportCase.create(
+                title=f"Grupo {i}",
+                case_type=CaseType.SUPPORT,
+                priority=CasePriority.MEDIUM,
+                created_by="test@example.com",
+            )
+            for query in _queries(case.id, count):
+                case.add_query(query)
+            cases.append(case)
+        case_repo = CaseRepositoryImpl(db_connection)
+
+        await case_repo.create_many_with_queries(cases)
+
+        for case in cases:
+            stored = await case_repo.get_with_queries(case.id)
+            assert stored.queries_count == len(case.queries)
+            assert [q.id for q in stored.queries] == [q.id for q in case.queries]
+
+        good = SupportCase.create(
+            title="Bueno",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.LOW,
+            created_by="test@example.com",
+        )
+        bad = SupportCase.create(
+            title="Malo",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.LOW,
+            created_by="test@example.com",
+        )
+        bad.created_by = "x" * 300 + "@example.com"  # VARCHAR(255)
+        with pytest.raises(asyncpg.StringDataRightTruncationError):
+            await case_repo.create_many_with_queries([good, bad])
+        assert await case_repo.get_by_id(good.id) is None
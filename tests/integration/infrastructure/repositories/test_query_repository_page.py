@@ -0,0 +1,202 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.value_objects.case_priority import CasePriority
+from app.domain.value_objects.case_type import CaseType
+from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.domain.value_objects.query_cursor import QueryCursor
+from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
+
+# Queries sintéticas: suficientes para que el planner prefiera el índice compuesto
+SEED_CASES = 200
+SEED_QUERIES_PER_CASE = 100
+
+SEED_SQL = """
+    WITH cases AS (
+        INSERT INTO support_cases (title, case_type, priority, created_by)
+        SELECT 'Caso ' || i, 'support', 'low', 'seed@test.com'
+        FROM generate_series(1, $1) AS i
+        RETURNING id
+    ),
+    texts AS (
+        INSERT INTO query_texts (hash, query_text)
+        SELECT sha256(convert_to('SELECT ' || j, 'UTF8')), 'SELECT ' || j
+        FROM generate_series(1, $2) AS j
+        ON CONFLICT (hash) DO NOTHING
+    )
+    INSERT INTO case_queries (
+        case_id, database_name, schema_name, query_text_hash, executed_at, executed_by
+    )
+    SELECT
+        cases.id, 'db' || (j % 3), 'public', sha256(convert_to('SELECT ' || j, 'UTF8')),
+        TIMESTAMP '2024-01-01' + (j || ' minutes')::interval, 'seed@test.com'
+    FROM cases, generate_series(1, $2) AS j
+    RETURNING case_id
+"""
+
+SET_QUERY_TEXT_SQL = """
+    WITH text AS (
+        INSERT INTO query_texts (hash, query_text)
+        VALUES (sha256(convert_to($2, 'UTF8')), $2)
+        ON CONFLICT (hash) DO NOTHING
+    )
+    UPDATE case_queries SET query_text_hash = sha256(convert_to($2, 'UTF8')) WHERE id = $1
+"""
+
+
+class _PlanRecorder:
+    """Conexión falsa: guarda el plan (EXPLAIN) de la consulta en lugar de ejecutarla"""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.plan = None
+
+    async def fetch(self, query, *args):
+        raw = await self._connection.fetchval(f"EXPLAIN (FORMAT JSON) {query}", *args)
+        self.plan = json.loads(raw)[0]["Plan"]
+        return []
+
+
+def _nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+async def _case_with_queries(db_connection, specs):
+    """Crea un caso con queries (database_name, executed_by, minutos desde el inicio)"""
+    case = SupportCase.create(
+        title="Caso con muchas queries",
+        case_type=CaseType.SUPPORT,
+        priority=CasePriority.HIGH,
+        created_by="test@example.com",
+    )
+    await CaseRepositoryImpl(db_connection).save(case)
+
+    start = datetime(2024, 1, 1)
+    queries = []
+    for i, (database_name, executed_by, minutes) in enumerate(specs):
+        query = CaseQuery.create(
+            case_id=case.id,
+            database_name=database_name,
+            schema_name="public",
+            query_text=f"SELECT {i}",
+            executed_by=executed_by,
+        )
+        query.executed_at = start + timedelta(minutes=minutes)
+        queries.append(query)
+    await QueryRepositoryImpl(db_connection).save_many(queries)
+    return case, queries
+
+
+@pytest.mark.asyncio
+class TestQueryRepositoryPage:
+    async def test_keyset_pages_cover_all_queries_in_order(self, db_connection):
+        """Las páginas deben recorrer todas las queries por (executed_at, id) sin repetir"""
+        # Varias queries en el mismo instante: el id desempata
+        specs = [("db", "a@test.com", i // 3) for i in range(10)]
+        case, queries = await _case_with_queries(db_connection, specs)
+        repo = QueryRepositoryImpl(db_connection)
+
+        seen = []
+        after = None
+        while True:
+            page = await repo.get_page(case.id, 3, after=after)
+            seen.extend(page.items)
+            if not page.has_more:
+                assert page.next_cursor is None
+                break
+            after = page.next_cursor
+
+        expected = sorted(queries, key=lambda q: (q.executed_at, q.id))
+        assert [q.id for q in seen] == [q.id for q in expected]
+
+    async def test_page_filters(self, db_connection):
+        """Debe filtrar por base, esquema y usuario"""
+        specs = [
+            ("sales", "a@test.com", 1),
+            ("sales", "b@test.com", 2),
+            ("hr", "a@test.com", 3),
+        ]
+        case, _ = await _case_with_queries(db_connection, specs)
+        repo = QueryRepositoryImpl(db_connection)
+
+        page = await repo.get_page(case.id, 10, database_name="sales", executed_by="a@test.com")
+        assert [q.query_text for q in page.items] == ["SELECT 0"]
+
+        page = await repo.get_page(case.id, 10, schema_name="other")
+        assert page.items == []
+
+    async def test_get_with_queries_limit(self, db_connection):
+        """El detalle con queries_limit debe traer solo las primeras queries"""
+        specs = [("db", "a@test.com", 5 - i) for i in range(5)]
+        case, queries = await _case_with_queries(db_connection, specs)
+        repo = CaseRepositoryImpl(db_connection)
+
+        limited = await repo.get_with_queries(case.id, queries_limit=2)
+        empty = await repo.get_with_queries(case.id, queries_limit=0)
+
+        expected = sorted(queries, key=lambda q: (q.executed_at, q.id))[:2]
+        assert [q.id for q in limited.queries] == [q.id for q in expected]
+        assert limited.queries_count == 5
+        assert empty is not None and empty.queries == []
+        assert await repo.get_with_queries(uuid4(), queries_limit=2) is None
+
+    async def test_page_is_an_index_range_scan(self, db_connection):
+        """Cada página debe leer un rango del índice (case_id, executed_at, id) sin ordenar"""
+        case_ids = await db_connection.fetch(SEED_SQL, SEED_CASES, SEED_QUERIES_PER_CASE)
+        await db_connection.execute("ANALYZE case_queries")
+        case_id = case_ids[0]["case_id"]
+
+        recorder = _PlanRecorder(db_connection)
+        repo = QueryRepositoryImpl(db_connection, connection=recorder)
+        first = CaseQuery.create(
+            case_id=case_id,
+            database_name="db1",
+            schema_name="public",
+            query_text="SELECT 1",
+            executed_by="seed@test.com",
+        )
+        first.executed_at = datetime(2024, 1, 1, 0, 30)
+        await repo.get_page(case_id, 20, after=QueryCursor.after(first))
+
+        nodes = list(_nodes(recorder.plan))
+        assert any(
+            node.get("Index Name") == "idx_case_queries_case_executed_at" for node in nodes
+        ), recorder.plan
+        assert not any(node["Node Type"] == "Sort" for node in nodes), recorder.plan
+
+    async def test_preview_does_not_return_full_text(self, db_connection):
+        """La vista previa debe traer el prefijo del texto y su tamaño completo"""
+        case, queries = await _case_with_queries(db_connection, [("db", "a@test.com", 1)])
+        # Texto grande y poco compresible: queda fuera de línea (TOAST)
+        big_text = "SELECT " + "".join(str(uuid4()) for _ in range(4000))
+        await db_connection.execute(SET_QUERY_TEXT_SQL, queries[0].id, big_text)
+
+        page = await QueryRepositoryImpl(db_connection).get_page(case.id, 10, preview_chars=20)
+        detail = await CaseRepositoryImpl(db_connection).get_with_queries(case.id, preview_chars=20)
+
+        for query in (page.items[0], detail.queries[0]):
+            assert query.query_text == big_text[:20]
+            assert query.query_text_bytes == len(big_text)
+            assert query.query_text_truncated is True
+
+    async def test_get_text_and_iter_text(self, db_connection):
+        """Debe devolver el texto completo inline o por partes"""
+        case, queries = await _case_with_queries(db_connection, [("db", "a@test.com", 1)])
+        text = "SELECT 'ñandú', " + "x" * 95
+        await db_connection.execute(SET_QUERY_TEXT_SQL, queries[0].id, text)
+        repo = QueryRepositoryImpl(db_connection)
+
+        inline = await repo.get_text(case.id, queries[0].id, max_bytes=1024)
+        too_big = await repo.get_text(case.id, queries[0].id, max_bytes=10)
+        chunks = [chunk async for chunk in repo.iter_text(case.id, queries[0].id, chunk_chars=37)]
+
+        assert inline.text == text and inline.size_bytes == len(text.encode("utf-8"))
+        assert too_big.text is None and too_big.size_bytes == inline.size_bytes
+        assert "".join(chunks) == text
+        assert all(len(chunk) == 37 for chunk in chunks[:-1])
+        assert await repo.get_text(uuid4(), queries[0].id, max_bytes=1024) is None
+        assert [c async for c in repo.iter_text(uuid4(), queries[0].id, chunk_chars=37)] == []
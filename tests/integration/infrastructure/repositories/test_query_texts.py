@@ -0,0 +1,86 @@
+import pytest
+from app.domain.entities.case import SupportCase, CaseQuery
+from app.domain.value_objects.case_type import CaseType
+from app.domain.value_objects.case_priority import CasePriority
+from app.infrastructure.database.query_texts import query_text_hash
+from app.infrastructure.database.repositories.case_repository_impl import CaseRepositoryImpl
+from app.infrastructure.database.repositories.query_repository_impl import QueryRepositoryImpl
+
+SHARED_TEXT = "SELECT * FROM pedidos WHERE estado = 'pendiente'"
+
+
+def _case(title):
+    return SupportCase.create(
+        title=title,
+        case_type=CaseType.SUPPORT,
+        priority=CasePriority.MEDIUM,
+        created_by="test@example.com",
+    )
+
+
+def _query(case_id, query_text):
+    return CaseQuery.create(
+        case_id=case_id,
+        database_name="ventas",
+        schema_name="public",
+        query_text=query_text,
+        executed_by="test@example.com",
+    )
+
+
+@pytest.mark.asyncio
+class TestQueryTexts:
+    async def test_same_text_is_stored_once(self, db_connection):
+        """El mismo texto en varios casos y caminos de escritura debe guardarse una vez"""
+        case_repo = CaseRepositoryImpl(db_connection)
+        query_repo = QueryRepositoryImpl(db_connection)
+        first, second = _case("Primero"), _case("Segundo")
+        await case_repo.save(first)
+        await case_repo.save(second)
+
+        await query_repo.save(_query(first.id, SHARED_TEXT))
+        await query_repo.save_many(
+            [_query(second.id, SHARED_TEXT), _query(second.id, SHARED_TEXT + "\r\n")]
+        )
+        third = _case("Tercero")
+        third.add_query(_query(third.id, SHARED_TEXT))
+        await case_repo.create_many_with_queries([third])
+
+        assert await db_connection.fetchval("SELECT COUNT(*) FROM case_queries") == 4
+        assert await db_connection.fetchval("SELECT COUNT(*) FROM query_texts") == 1
+        for case in (first, second, third):
+            stored = await case_repo.get_with_queries(case.id)
+            assert {q.query_text for q in stored.queries} == {SHARED_TEXT}
+        assert {q.query_text for q in await query_repo.get_by_case_id(second.id)} == {
+            SHARED_TEXT
+        }
+
+    async def test_hash_matches_database_digest(self, db_connection):
+        """El hash de la aplicación debe coincidir con el que calcula la migración"""
+        query_text = "SELECT 'añoñez', '数据库' -- ✓"
+
+        expected = await db_connection.fetchval(
+            "SELECT sha256(convert_to($1::text, 'UTF8'))", query_text
+        )
+
+        assert query_text_hash(query_text) == expected
+
+    async def test_text_storage_report(self, db_connection):
+        """El reporte debe contar las queries, los textos distintos y los bytes ahorrados"""
+        case = _case("Reporte")
+        for _ in range(3):
+            case.add_query(_query(case.id, SHARED_TEXT))
+        case.add_query(_query(case.id, "SELECT 1"))
+        await CaseRepositoryImpl(db_connection).create_many_with_queries([case])
+
+        storage = await QueryRepositoryImpl(db_connection).text_storage()
+
+        text_bytes = len(SHARED_TEXT.encode("utf-8"))
+        assert storage.queries == 4
+        assert storage.distinct_texts == 2
+        assert storage.logical_bytes == 3 * text_bytes + len("SELECT 1")
+        assert storage.stored_bytes == text_bytes + len("SELECT 1")
+        assert storage.hash_bytes == 4 * 32
+        assert storage.saved_bytes == 2 * text_bytes - 4 * 32
+        assert storage.case_queries_disk_bytes > 0
+        assert storage.query_texts_disk_bytes > 0
@@ -0,0 +1,100 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.application.use_cases.bulk_create_cases import SAVE_ERROR_MESSAGE, BulkCreateCasesUseCase
+
+
+def _item(title="Imported", queries=1, **overrides):
+    item = {
+        "title": title,
+        "description": None,
+        "case_type": "support",
+        "priority": "high",
+        "created_by": "legacy@example.com",
+        "queries": [
+            {"database_name": "db", "schema_name": "public", "query_text": f"SELECT {i}"}
+            for i in range(queries)
+        ],
+    }
+    item.update(overrides)
+    return item
+
+
+def _uow():
+    uow = AsyncMock()
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+    uow.get_connection = MagicMock(return_value=AsyncMock())
+    return uow
+
+
+@pytest.mark.asyncio
+class TestBulkCreateCasesUseCase:
+    async def test_saves_valid_items_in_chunks_and_reports_invalid_ones(self):
+        """Debe guardar los válidos por bloques y reportar los inválidos por posición"""
+        uow = _uow()
+        with patch(
+            "app.application.use_cases.bulk_create_cases.CaseRepositoryImpl"
+        ) as MockCaseRepo, patch(
+            "app.application.use_cases.bulk_create_cases.QueryRepositoryImpl"
+        ) as MockQueryRepo:
+            MockCaseRepo.return_value = AsyncMock()
+            MockQueryRepo.return_value = AsyncMock()
+
+            use_case = BulkCreateCasesUseCase(AsyncMock(), AsyncMock(), uow, chunk_size=2)
+            result = await use_case.execute(
+                [
+                    _item("A", queries=2),
+                    _item("B", created_by="sin-arroba"),
+                    _item("C"),
+                    _item("D", case_type="unknown"),
+                    _item("E", queries=0),
+                ]
+            )
+
+            assert [item.created for item in result.items] == [True, False, True, False, True]
+            assert result.created == 3 and result.failed == 2
+            assert "email" in result.items[1].error
+
+            # 3 casos válidos en bloques de 2: dos transacciones
+            case_saves = MockCaseRepo.return_value.save_many.call_args_list
+            assert [len(call.args[0]) for call in case_saves] == [2, 1]
+            saved = case_saves[0].args[0]
+            assert [case.queries_count for case in saved] == [2, 1]
+            query_saves = MockQueryRepo.return_value.save_many.call_args_list
+            assert len(query_saves[0].args[0]) == 3
+            assert query_saves[0].kwargs == {"update_counts": False}
+            assert uow.__aenter__.await_count == 2
+
+    async def test_failed_chunk_is_retried_item_by_item(self):
+        """Si un bloque falla, debe reintentar caso por caso y marcar solo los que fallan"""
+        uow = _uow()
+
+        async def save_many(cases):
+            if any(case.title == "Bad" for case in cases):
+                raise RuntimeError("value too long")
+
+        with patch(
+            "app.application.use_cases.bulk_create_cases.CaseRepositoryImpl"
+        ) as MockCaseRepo, patch(
+            "app.application.use_cases.bulk_create_cases.QueryRepositoryImpl"
+        ) as MockQueryRepo:
+            MockCaseRepo.return_value = AsyncMock()
+            MockCaseRepo.return_value.save_many.side_effect = save_many
+            MockQueryRepo.return_value = AsyncMock()
+
+            use_case = BulkCreateCasesUseCase(AsyncMock(), AsyncMock(), uow, chunk_size=10)
+            result = await use_case.execute([_item("Ok 1"), _item("Bad"), _item("Ok 2")])
+
+            assert [item.created for item in result.items] == [True, False, True]
+            assert result.items[1].error == SAVE_ERROR_MESSAGE
+
+    async def test_missing_field_is_reported(self, caplog):
+        """Un elemento sin un campo obligatorio debe fallar solo (también con logging INFO)"""
+        item = _item()
+        del item["priority"]
+
+        use_case = BulkCreateCasesUseCase(AsyncMock(), AsyncMock(), _uow())
+        with caplog.at_level("INFO"):
+            result = await use_case.execute([item])
+
+        assert result.items[0].error == "Falta el campo priority"
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from app.application.use_cases.create_case import CreateCaseUseCase
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
@@ -134,3 +134,166 @@ class TestCreateCaseUseCase:
                 queries=[],
                 created_by="test@example.com",
             )
+
+    async def test_create_case_invalidates_detail_cache_after_commit(self):
+        """Debe invalidar el detalle cacheado del caso solo si la transacción se confirma"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+        uow = AsyncMock()
+        uow.__aenter__ = AsyncMock(return_value=uow)
+        uow.__aexit__ = AsyncMock(return_value=None)
+        detail_cache = MagicMock()
+
+        from unittest.mock import patch
+
+        with patch(
+            "app.application.use_cases.create_case.CaseRepositoryImpl"
+        ) as MockCaseRepo, patch(
+            "app.application.use_cases.create_case.QueryRepositoryImpl"
+        ) as MockQueryRepo:
+            MockCaseRepo.return_value = AsyncMock()
+            MockQueryRepo.return_value = AsyncMock()
+            use_case = CreateCaseUseCase(case_repo, query_repo, uow, detail_cache=detail_cache)
+
+            case = await use_case.execute(
+                title="New case",
+                description=None,
+                case_type="support",
+                priority="high",
+                queries=[],
+                created_by="test@example.com",
+            )
+            detail_cache.invalidate.assert_called_once_with(case.id)
+
+            detail_cache.reset_mock()
+            with pytest.raises(ValueError):
+                await use_case.execute(
+                    title="New case",
+                    description=None,
+                    case_type="invalid_type",
+                    priority="high",
+                    queries=[],
+                    created_by="test@example.com",
+                )
+            detail_cache.invalidate.assert_not_called()
+
+    async def test_create_case_in_single_statement_below_threshold(self):
+        """Con pocas queries debe crear el caso en una sentencia, sin Unit of Work"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+        uow = AsyncMock()
+        detail_cache = MagicMock()
+
+        use_case = CreateCaseUseCase(
+            case_repo,
+            query_repo,
+            uow,
+            detail_cache=detail_cache,
+            single_statement_max_queries=2,
+        )
+        case = await use_case.execute(
+            title="New case",
+            description=None,
+            case_type="support",
+            priority="high",
+            queries=[
+                {"database_name": "db", "schema_name": "public", "query_text": f"SELECT {i}"}
+                for i in range(2)
+            ],
+            created_by="test@example.com",
+        )
+
+        case_repo.create_with_queries.assert_awaited_once_with(case)
+        assert case.queries_count == 2
+        uow.__aenter__.assert_not_called()
+        query_repo.save_many.assert_not_called()
+        detail_cache.invalidate.assert_called_once_with(case.id)
+
+    async def test_create_case_above_threshold_uses_unit_of_work(self):
+        """Con más queries que el umbral debe usar la transacción con save_many"""
+        case_repo = AsyncMock()
+        uow = AsyncMock()
+        uow.__aenter__ = AsyncMock(return_value=uow)
+        uow.__aexit__ = AsyncMock(return_value=None)
+
+        from unittest.mock import patch
+
+        with patch(
+            "app.application.use_cases.create_case.CaseRepositoryImpl"
+        ) as MockCaseRepo, patch(
+            "app.application.use_cases.create_case.QueryRepositoryImpl"
+        ) as MockQueryRepo:
+            MockCaseRepo.return_value = AsyncMock()
+            MockQueryRepo.return_value = AsyncMock()
+            use_case = CreateCaseUseCase(
+                case_repo, AsyncMock(), uow, single_statement_max_queries=1
+            )
+
+            await use_case.execute(
+                title="New case",
+                description=None,
+                case_type="support",
+                priority="high",
+                queries=[
+                    {"database_name": "db", "schema_name": "public", "query_text": f"SELECT {i}"}
+                    for i in range(2)
+                ],
+                created_by="test@example.com",
+            )
+
+            case_repo.create_with_queries.assert_not_called()
+            assert len(MockQueryRepo.return_value.save_many.call_args.args[0]) == 2
+
+    async def test_create_case_with_write_coalescer(self):
+        """Con group commit, las altas de una sola sentencia deben pasar por el agrupador"""
+        case_repo = AsyncMock()
+        uow = AsyncMock()
+        coalescer = AsyncMock()
+        detail_cache = MagicMock()
+
+        use_case = CreateCaseUseCase(
+            case_repo,
+            AsyncMock(),
+            uow,
+            detail_cache=detail_cache,
+            single_statement_max_queries=5,
+            write_coalescer=coalescer,
+        )
+        case = await use_case.execute(
+            title="New case",
+            description=None,
+            case_type="support",
+            priority="high",
+            queries=[{"database_name": "db", "schema_name": "public", "query_text": "SELECT 1"}],
+            created_by="test@example.com",
+        )
+
+        coalescer.submit.assert_awaited_once_with(case)
+        case_repo.create_with_queries.assert_not_called()
+        uow.__aenter__.assert_not_called()
+        detail_cache.invalidate.assert_called_once_with(case.id)
+
+    async def test_write_coalescer_error_propagates_without_invalidating(self):
+        """Si el agrupador rechaza el caso, el error debe llegar al que lo creó"""
+        coalescer = AsyncMock()
+        coalescer.submit.side_effect = RuntimeError("db down")
+        detail_cache = MagicMock()
+        use_case = CreateCaseUseCase(
+            AsyncMock(),
+            AsyncMock(),
+            AsyncMock(),
+            detail_cache=detail_cache,
+            single_statement_max_queries=5,
+            write_coalescer=coalescer,
+        )
+
+        with pytest.raises(RuntimeError):
+            await use_case.execute(
+                title="New case",
+                description=None,
+                case_type="support",
+                priority="high",
+                queries=[],
+                created_by="test@example.com",
+            )
+        detail_cache.invalidate.assert_not_called()
@@ -0,0 +1,64 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from app.application.use_cases.export_cases import ExportCasesUseCase
+from app.domain.entities.case import SupportCase, CaseQuery
+from app.domain.exceptions import DomainValidationError
+from app.domain.value_objects.case_filters import CaseFilters
+
+
+def _iter_chunks(*chunks):
+    """Simula CaseRepository.iter_all"""
+
+    async def iter_all(filters, chunk_size=1000):
+        for chunk in chunks:
+            yield chunk
+
+    return iter_all
+
+
+@pytest.mark.asyncio
+class TestExportCasesUseCase:
+    async def test_export_yields_repository_chunks(self):
+        """Debe entregar los bloques del repositorio sin consultar queries"""
+        case_repo = MagicMock()
+        query_repo = AsyncMock()
+        chunk1 = [SupportCase(id=uuid4()), SupportCase(id=uuid4())]
+        chunk2 = [SupportCase(id=uuid4())]
+        case_repo.iter_all = _iter_chunks(chunk1, chunk2)
+
+        use_case = ExportCasesUseCase(case_repo, query_repo)
+
+        chunks = [chunk async for chunk in use_case.execute(CaseFilters(), chunk_size=2)]
+
+        assert chunks == [chunk1, chunk2]
+        query_repo.get_by_case_ids.assert_not_called()
+
+    async def test_export_with_queries_loads_one_batch_per_chunk(self):
+        """Debe cargar las queries de cada bloque en una sola consulta"""
+        case_repo = MagicMock()
+        query_repo = AsyncMock()
+        case1 = SupportCase(id=uuid4())
+        case2 = SupportCase(id=uuid4())
+        case_repo.iter_all = _iter_chunks([case1, case2])
+        query_repo.get_by_case_ids.return_value = [
+            CaseQuery(case_id=case1.id, query_text="SELECT 1"),
+            CaseQuery(case_id=case1.id, query_text="SELECT 2"),
+        ]
+
+        use_case = ExportCasesUseCase(case_repo, query_repo)
+
+        chunks = [
+            chunk async for chunk in use_case.execute(CaseFilters(), include_queries=True)
+        ]
+
+        assert [q.query_text for q in chunks[0][0].queries] == ["SELECT 1", "SELECT 2"]
+        assert chunks[0][1].queries == []
+        query_repo.get_by_case_ids.assert_called_once_with([case1.id, case2.id])
+
+    async def test_export_with_invalid_match_raises_before_streaming(self):
+        """Debe validar los filtros al llamar, antes de empezar a iterar"""
+        use_case = ExportCasesUseCase(MagicMock(), AsyncMock())
+
+        with pytest.raises(DomainValidationError):
+            use_case.execute(CaseFilters(search="x", match="regex"))
@@ -0,0 +1,50 @@
+import pytest
+from unittest.mock import MagicMock
+from app.application.use_cases.export_columnar import ExportColumnarUseCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.value_objects.case_filters import CaseFilters
+
+
+def _iter_rows(*chunks):
+    """Simula CaseRepository.iter_rows registrando sus argumentos"""
+    calls = []
+
+    async def iter_rows(filters, table, columns, chunk_size=1000):
+        calls.append((filters, table, columns, chunk_size))
+        for chunk in chunks:
+            yield chunk
+
+    return iter_rows, calls
+
+
+@pytest.mark.asyncio
+class TestExportColumnarUseCase:
+    async def test_export_yields_repository_row_batches(self):
+        """Debe entregar los bloques de filas del repositorio con las columnas pedidas"""
+        case_repo = MagicMock()
+        chunk1 = [{"id": 1}, {"id": 2}]
+        chunk2 = [{"id": 3}]
+        case_repo.iter_rows, calls = _iter_rows(chunk1, chunk2)
+        filters = CaseFilters(status="open")
+
+        use_case = ExportColumnarUseCase(case_repo)
+        batches = use_case.execute(filters, "support_cases", ["id"], batch_size=2)
+
+        assert [rows async for rows in batches] == [chunk1, chunk2]
+        assert calls == [(filters, "support_cases", ["id"], 2)]
+
+    async def test_export_validates_before_streaming(self):
+        """Debe rechazar tabla, modo de coincidencia o batch inválidos sin consultar"""
+        case_repo = MagicMock()
+        case_repo.iter_rows, calls = _iter_rows()
+        use_case = ExportColumnarUseCase(case_repo)
+
+        for filters, table, batch_size in (
+            (CaseFilters(), "users", 10),
+            (CaseFilters(match="regex"), "support_cases", 10),
+            (CaseFilters(), "case_queries", 0),
+        ):
+            with pytest.raises(DomainValidationError):
+                use_case.execute(filters, table, ["id"], batch_size=batch_size)
+
+        assert calls == []
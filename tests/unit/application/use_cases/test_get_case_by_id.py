@@ -7,6 +7,8 @@ from app.domain.entities.case import SupportCase, CaseQuery
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
 from app.domain.value_objects.case_status import CaseStatus
+from app.infrastructure.cache.case_detail_cache import LRUCaseDetailCache
+from app.infrastructure.cache.lru_cache import TTLLRUCache
 
 
 @pytest.mark.asyncio
@@ -15,7 +17,6 @@ class TestGetCaseByIdUseCase:
         """Debe obtener un caso por ID exitosamente"""
         # Mocks
         case_repo = AsyncMock()
-        query_repo = AsyncMock()
 
         # Caso de ejemplo
         case_id = uuid4()
@@ -55,12 +56,12 @@ class TestGetCaseByIdUseCase:
             executed_by="user@test.com",
         )
 
-        # Configurar mocks
-        case_repo.get_by_id.return_value = case
-        query_repo.get_by_case_id.return_value = [query1, query2]
+        # Configurar mocks: el repositorio trae el caso con sus queries
+        case.queries = [query1, query2]
+        case_repo.get_with_queries.return_value = case
 
         # Use case
-        use_case = GetCaseByIdUseCase(case_repo, query_repo)
+        use_case = GetCaseByIdUseCase(case_repo)
 
         # Ejecutar
         result = await use_case.execute(case_id)
@@ -72,35 +73,32 @@ class TestGetCaseByIdUseCase:
         assert len(result.queries) == 2
         assert result.queries[0].id == query1.id
         assert result.queries[1].id == query2.id
-        case_repo.get_by_id.assert_called_once_with(case_id)
-        query_repo.get_by_case_id.assert_called_once_with(case_id)
+        case_repo.get_with_queries.assert_called_once_with(case_id, None, None)
+        case_repo.get_by_id.assert_not_called()
 
     async def test_get_case_by_id_not_found(self):
         """Debe retornar None cuando el caso no existe"""
         # Mocks
         case_repo = AsyncMock()
-        query_repo = AsyncMock()
 
         # Configurar mocks para caso no encontrado
         case_id = uuid4()
-        case_repo.get_by_id.return_value = None
+        case_repo.get_with_queries.return_value = None
 
         # Use case
-        use_case = GetCaseByIdUseCase(case_repo, query_repo)
+        use_case = GetCaseByIdUseCase(case_repo)
 
         # Ejecutar
         result = await use_case.execute(case_id)
 
         # Verificar
         assert result is None
-        case_repo.get_by_id.assert_called_once_with(case_id)
-        query_repo.get_by_case_id.assert_not_called()
+        case_repo.get_with_queries.assert_called_once_with(case_id, None, None)
 
     async def test_get_case_by_id_without_queries(self):
         """Debe obtener un caso sin queries"""
         # Mocks
         case_repo = AsyncMock()
-        query_repo = AsyncMock()
 
         # Caso de ejemplo
         case_id = uuid4()
@@ -117,11 +115,10 @@ class TestGetCaseByIdUseCase:
         )
 
         # Configurar mocks (sin queries)
-        case_repo.get_by_id.return_value = case
-        query_repo.get_by_case_id.return_value = []
+        case_repo.get_with_queries.return_value = case
 
         # Use case
-        use_case = GetCaseByIdUseCase(case_repo, query_repo)
+        use_case = GetCaseByIdUseCase(case_repo)
 
         # Ejecutar
         result = await use_case.execute(case_id)
@@ -130,5 +127,124 @@ class TestGetCaseByIdUseCase:
         assert result is not None
         assert result.id == case_id
         assert len(result.queries) == 0
-        case_repo.get_by_id.assert_called_once_with(case_id)
-        query_repo.get_by_case_id.assert_called_once_with(case_id)
+        case_repo.get_with_queries.assert_called_once_with(case_id, None, None)
+
+    async def test_get_revision_does_not_load_queries(self):
+        """Debe obtener la revisión del caso sin cargar sus queries"""
+        case_repo = AsyncMock()
+        updated_at = datetime.utcnow()
+        case_repo.get_revision.return_value = (updated_at, 2)
+
+        use_case = GetCaseByIdUseCase(case_repo)
+        case_id = uuid4()
+
+        revision = await use_case.get_revision(case_id)
+
+        assert revision == (updated_at, 2)
+        case_repo.get_revision.assert_called_once_with(case_id)
+        case_repo.get_with_queries.assert_not_called()
+
+    async def test_get_case_by_id_reads_through_detail_cache(self):
+        """Debe leer de la DB solo la primera vez y luego servir desde el cache"""
+        case_repo = AsyncMock()
+        case = SupportCase(id=uuid4(), title="Cached", queries_count=0)
+        case_repo.get_with_queries.return_value = case
+        cache = LRUCaseDetailCache(TTLLRUCache(max_entries=10, ttl_seconds=60))
+
+        use_case = GetCaseByIdUseCase(case_repo, detail_cache=cache)
+        first = await use_case.execute(case.id)
+        second = await use_case.execute(case.id, revision=(case.updated_at, 0))
+
+        assert first.id == second.id == case.id
+        case_repo.get_with_queries.assert_called_once_with(case.id, None, None)
+        assert cache.stats().hits == 1
+
+    async def test_get_case_by_id_reloads_when_revision_changed(self):
+        """Debe descartar el caso cacheado si la revisión de la DB es otra"""
+        case_repo = AsyncMock()
+        case = SupportCase(id=uuid4(), title="Cached", queries_count=1)
+        case_repo.get_with_queries.return_value = case
+        cache = LRUCaseDetailCache(TTLLRUCache(max_entries=10, ttl_seconds=60))
+
+        use_case = GetCaseByIdUseCase(case_repo, detail_cache=cache)
+        await use_case.execute(case.id)
+        await use_case.execute(case.id, revision=(case.updated_at, 2))
+
+        assert case_repo.get_with_queries.await_count == 2
+        assert cache.stats().invalidations == 1
+
+    async def test_get_case_by_id_with_queries_limit_slices_cached_case(self):
+        """Con queries_limit debe recortar las queries del caso cacheado sin ir a la DB"""
+        case_repo = AsyncMock()
+        case = SupportCase(id=uuid4(), title="Cached", queries_count=3)
+        case.queries = [
+            CaseQuery.create(
+                case_id=case.id,
+                database_name="db",
+                schema_name="public",
+                query_text=f"SELECT {i}",
+                executed_by="test@example.com",
+            )
+            for i in range(3)
+        ]
+        case_repo.get_with_queries.return_value = case
+        cache = LRUCaseDetailCache(TTLLRUCache(max_entries=10, ttl_seconds=60))
+
+        use_case = GetCaseByIdUseCase(case_repo, detail_cache=cache)
+        await use_case.execute(case.id)
+        limited = await use_case.execute(case.id, queries_limit=2)
+        full = await use_case.execute(case.id)
+
+        assert [q.query_text for q in limited.queries] == ["SELECT 0", "SELECT 1"]
+        assert len(full.queries) == 3
+        case_repo.get_with_queries.assert_called_once_with(case.id, None, None)
+
+    async def test_get_case_by_id_does_not_cache_truncated_queries(self):
+        """No debe cachear un caso cuyas queries quedaron cortadas por queries_limit"""
+        case_repo = AsyncMock()
+        case = SupportCase(id=uuid4(), title="Large", queries_count=5)
+        case.queries = [
+            CaseQuery.create(
+                case_id=case.id,
+                database_name="db",
+                schema_name="public",
+                query_text="SELECT 1",
+                executed_by="test@example.com",
+            )
+        ]
+        case_repo.get_with_queries.return_value = case
+        cache = LRUCaseDetailCache(TTLLRUCache(max_entries=10, ttl_seconds=60))
+
+        use_case = GetCaseByIdUseCase(case_repo, detail_cache=cache)
+        await use_case.execute(case.id, queries_limit=1)
+
+        case_repo.get_with_queries.assert_called_once_with(case.id, 1, None)
+        assert cache.get(case.id) is None
+
+    async def test_get_case_by_id_preview_from_cache_and_not_cached_from_db(self):
+        """La vista previa debe salir del caso cacheado y no cachear textos recortados"""
+        case_repo = AsyncMock()
+        case = SupportCase(id=uuid4(), title="Preview", queries_count=1)
+        case.queries = [
+            CaseQuery.create(
+                case_id=case.id,
+                database_name="db",
+                schema_name="public",
+                query_text="SELECT * FROM big_table",
+                executed_by="test@example.com",
+            )
+        ]
+        case_repo.get_with_queries.return_value = case
+        cache = LRUCaseDetailCache(TTLLRUCache(max_entries=10, ttl_seconds=60))
+        use_case = GetCaseByIdUseCase(case_repo, detail_cache=cache)
+
+        await use_case.execute(case.id, preview_chars=6)
+        assert cache.get(case.id) is None
+
+        await use_case.execute(case.id)
+        preview = await use_case.execute(case.id, preview_chars=6)
+
+        assert preview.queries[0].query_text == "SELECT"
+        assert preview.queries[0].query_text_truncated is True
+        assert cache.get(case.id).queries[0].query_text == "SELECT * FROM big_table"
+        assert case_repo.get_with_queries.await_count == 2
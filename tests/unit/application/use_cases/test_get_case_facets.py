@@ -0,0 +1,33 @@
+import pytest
+from unittest.mock import AsyncMock
+from app.application.use_cases.get_case_facets import GetCaseFacetsUseCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import CaseFacets
+from app.domain.value_objects.case_filters import CaseFilters
+
+
+@pytest.mark.asyncio
+class TestGetCaseFacetsUseCase:
+    async def test_get_facets_passes_filters_to_repository(self):
+        """Debe delegar en el repositorio con los filtros recibidos"""
+        case_repo = AsyncMock()
+        case_repo.get_facets.return_value = CaseFacets(total=4, status={"open": 4})
+
+        use_case = GetCaseFacetsUseCase(case_repo)
+        filters = CaseFilters(status="open", search="timeout")
+
+        facets = await use_case.execute(filters)
+
+        assert facets.total == 4
+        case_repo.get_facets.assert_called_once_with(filters)
+
+    async def test_get_facets_with_invalid_match_raises_error(self):
+        """Debe rechazar modos de coincidencia desconocidos"""
+        case_repo = AsyncMock()
+
+        use_case = GetCaseFacetsUseCase(case_repo)
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(CaseFilters(search="lock", match="regex"))
+
+        case_repo.get_facets.assert_not_called()
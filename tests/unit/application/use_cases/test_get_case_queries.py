@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from app.application.use_cases.get_case_queries import (
+    GetCaseQueriesUseCase,
+    case_queries_fingerprint,
+    next_queries_cursor,
+)
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.query_repository import QueryPage
+from app.domain.value_objects.query_cursor import QueryCursor
+
+
+def _query(case_id, text, database_name="db"):
+    return CaseQuery.create(
+        case_id=case_id,
+        database_name=database_name,
+        schema_name="public",
+        query_text=text,
+        executed_by="test@example.com",
+    )
+
+
+@pytest.mark.asyncio
+class TestGetCaseQueriesUseCase:
+    async def test_returns_page_with_cursor_bound_to_case_and_filters(self):
+        """Debe devolver la página y un cursor atado al caso y a los filtros"""
+        case_id = uuid4()
+        queries = [_query(case_id, "SELECT 1"), _query(case_id, "SELECT 2")]
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+        query_repo.get_page.return_value = QueryPage(
+            items=queries, has_more=True, next_cursor=QueryCursor.after(queries[-1])
+        )
+
+        use_case = GetCaseQueriesUseCase(case_repo, query_repo)
+        result = await use_case.execute(case_id, limit=2, database_name="db")
+
+        assert [q.query_text for q in result.items] == ["SELECT 1", "SELECT 2"]
+        assert result.has_more is True
+        cursor = QueryCursor.decode(result.next_cursor)
+        assert cursor.id == queries[-1].id
+        assert cursor.filters == case_queries_fingerprint(case_id, database_name="db")
+        case_repo.get_revision.assert_not_called()
+
+    async def test_passes_decoded_cursor_to_repository(self):
+        """Debe pasar la posición del cursor al repositorio"""
+        case_id = uuid4()
+        last = _query(case_id, "SELECT 1")
+        token = QueryCursor.after(last, case_queries_fingerprint(case_id)).encode()
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+        query_repo.get_page.return_value = QueryPage(items=[_query(case_id, "SELECT 2")])
+
+        result = await GetCaseQueriesUseCase(case_repo, query_repo).execute(
+            case_id, limit=10, cursor=token
+        )
+
+        after = query_repo.get_page.call_args.kwargs["after"]
+        assert (after.executed_at, after.id) == (last.executed_at, last.id)
+        assert result.next_cursor is None
+
+    async def test_rejects_cursor_from_other_filters(self):
+        """No debe aceptar un cursor generado con otro caso o filtros"""
+        case_id = uuid4()
+        token = QueryCursor.after(
+            _query(case_id, "SELECT 1"), case_queries_fingerprint(case_id, executed_by="a@b.c")
+        ).encode()
+
+        use_case = GetCaseQueriesUseCase(AsyncMock(), AsyncMock())
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(case_id, cursor=token)
+
+    async def test_rejects_invalid_limit(self):
+        """Debe validar el tamaño de página"""
+        use_case = GetCaseQueriesUseCase(AsyncMock(), AsyncMock())
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(uuid4(), limit=0)
+
+    async def test_returns_none_for_missing_case(self):
+        """Debe retornar None si la página está vacía y el caso no existe"""
+        case_repo = AsyncMock()
+        case_repo.get_revision.return_value = None
+        query_repo = AsyncMock()
+        query_repo.get_page.return_value = QueryPage()
+
+        result = await GetCaseQueriesUseCase(case_repo, query_repo).execute(uuid4())
+
+        assert result is None
+
+    async def test_next_queries_cursor_for_truncated_detail(self):
+        """Debe generar el cursor de continuación solo si faltan queries"""
+        case = SupportCase(id=uuid4(), title="Large", queries_count=3)
+        case.queries = [_query(case.id, "SELECT 1")]
+
+        cursor = QueryCursor.decode(next_queries_cursor(case))
+
+        assert cursor.id == case.queries[0].id
+        assert cursor.filters == case_queries_fingerprint(case.id)
+        case.queries_count = 1
+        assert next_queries_cursor(case) is None
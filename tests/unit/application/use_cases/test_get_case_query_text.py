@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from app.application.use_cases.get_case_query_text import (
+    QUERY_TEXT_CHUNK_CHARS,
+    QUERY_TEXT_INLINE_MAX_BYTES,
+    GetCaseQueryTextUseCase,
+)
+from app.domain.repositories.query_repository import QueryText
+
+
+@pytest.mark.asyncio
+class TestGetCaseQueryTextUseCase:
+    async def test_returns_inline_text_with_size_limit(self):
+        """Debe pedir el texto al repositorio con el máximo para devolverlo en una lectura"""
+        case_id, query_id = uuid4(), uuid4()
+        query_repo = AsyncMock()
+        query_repo.get_text.return_value = QueryText(size_bytes=8, text="SELECT 1")
+
+        result = await GetCaseQueryTextUseCase(query_repo).execute(case_id, query_id)
+
+        assert result.text == "SELECT 1"
+        query_repo.get_text.assert_called_once_with(case_id, query_id, QUERY_TEXT_INLINE_MAX_BYTES)
+
+    async def test_returns_none_for_missing_query(self):
+        """Debe retornar None si la query no existe"""
+        query_repo = AsyncMock()
+        query_repo.get_text.return_value = None
+
+        assert await GetCaseQueryTextUseCase(query_repo).execute(uuid4(), uuid4()) is None
+
+    async def test_stream_reads_text_in_chunks(self):
+        """Debe recorrer el texto por partes de tamaño fijo"""
+        case_id, query_id = uuid4(), uuid4()
+
+        async def chunks():
+            yield "SELECT "
+            yield "1"
+
+        query_repo = MagicMock()
+        query_repo.iter_text.return_value = chunks()
+
+        use_case = GetCaseQueryTextUseCase(query_repo)
+        parts = [part async for part in use_case.stream(case_id, query_id)]
+
+        assert "".join(parts) == "SELECT 1"
+        query_repo.iter_text.assert_called_once_with(case_id, query_id, QUERY_TEXT_CHUNK_CHARS)
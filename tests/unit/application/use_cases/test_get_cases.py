@@ -1,9 +1,13 @@
 import pytest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock
 from uuid import uuid4
+from dataclasses import replace
 from datetime import datetime
 from app.application.use_cases.get_cases import GetCasesUseCase
-from app.domain.entities.case import SupportCase
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.repositories.case_repository import CasePage
+from app.domain.value_objects.case_cursor import CaseCursor, filters_fingerprint
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
 from app.domain.value_objects.case_status import CaseStatus
@@ -42,24 +46,25 @@ class TestGetCasesUseCase:
         )
 
         # Configurar mocks
-        case_repo.get_all.return_value = ([case1, case2], 2)
-        query_repo.get_by_case_id.return_value = []
+        case_repo.get_all.return_value = CasePage(items=[case1, case2], total=2)
 
         # Use case
         use_case = GetCasesUseCase(case_repo, query_repo)
 
         # Ejecutar
-        cases_with_count, total = await use_case.execute(page=1, page_size=10)
+        result = await use_case.execute(page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
-        assert len(cases_with_count) == 2
+        assert len(cases) == 2
         assert total == 2
-        assert cases_with_count[0][0].id == case1.id
-        assert cases_with_count[0][1] == 0  # queries_count
-        assert cases_with_count[1][0].id == case2.id
-        assert cases_with_count[1][1] == 0  # queries_count
+        assert cases[0].id == case1.id
+        assert cases[0].queries_count == 0
+        assert cases[1].id == case2.id
+        assert cases[1].queries_count == 0
         case_repo.get_all.assert_called_once()
-        assert query_repo.get_by_case_id.call_count == 2
+        # Sin consultas por caso (sin N+1)
+        query_repo.get_by_case_id.assert_not_called()
 
     async def test_get_cases_with_filters(self):
         """Debe obtener casos con filtros aplicados"""
@@ -81,14 +86,13 @@ class TestGetCasesUseCase:
         )
 
         # Configurar mocks
-        case_repo.get_all.return_value = ([case1], 1)
-        query_repo.get_by_case_id.return_value = []
+        case_repo.get_all.return_value = CasePage(items=[case1], total=1)
 
         # Use case
         use_case = GetCasesUseCase(case_repo, query_repo)
 
         # Ejecutar con filtros
-        cases_with_count, total = await use_case.execute(
+        result = await use_case.execute(
             status="open",
             priority="high",
             case_type="support",
@@ -97,11 +101,12 @@ class TestGetCasesUseCase:
             page=1,
             page_size=10,
         )
+        cases, total = result.items, result.total
 
         # Verificar
-        assert len(cases_with_count) == 1
+        assert len(cases) == 1
         assert total == 1
-        assert cases_with_count[0][0].id == case1.id
+        assert cases[0].id == case1.id
         case_repo.get_all.assert_called_once_with(
             status="open",
             priority="high",
@@ -114,6 +119,10 @@ class TestGetCasesUseCase:
             sort_order="desc",
             page=1,
             page_size=10,
+            cursor=None,
+            count_mode="exact",
+            match=None,
+            fields=None,
         )
 
     async def test_get_cases_with_queries_count(self):
@@ -133,22 +142,24 @@ class TestGetCasesUseCase:
             created_by="user1@test.com",
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            queries_count=3,
         )
 
         # Configurar mocks
-        case_repo.get_all.return_value = ([case1], 1)
-        # Simular 3 queries para el caso
-        query_repo.get_by_case_id.return_value = [Mock(), Mock(), Mock()]
+        case_repo.get_all.return_value = CasePage(items=[case1], total=1)
 
         # Use case
         use_case = GetCasesUseCase(case_repo, query_repo)
 
         # Ejecutar
-        cases_with_count, total = await use_case.execute(page=1, page_size=10)
+        result = await use_case.execute(page=1, page_size=10)
+        cases = result.items
 
         # Verificar
-        assert len(cases_with_count) == 1
-        assert cases_with_count[0][1] == 3  # queries_count debe ser 3
+        assert len(cases) == 1
+        assert cases[0].queries_count == 3  # queries_count debe ser 3
+        # El conteo viene desnormalizado: no se consulta case_queries
+        query_repo.get_by_case_ids.assert_not_called()
 
     async def test_get_cases_with_pagination(self):
         """Debe paginar correctamente"""
@@ -170,17 +181,17 @@ class TestGetCasesUseCase:
         )
 
         # Configurar mocks
-        case_repo.get_all.return_value = ([case1], 25)  # 25 total, página 2
-        query_repo.get_by_case_id.return_value = []
+        case_repo.get_all.return_value = CasePage(items=[case1], total=25)  # 25 total, página 2
 
         # Use case
         use_case = GetCasesUseCase(case_repo, query_repo)
 
         # Ejecutar página 2 con 10 elementos por página
-        cases_with_count, total = await use_case.execute(page=2, page_size=10)
+        result = await use_case.execute(page=2, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
-        assert len(cases_with_count) == 1
+        assert len(cases) == 1
         assert total == 25
         case_repo.get_all.assert_called_once_with(
             status=None,
@@ -194,6 +205,10 @@ class TestGetCasesUseCase:
             sort_order="desc",
             page=2,
             page_size=10,
+            cursor=None,
+            count_mode="exact",
+            match=None,
+            fields=None,
         )
 
     async def test_get_cases_empty_result(self):
@@ -203,15 +218,197 @@ class TestGetCasesUseCase:
         query_repo = AsyncMock()
 
         # Configurar mocks con resultado vacío
-        case_repo.get_all.return_value = ([], 0)
+        case_repo.get_all.return_value = CasePage(items=[], total=0)
 
         # Use case
         use_case = GetCasesUseCase(case_repo, query_repo)
 
         # Ejecutar
-        cases_with_count, total = await use_case.execute(page=1, page_size=10)
+        result = await use_case.execute(page=1, page_size=10)
+        cases, total = result.items, result.total
 
         # Verificar
-        assert len(cases_with_count) == 0
+        assert len(cases) == 0
         assert total == 0
         query_repo.get_by_case_id.assert_not_called()
+
+    async def test_get_cases_returns_next_cursor_when_has_more(self):
+        """Debe codificar el cursor del repositorio cuando hay más páginas"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+
+        case1 = SupportCase(
+            id=uuid4(),
+            title="Case 1",
+            case_type=CaseType.SUPPORT,
+            priority=CasePriority.HIGH,
+            status=CaseStatus.OPEN,
+            created_by="user1@test.com",
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+
+        repo_cursor = CaseCursor(
+            sort_by="created_at", sort_order="desc", value=case1.created_at, id=case1.id
+        )
+        case_repo.get_all.return_value = CasePage(
+            items=[case1], total=5, has_more=True, next_cursor=repo_cursor
+        )
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+
+        result = await use_case.execute(page_size=1)
+
+        assert result.has_more is True
+        assert CaseCursor.decode(result.next_cursor) == replace(
+            repo_cursor, filters=filters_fingerprint()
+        )
+
+    async def test_get_cases_with_cursor(self):
+        """Debe decodificar el cursor y pasarlo al repositorio"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+        case_repo.get_all.return_value = CasePage(items=[], total=0)
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+        token = CaseCursor(
+            sort_by="title",
+            sort_order="asc",
+            value="Case 1",
+            id=uuid4(),
+            filters=filters_fingerprint(status="open"),
+        ).encode()
+
+        result = await use_case.execute(
+            status="open", sort_by="title", sort_order="asc", cursor=token
+        )
+
+        assert result.next_cursor is None
+        passed_cursor = case_repo.get_all.call_args.kwargs["cursor"]
+        assert passed_cursor == CaseCursor.decode(token)
+
+    async def test_get_cases_with_cursor_for_other_sort_raises_error(self):
+        """Debe rechazar un cursor generado para otro orden"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+        token = CaseCursor(sort_by="title", sort_order="asc", value="Case 1", id=uuid4()).encode()
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(sort_by="created_at", sort_order="desc", cursor=token)
+
+        case_repo.get_all.assert_not_called()
+
+    async def test_get_cases_with_cursor_for_other_filters_raises_error(self):
+        """Debe rechazar un cursor generado con otros filtros"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+        token = CaseCursor(
+            sort_by="title",
+            sort_order="asc",
+            value="Case 1",
+            id=uuid4(),
+            filters=filters_fingerprint(status="open"),
+        ).encode()
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(
+                status="closed", sort_by="title", sort_order="asc", cursor=token
+            )
+
+        case_repo.get_all.assert_not_called()
+
+    async def test_get_cases_with_cursor_value_of_wrong_type_raises_error(self):
+        """Debe rechazar un cursor cuyo valor no corresponde al tipo del campo de orden"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+        for sort_by, value in (("queries_count", "3"), ("title", 7), ("relevance", True)):
+            token = CaseCursor(
+                sort_by=sort_by,
+                sort_order="desc",
+                value=value,
+                id=uuid4(),
+                filters=filters_fingerprint(search="x"),
+            ).encode()
+
+            with pytest.raises(DomainValidationError):
+                await use_case.execute(
+                    search="x", sort_by=sort_by, sort_order="desc", cursor=token
+                )
+
+        case_repo.get_all.assert_not_called()
+
+    async def test_get_cases_with_invalid_cursor_raises_error(self):
+        """Debe rechazar un cursor mal formado"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(cursor="not-a-cursor")
+
+    async def test_get_cases_sort_by_relevance_without_search(self):
+        """Debe ordenar por created_at si se pide relevance sin búsqueda"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+        case_repo.get_all.return_value = CasePage(items=[], total=0)
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+
+        await use_case.execute(sort_by="relevance")
+
+        assert case_repo.get_all.call_args.kwargs["sort_by"] == "created_at"
+
+    async def test_get_cases_with_invalid_match_raises_error(self):
+        """Debe rechazar modos de coincidencia desconocidos"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(search="lock", match="regex")
+
+        case_repo.get_all.assert_not_called()
+
+    async def test_get_cases_include_queries_loads_page_in_one_call(self):
+        """Con include=queries debe cargar las queries de la página en una consulta"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+        case1 = SupportCase(id=uuid4(), title="Case 1")
+        case2 = SupportCase(id=uuid4(), title="Case 2")
+        case_repo.get_all.return_value = CasePage(items=[case1, case2], total=2)
+        query_repo.get_by_case_ids.return_value = [
+            CaseQuery(case_id=case2.id, query_text="SELECT 1"),
+        ]
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+
+        result = await use_case.execute(fields=["title"], include=["queries"])
+
+        query_repo.get_by_case_ids.assert_called_once_with([case1.id, case2.id])
+        assert result.items[0].queries == []
+        assert [q.query_text for q in result.items[1].queries] == ["SELECT 1"]
+        assert case_repo.get_all.call_args.kwargs["fields"] == ["title"]
+
+    async def test_get_cases_with_unknown_field_or_include_raises_error(self):
+        """Debe rechazar campos o relaciones desconocidas"""
+        case_repo = AsyncMock()
+        query_repo = AsyncMock()
+
+        use_case = GetCasesUseCase(case_repo, query_repo)
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(fields=["title", "password"])
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(fields=[])
+        with pytest.raises(DomainValidationError):
+            await use_case.execute(include=["attachments"])
+
+        case_repo.get_all.assert_not_called()
@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from app.application.use_cases.get_cases_by_ids import MAX_BATCH_GET_IDS, GetCasesByIdsUseCase
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.domain.exceptions import DomainValidationError
+from app.domain.value_objects.case_type import CaseType
+from app.domain.value_objects.case_priority import CasePriority
+
+
+def _case(title):
+    return SupportCase.create(
+        title=title,
+        case_type=CaseType.SUPPORT,
+        priority=CasePriority.HIGH,
+        created_by="test@example.com",
+    )
+
+
+def _query(case_id, text):
+    return CaseQuery.create(
+        case_id=case_id,
+        database_name="db",
+        schema_name="public",
+        query_text=text,
+        executed_by="test@example.com",
+    )
+
+
+@pytest.mark.asyncio
+class TestGetCasesByIdsUseCase:
+    async def test_returns_cases_in_requested_order_with_queries_and_missing(self):
+        """Debe respetar el orden pedido, agrupar las queries y reportar faltantes"""
+        case1, case2 = _case("Case 1"), _case("Case 2")
+        missing_id = uuid4()
+        case_repo = AsyncMock()
+        case_repo.get_many.return_value = [case1, case2]
+        query_repo = AsyncMock()
+        query_repo.get_by_case_ids.return_value = [
+            _query(case1.id, "SELECT 1"),
+            _query(case1.id, "SELECT 2"),
+        ]
+
+        use_case = GetCasesByIdsUseCase(case_repo, query_repo)
+        result = await use_case.execute([case2.id, missing_id, case1.id, case2.id])
+
+        assert [case.id for case in result.items] == [case2.id, case1.id]
+        assert result.missing == [missing_id]
+        assert [q.query_text for q in result.items[1].queries] == ["SELECT 1", "SELECT 2"]
+        assert result.items[0].queries == []
+        case_repo.get_many.assert_called_once_with([case2.id, missing_id, case1.id])
+
+    async def test_skips_queries_lookup_when_nothing_found(self):
+        """No debe consultar queries si ningún caso existe"""
+        case_repo = AsyncMock()
+        case_repo.get_many.return_value = []
+        query_repo = AsyncMock()
+
+        result = await GetCasesByIdsUseCase(case_repo, query_repo).execute([uuid4()])
+
+        assert result.items == []
+        assert len(result.missing) == 1
+        query_repo.get_by_case_ids.assert_not_called()
+
+    async def test_rejects_empty_and_oversized_batches(self):
+        """Debe rechazar listas vacías o mayores al máximo"""
+        use_case = GetCasesByIdsUseCase(AsyncMock(), AsyncMock())
+
+        with pytest.raises(DomainValidationError):
+            await use_case.execute([])
+        with pytest.raises(DomainValidationError):
+            await use_case.execute([uuid4() for _ in range(MAX_BATCH_GET_IDS + 1)])
@@ -0,0 +1,120 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from uuid import uuid4
+from app.application.use_cases.bulk_create_cases import (
+    BulkCreateCasesResult,
+    BulkCreateItemResult,
+)
+from app.application.use_cases.ingest_cases import IngestCasesUseCase, IngestLine
+
+
+async def _lines(*lines):
+    for line in lines:
+        yield line
+
+
+class _FakeBulkCreate:
+    """Importación simulada: rechaza los títulos "malo" y registra la concurrencia"""
+
+    def __init__(self, tracker):
+        self._tracker = tracker
+
+    async def execute(self, items):
+        self._tracker["running"] += 1
+        self._tracker["max_running"] = max(self._tracker["max_running"], self._tracker["running"])
+        self._tracker["batches"].append([item["title"] for item in items])
+        await asyncio.sleep(0.01)
+        self._tracker["running"] -= 1
+        return BulkCreateCasesResult(
+            items=[
+                BulkCreateItemResult(index=index, error="rechazado")
+                if item["title"] == "malo"
+                else BulkCreateItemResult(index=index, id=uuid4())
+                for index, item in enumerate(items)
+            ]
+        )
+
+
+def _use_case(tracker, **kwargs):
+    return IngestCasesUseCase(lambda: _FakeBulkCreate(tracker), **kwargs)
+
+
+def _tracker():
+    return {"running": 0, "max_running": 0, "batches": []}
+
+
+@pytest.mark.asyncio
+class TestIngestCasesUseCase:
+    async def test_ingests_in_fixed_size_batches(self):
+        """Debe guardar por lotes de batch_size y contar creados y fallidos"""
+        tracker = _tracker()
+        lines = [IngestLine(line=i, item={"title": f"caso {i}"}) for i in range(1, 6)]
+
+        result = await _use_case(tracker, batch_size=2).execute(_lines(*lines))
+
+        assert sorted(tracker["batches"]) == [
+            ["caso 1", "caso 2"],
+            ["caso 3", "caso 4"],
+            ["caso 5"],
+        ]
+        assert (result.received, result.created, result.failed, result.batches) == (5, 5, 0, 3)
+
+    async def test_maps_errors_to_input_lines(self):
+        """Los rechazos de la entrada y del guardado deben reportarse por línea"""
+        tracker = _tracker()
+        lines = [
+            IngestLine(line=1, item={"title": "bueno"}),
+            IngestLine(line=2, error="JSON inválido"),
+            IngestLine(line=3, item={"title": "malo"}),
+            IngestLine(line=4, item={"title": "bueno"}),
+        ]
+
+        result = await _use_case(tracker, batch_size=2).execute(_lines(*lines))
+
+        assert (result.received, result.created, result.failed) == (4, 2, 2)
+        assert [(error.line, error.error) for error in result.errors] == [
+            (2, "JSON inválido"),
+            (3, "rechazado"),
+        ]
+        assert result.errors_truncated is False
+
+    async def test_limits_batches_in_flight(self):
+        """No debe haber más de max_in_flight lotes guardándose a la vez"""
+        tracker = _tracker()
+        lines = [IngestLine(line=i, item={"title": f"caso {i}"}) for i in range(1, 21)]
+
+        result = await _use_case(tracker, batch_size=2, max_in_flight=3).execute(_lines(*lines))
+
+        assert result.batches == 10
+        assert tracker["max_running"] == 3
+
+    async def test_caps_reported_errors(self):
+        """Solo los primeros max_errors errores deben quedar en detalle"""
+        lines = [IngestLine(line=i, error="inválido") for i in range(1, 11)]
+
+        result = await _use_case(_tracker(), max_errors=3).execute(_lines(*lines))
+
+        assert result.failed == 10
+        assert [error.line for error in result.errors] == [1, 2, 3]
+        assert result.errors_truncated is True
+
+    async def test_input_error_cancels_pending_batches(self):
+        """Si la entrada falla, los lotes en curso se cancelan y el error se propaga"""
+        bulk_create = MagicMock()
+        started = asyncio.Event()
+
+        async def never_finishes(items):
+            started.set()
+            await asyncio.sleep(60)
+
+        bulk_create.execute = never_finishes
+
+        async def failing_lines():
+            yield IngestLine(line=1, item={"title": "caso"})
+            await started.wait()
+            raise RuntimeError("conexión cortada")
+
+        use_case = IngestCasesUseCase(lambda: bulk_create, batch_size=1)
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(use_case.execute(failing_lines()), 1)
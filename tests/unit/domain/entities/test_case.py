@@ -1,5 +1,6 @@
 import pytest
-from app.domain.entities.case import SupportCase, CaseQuery
+from uuid import uuid4
+from app.domain.entities.case import SupportCase, CaseQuery, normalize_query_text
 from app.domain.value_objects.case_status import CaseStatus
 from app.domain.value_objects.case_type import CaseType
 from app.domain.value_objects.case_priority import CasePriority
@@ -147,3 +148,35 @@ class TestCaseQuery:
                 query_text="SELECT * FROM test",
                 executed_by="invalid-email",
             )
+
+    def test_query_preview_keeps_prefix_and_full_size(self):
+        """La vista previa debe cortar el texto e informar el tamaño completo en bytes"""
+        query = CaseQuery.create(
+            case_id=uuid4(),
+            database_name="db",
+            schema_name="public",
+            query_text="SELECT 'ñandú' FROM animales",
+            executed_by="test@example.com",
+        )
+
+        preview = query.preview(6)
+        untouched = query.preview(1000)
+
+        assert preview.query_text == "SELECT"
+        assert preview.query_text_bytes == len(query.query_text.encode("utf-8"))
+        assert preview.query_text_truncated is True
+        assert untouched.query_text_truncated is False
+        assert query.query_text_bytes is None and query.query_text_truncated is False
+
+    def test_query_text_is_normalized(self):
+        """El texto debe quedar sin espacios en los extremos y con fines de línea \\n"""
+        query = CaseQuery.create(
+            case_id=uuid4(),
+            database_name="db",
+            schema_name="public",
+            query_text="  SELECT *\r\nFROM pg_locks\rWHERE NOT granted \n",
+            executed_by="test@example.com",
+        )
+
+        assert query.query_text == "SELECT *\nFROM pg_locks\nWHERE NOT granted"
+        assert normalize_query_text(query.query_text) == query.query_text
@@ -0,0 +1,46 @@
+from app.domain.entities.case import CaseQuery, SupportCase
+from app.infrastructure.cache.case_detail_cache import LRUCaseDetailCache, estimate_case_size
+from app.infrastructure.cache.lru_cache import TTLLRUCache
+
+
+def _case(query_text: str = "SELECT 1", queries: int = 1) -> SupportCase:
+    case = SupportCase(title="Case")
+    case.queries = [
+        CaseQuery(case_id=case.id, query_text=query_text, executed_by="a@test.com")
+        for _ in range(queries)
+    ]
+    return case
+
+
+class TestLRUCaseDetailCache:
+    def test_returns_copies_of_cached_case(self):
+        """Reasignar las queries del caso devuelto no debe alterar el cache"""
+        cache = LRUCaseDetailCache(TTLLRUCache(max_entries=10, ttl_seconds=60))
+        case = _case()
+        cache.set(case, cache.generation())
+
+        cached = cache.get(case.id)
+        cached.queries.clear()
+
+        assert len(cache.get(case.id).queries) == 1
+
+    def test_skips_results_read_before_an_invalidation(self):
+        """Una lectura iniciada antes de una invalidación no debe quedar cacheada"""
+        cache = LRUCaseDetailCache(TTLLRUCache(max_entries=10, ttl_seconds=60))
+        case = _case()
+
+        generation = cache.generation()
+        cache.invalidate(case.id)  # escritura confirmada durante la lectura
+        cache.set(case, generation)
+
+        assert cache.get(case.id) is None
+
+    def test_estimated_size_grows_with_query_text(self):
+        """El tamaño estimado debe crecer con el texto y la cantidad de queries"""
+        small = estimate_case_size(_case("SELECT 1"))
+        large = estimate_case_size(_case("SELECT 1 " * 1000))
+        many = estimate_case_size(_case("SELECT 1", queries=10))
+
+        assert small < large
+        assert small < many
+        assert large - small >= 8000
@@ -0,0 +1,116 @@
+from app.infrastructure.cache.lru_cache import MISSING, TTLLRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLLRUCache:
+    def test_get_returns_cached_value_and_counts_hits(self):
+        """Debe retornar el valor guardado y contar aciertos y fallos"""
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=30)
+
+        assert cache.get("a") is MISSING
+        cache.set("a", (5, False))
+
+        assert cache.get("a") == (5, False)
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+        assert stats.hit_ratio == 0.5
+
+    def test_entries_expire_after_ttl(self):
+        """Debe descartar entradas vencidas"""
+        clock = FakeClock()
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=30, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 29.9
+        assert cache.get("a") == 1
+
+        clock.now = 30.0
+        assert cache.get("a") is MISSING
+        assert cache.stats().size == 0
+
+    def test_evicts_least_recently_used(self):
+        """Debe desalojar la entrada usada hace más tiempo al superar el máximo"""
+        cache = TTLLRUCache(max_entries=2, ttl_seconds=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" pasa a ser la menos usada
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_other_data_version_invalidates_entries(self):
+        """Debe invalidar las entradas escritas con una versión anterior"""
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=30)
+        cache.set("a", 1, version=1)
+
+        assert cache.get("a", version=2) is MISSING
+        assert cache.stats().invalidations == 1
+        cache.set("a", 2, version=2)
+        assert cache.get("a", version=2) == 2
+
+    def test_value_computed_before_a_bump_is_stored_stale(self):
+        """Un valor calculado antes de una escritura no debe quedar vigente"""
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=30)
+
+        captured = 1
+        # escritura confirmada mientras se calculaba el valor: la versión pasa a 2
+        cache.set("a", 1, captured)
+
+        assert cache.get("a", version=2) is MISSING
+
+    def test_zero_ttl_disables_cache(self):
+        """Con TTL 0 no debe guardar nada ni contar fallos"""
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is MISSING
+        stats = cache.stats()
+        assert stats.size == 0
+        assert stats.misses == 0
+
+    def test_evicts_by_estimated_bytes(self):
+        """Debe desalojar por bytes aunque quede lugar en entradas"""
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=30, max_bytes=100, size_of=len)
+        cache.set("a", "x" * 40)
+        cache.set("b", "x" * 40)
+        cache.set("c", "x" * 40)
+
+        assert cache.get("a") is MISSING
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.size == 2
+        assert stats.bytes == 80
+
+    def test_does_not_store_values_larger_than_max_bytes(self):
+        """Un valor más grande que el límite no debe desalojar todo el cache"""
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=30, max_bytes=100, size_of=len)
+        cache.set("a", "x" * 40)
+        cache.set("b", "x" * 200)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == "x" * 40
+        assert cache.stats().bytes == 40
+
+    def test_delete_releases_bytes(self):
+        """Debe descartar la entrada y liberar sus bytes"""
+        cache = TTLLRUCache(max_entries=10, ttl_seconds=30, max_bytes=100, size_of=len)
+        cache.set("a", "x" * 40)
+        cache.set("a", "x" * 10)
+        cache.delete("a")
+        cache.delete("missing")
+
+        stats = cache.stats()
+        assert stats.bytes == 0
+        assert stats.invalidations == 1
@@ -0,0 +1,46 @@
+import pytest
+from collections import OrderedDict
+from unittest.mock import AsyncMock
+from app.config import settings
+from app.infrastructure.database.connection import InstrumentedConnection
+from app.infrastructure.database.statement_stats import statement_stats
+
+
+def _connection():
+    """InstrumentedConnection sin socket: _prepare y fetch simulados"""
+    connection = InstrumentedConnection.__new__(InstrumentedConnection)
+    connection._prepared_shapes = OrderedDict()
+    connection._prepare = AsyncMock()
+    connection.fetch = AsyncMock(return_value=[])
+    return connection
+
+
+@pytest.mark.asyncio
+class TestInstrumentedConnection:
+    async def test_prepares_each_shape_once_per_connection(self):
+        """La segunda ejecución de una forma reutiliza la sentencia preparada"""
+        statement_stats.reset()
+        connection = _connection()
+
+        await connection.fetch_shape("list:all", "SELECT 1", 10)
+        await connection.fetch_shape("list:all", "SELECT 1", 20)
+
+        connection._prepare.assert_awaited_once_with("SELECT 1", use_cache=True)
+        assert connection.fetch.await_count == 2
+        stats = statement_stats.snapshot()["list:all"]
+        assert stats.prepares == 1
+        assert stats.executions == 2
+
+    async def test_evicts_least_recently_used_shape(self, monkeypatch):
+        """Con el cache lleno se descarta la forma menos usada y se vuelve a preparar"""
+        monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 2)
+        connection = _connection()
+
+        await connection.prepare_shape("a", "SELECT 'a'")
+        await connection.prepare_shape("b", "SELECT 'b'")
+        await connection.prepare_shape("a", "SELECT 'a'")
+        await connection.prepare_shape("c", "SELECT 'c'")
+
+        assert list(connection._prepared_shapes) == ["SELECT 'a'", "SELECT 'c'"]
+        await connection.prepare_shape("b", "SELECT 'b'")
+        assert connection._prepare.await_count == 4
@@ -0,0 +1,104 @@
+import itertools
+import re
+from datetime import datetime
+from app.domain.value_objects.case_cursor import CASE_SORT_FIELDS
+from app.infrastructure.database.query_builder import (
+    FILTER_FIELDS,
+    ListingShape,
+    compile_listing,
+    compile_where,
+    filter_mask,
+    filter_params,
+)
+
+# Valor de ejemplo por filtro (como los recibe get_all)
+FILTER_VALUES = {
+    "status": "open",
+    "priority": "high",
+    "case_type": "support",
+    "created_by": "ana@test.com",
+    "search": "timeout",
+    "date_gte": datetime(2024, 1, 1),
+    "date_lte": datetime(2024, 2, 1),
+}
+
+
+def _placeholders(sql: str) -> set:
+    return {int(n) for n in re.findall(r"\$(\d+)", sql)}
+
+
+def _all_filter_sets():
+    for size in range(len(FILTER_FIELDS) + 1):
+        for names in itertools.combinations(FILTER_FIELDS, size):
+            yield {name: FILTER_VALUES[name] for name in names}
+
+
+class TestQueryBuilder:
+    def test_filter_mask_ignores_empty_values(self):
+        """Solo los filtros con valor encienden su bit"""
+        assert filter_mask() == 0
+        assert filter_mask(status="open", priority=None, search="") == 0b1
+        assert filter_mask(case_type="support", date_lte=datetime(2024, 1, 1)) == 0b1000100
+
+    def test_filter_params_follow_filter_fields_order(self):
+        """Los parámetros salen en el orden de FILTER_FIELDS, sin importar los kwargs"""
+        params = filter_params(date_lte=1, search="x", status="open", match=None)
+        assert params == ["open", "x", 1]
+
+    def test_substring_match_escapes_like_pattern(self):
+        """Con match=substring created_by y search viajan como patrón ILIKE escapado"""
+        params = filter_params(created_by="a_b", search="50%", match="substring")
+        assert params == ["%a\\_b%", "%50\\%%"]
+
+    def test_placeholders_line_up_with_params_for_every_shape(self):
+        """Cada forma numera $1..$n exactamente con los parámetros que recibe"""
+        for filters, match, keyset in itertools.product(
+            _all_filter_sets(), (None, "substring", "fuzzy"), (False, True)
+        ):
+            sort_by = "relevance" if "search" in filters else "created_at"
+            shape = ListingShape.create(
+                filter_mask(**filters), match, sort_by, "desc", keyset=keyset
+            )
+            compiled = compile_listing(shape)
+            params = filter_params(**filters, match=match)
+            page_params = 3 if keyset else 2
+
+            assert compiled.filter_param_count == len(params)
+            assert _placeholders(compiled.count_sql) == set(range(1, len(params) + 1))
+            assert _placeholders(compiled.data_sql) == set(
+                range(1, len(params) + page_params + 1)
+            )
+
+    def test_compile_where_is_memoized_per_shape(self):
+        """La misma máscara y modo producen el mismo objeto (un texto por forma)"""
+        mask = filter_mask(status="open", search="x")
+        assert compile_where(mask, "fuzzy") is compile_where(mask, "fuzzy")
+        assert compile_where(mask, "fuzzy") != compile_where(mask, None)
+
+    def test_shape_create_normalizes_equivalent_inputs(self):
+        """Orden, match sin filtros de texto y orden de columnas se normalizan"""
+        status_mask = filter_mask(status="open")
+        a = ListingShape.create(status_mask, "fuzzy", "title", "desc", False, ["title", "status"])
+        b = ListingShape.create(status_mask, None, "title", "DESC", False, ["status", "title"])
+
+        assert a == b
+        assert a.fields == ("id", "title", "status")
+        assert compile_listing(a) is compile_listing(b)
+
+    def test_shape_names_are_distinct_and_stable(self):
+        """Cada combinación de orden, keyset y proyección tiene un nombre propio"""
+        names = set()
+        sort_fields = [f for f in CASE_SORT_FIELDS if f != "relevance"]
+        for sort_by, order, keyset, fields in itertools.product(
+            sort_fields, ("asc", "desc"), (False, True), (None, ("title",))
+        ):
+            shape = ListingShape.create(0, None, sort_by, order, keyset, fields)
+            names.add(shape.name)
+            assert compile_listing(shape).data_sql == compile_listing(
+                ListingShape.create(0, None, sort_by, order, keyset, fields)
+            ).data_sql
+
+        assert len(names) == len(sort_fields) * 2 * 2 * 2
+        shape = ListingShape.create(filter_mask(search="x"), "fuzzy", "relevance", "desc", True)
+        assert shape.name == "list:search~fuzzy|relevance:desc|keyset"
+        assert shape.count_name == "count:search~fuzzy"
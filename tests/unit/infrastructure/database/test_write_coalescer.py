@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from app.domain.entities.case import SupportCase
+from app.domain.value_objects.case_type import CaseType
+from app.domain.value_objects.case_priority import CasePriority
+from app.infrastructure.database.write_coalescer import GroupCommitCaseWriter
+
+
+def _case(title: str) -> SupportCase:
+    return SupportCase.create(
+        title=title,
+        case_type=CaseType.SUPPORT,
+        priority=CasePriority.LOW,
+        created_by="test@example.com",
+    )
+
+
+@pytest.mark.asyncio
+class TestGroupCommitCaseWriter:
+    async def test_concurrent_submits_are_written_in_one_batch(self):
+        """Las altas que llegan dentro de la ventana deben escribirse juntas"""
+        case_repo = AsyncMock()
+        writer = GroupCommitCaseWriter(case_repo, window_seconds=0.01, max_batch=100)
+        cases = [_case(f"Caso {i}") for i in range(5)]
+
+        await asyncio.gather(*(writer.submit(case) for case in cases))
+
+        case_repo.create_many_with_queries.assert_awaited_once_with(cases)
+        stats = writer.stats()
+        assert (stats.batches, stats.cases, stats.largest_batch) == (1, 5, 5)
+
+    async def test_full_batch_is_written_without_waiting_for_the_window(self):
+        """Al completar max_batch el lote debe escribirse sin esperar la ventana"""
+        case_repo = AsyncMock()
+        writer = GroupCommitCaseWriter(case_repo, window_seconds=60, max_batch=2)
+        cases = [_case(f"Caso {i}") for i in range(4)]
+
+        await asyncio.wait_for(asyncio.gather(*(writer.submit(case) for case in cases)), 1)
+
+        assert [call.args[0] for call in case_repo.create_many_with_queries.await_args_list] == [
+            cases[:2],
+            cases[2:],
+        ]
+
+    async def test_failed_batch_is_retried_case_by_case(self):
+        """Si el lote falla, solo el caso rechazado debe recibir el error"""
+        good, bad = _case("Bueno"), _case("Malo")
+
+        async def create_many(cases):
+            if bad in cases:
+                raise ValueError("rechazado")
+
+        case_repo = AsyncMock()
+        case_repo.create_many_with_queries.side_effect = create_many
+        writer = GroupCommitCaseWriter(case_repo, window_seconds=0.01, max_batch=100)
+
+        results = await asyncio.gather(
+            writer.submit(good), writer.submit(bad), return_exceptions=True
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], ValueError)
+        assert case_repo.create_many_with_queries.await_count == 3
+        assert writer.stats().failed_batches == 1
+
+    async def test_close_writes_pending_cases(self):
+        """Al cerrar debe escribirse lo pendiente sin esperar la ventana"""
+        case_repo = AsyncMock()
+        writer = GroupCommitCaseWriter(case_repo, window_seconds=60, max_batch=100)
+        case = _case("Pendiente")
+
+        submit = asyncio.ensure_future(writer.submit(case))
+        await asyncio.sleep(0)
+        await writer.close()
+
+        await asyncio.wait_for(submit, 1)
+        case_repo.create_many_with_queries.assert_awaited_once_with([case])